@@ -1,29 +1,88 @@
 # 로컬 개발/테스트용 실행 진입점
 from __future__ import annotations
 
+import argparse
+import importlib
 import sys
 from pathlib import Path
+from typing import Any
+
+from langchain_core.messages import AIMessageChunk, HumanMessage
 
 _root = Path(__file__).parent
-sys.path.insert(0, str(_root / "src" / "workflows" / "v1_0"))
-sys.path.insert(0, str(_root))
+# 기본 실행은 v1_0 워크플로우를 사용한다. 토큰 스트리밍은 final_response 스트리밍을 구현한 v1_1에서만 동작한다.
+_DEFAULT_WORKFLOW = "v1_0"
+_STREAMING_WORKFLOW = "v1_1"
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="multi-agent workflow 로컬 실행")
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help=f"{_STREAMING_WORKFLOW} 워크플로우로 실행하고 최종 응답 토큰을 생성되는 대로 출력한다",
+    )
+    return parser.parse_args()
+
+
+def _load_graph(workflow: str) -> Any:
+    sys.path.insert(0, str(_root / "src" / "workflows" / workflow))
+    sys.path.insert(0, str(_root))
+    return importlib.import_module("workflow").graph
 
-from langchain_core.messages import HumanMessage
 
-from workflow import graph
+_SESSION_ID = "local-test"
+# checkpointer가 설정된 워크플로우는 thread_id 단위로 세션 state를 이어간다 (없으면 무시된다).
+_CONFIG = {"configurable": {"thread_id": _SESSION_ID}}
+
+
+def _stream(graph: Any, initial_state: dict) -> dict:
+    """stream_mode="messages"로 final_response 노드의 토큰을 실시간 출력하고 최종 state를 반환한다."""
+    result: dict = {}
+    streamed = False
+    print("\n[응답]")
+    for mode, payload in graph.stream(
+        initial_state, _CONFIG, stream_mode=["messages", "values"]
+    ):
+        if mode == "values":
+            result = payload
+            continue
+        chunk, metadata = payload
+        if (
+            metadata.get("langgraph_node") == "final_response"
+            and isinstance(chunk, AIMessageChunk)
+            and chunk.content
+        ):
+            print(chunk.content, end="", flush=True)
+            streamed = True
+
+    if not streamed:
+        # 캐시 적중 등으로 토큰이 흘러오지 않은 경우 완성된 응답을 출력한다.
+        final_messages = result.get("messages", [])
+        print(final_messages[-1].content if final_messages else "[응답 없음]", end="")
+    print()
+    return result
 
 
 def main() -> None:
+    args = _parse_args()
+    graph = _load_graph(_STREAMING_WORKFLOW if args.stream else _DEFAULT_WORKFLOW)
     user_input = input("질문을 입력하세요: ")
 
-    result = graph.invoke({
+    initial_state = {
         "messages": [HumanMessage(content=user_input)],
         "intent": "",
         "agent_output": "",
         "context": [],
-        "metadata": {"session_id": "local-test"},
+        "metadata": {"session_id": _SESSION_ID},
         "error": None,
-    })
+    }
+
+    if args.stream:
+        _stream(graph, initial_state)
+        return
+
+    result = graph.invoke(initial_state, _CONFIG)
 
     final_messages = result.get("messages", [])
     if final_messages:
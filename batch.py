@@ -0,0 +1,79 @@
+# JSONL 질문 목록 일괄 실행 진입점 (src/workflows/v1_1/batch_runner.py)
+#   python batch.py --input questions.jsonl --output results.jsonl --workers 32
+from __future__ import annotations
+
+import argparse
+import contextlib
+import sys
+from pathlib import Path
+
+_root = Path(__file__).parent
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="JSONL 질문 목록을 multi-agent workflow로 일괄 처리")
+    parser.add_argument("--input", required=True, help="입력 JSONL 경로 (- 이면 stdin)")
+    parser.add_argument("--output", default="-", help="결과 JSONL 경로 (기본값: stdout)")
+    parser.add_argument("--workers", type=int, default=None, help="동시 세션 수 (기본값: settings.batch_workers)")
+    parser.add_argument("--question-key", default="question", help="질문 필드 이름 (기본값: question)")
+    parser.add_argument("--id-key", default="id", help="식별자 필드 이름 (기본값: id)")
+    parser.add_argument(
+        "--intent-batch-size",
+        type=int,
+        default=None,
+        help="intent 분류 LLM 호출 한 번에 묶을 최대 질문 수 (1이면 묶지 않음, 기본값: settings.intent_llm_batch_max_size)",
+    )
+    args = parser.parse_args()
+
+    from config.settings import get_settings
+
+    settings = get_settings()
+    batch_size = args.intent_batch_size or settings.intent_llm_batch_max_size
+    if settings.intent_output_mode == "constrained" and batch_size > 1:
+        # constrained 출력은 질문 하나에 대한 enum schema라 batch 분류와 함께 쓸 수 없다.
+        parser.error(
+            f"intent_output_mode=constrained에서는 intent batch를 쓸 수 없습니다 "
+            f"(batch 크기 {batch_size}). --intent-batch-size 1로 실행하세요."
+        )
+    return args
+
+
+def _setup_path() -> None:
+    sys.path.insert(0, str(_root / "src" / "workflows" / "v1_1"))
+    sys.path.insert(0, str(_root))
+
+
+def main() -> None:
+    _setup_path()
+    args = _parse_args()
+    # 로그는 core/logging.py 설정에 따라 stderr(또는 log_file_path)로 나가므로 결과 JSONL을 stdout으로 내보낼 수 있다.
+    from batch_runner import run_batch
+
+    with contextlib.ExitStack() as stack:
+        source = (
+            sys.stdin
+            if args.input == "-"
+            else stack.enter_context(open(args.input, encoding="utf-8"))
+        )
+        sink = (
+            sys.stdout
+            if args.output == "-"
+            else stack.enter_context(open(args.output, "w", encoding="utf-8"))
+        )
+        summary = run_batch(
+            source,
+            sink,
+            workers=args.workers,
+            question_key=args.question_key,
+            id_key=args.id_key,
+            intent_batch_size=args.intent_batch_size,
+        )
+    print(
+        f"[완료] {summary.total}건 (실패 {summary.failed}건), "
+        f"{summary.elapsed_seconds:.1f}초, {summary.throughput:.1f}건/초",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
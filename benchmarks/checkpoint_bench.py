@@ -0,0 +1,168 @@
+# checkpointer 벤치마크 — 50턴 세션에서 checkpoint당 저장 바이트와 턴당 checkpoint 쓰기 지연을 측정한다
+# LLM은 FakeListChatModel로 대체하므로 네트워크 없이 실행된다.
+#   python benchmarks/checkpoint_bench.py --turns 50
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+_root = Path(__file__).resolve().parent.parent
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="checkpointer 저장 크기/쓰기 지연 측정")
+    parser.add_argument("--turns", type=int, default=50)
+    parser.add_argument("--answer-chars", type=int, default=600, help="턴당 응답 길이")
+    return parser.parse_args()
+
+
+_args = _parse_args()
+sys.path.insert(0, str(_root / "src" / "workflows" / "v1_1"))
+
+import structlog
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import HumanMessage
+from langgraph.checkpoint.base import BaseCheckpointSaver, SerializerProtocol
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from core.checkpoint import SQLiteCheckpointSaver, ZstdMsgpackSerializer, session_config
+from workflow import build_graph
+
+structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+
+class _CountingSerializer(SerializerProtocol):
+    """dumps_typed 결과 크기를 누적한다 — saver가 실제로 기록하는 바이트 수."""
+
+    def __init__(self, inner: SerializerProtocol) -> None:
+        self.inner = inner
+        self.bytes = 0
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        type_, data = self.inner.dumps_typed(obj)
+        self.bytes += len(data)
+        return type_, data
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        return self.inner.loads_typed(data)
+
+
+class _Probe:
+    """saver의 put/put_writes를 감싸 checkpoint 수, 기록 바이트, 쓰기 시간을 잰다."""
+
+    def __init__(self, saver: BaseCheckpointSaver, serde: _CountingSerializer) -> None:
+        self.serde = serde
+        self.checkpoints = 0
+        self.full_snapshot_bytes = 0
+        self.write_seconds = 0.0
+        put, put_writes = saver.put, saver.put_writes
+
+        def timed_put(config, checkpoint, metadata, new_versions):
+            started = time.perf_counter()
+            try:
+                return put(config, checkpoint, metadata, new_versions)
+            finally:
+                self.write_seconds += time.perf_counter() - started
+                self.checkpoints += 1
+                # 비교 기준: 매 super-step 전체 state를 압축 없이 저장할 때의 크기
+                self.full_snapshot_bytes += len(
+                    JsonPlusSerializer().dumps_typed(checkpoint)[1]
+                )
+
+        def timed_put_writes(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return put_writes(*args, **kwargs)
+            finally:
+                self.write_seconds += time.perf_counter() - started
+
+        saver.put = timed_put  # type: ignore[method-assign]
+        saver.put_writes = timed_put_writes  # type: ignore[method-assign]
+
+
+def _run(
+    name: str, saver_factory, serde: SerializerProtocol, answers: list[str]
+) -> None:
+    counting = _CountingSerializer(serde)
+    saver = saver_factory(counting)
+    probe = _Probe(saver, counting)
+    turns = len(answers)
+    fake_llm = FakeListChatModel(
+        responses=[r for answer in answers for r in ("UNKNOWN", answer, answer)]
+    )
+    config = session_config(f"bench-{name}")
+
+    latencies: list[float] = []
+    with patch("core.llm.get_llm", return_value=fake_llm):
+        graph = build_graph(saver)
+        for i in range(turns):
+            before = probe.write_seconds
+            graph.invoke(
+                {
+                    "messages": [HumanMessage(content=f"{i}번째 질문입니다. 이전 답변을 참고해 주세요")],
+                    "intent": "",
+                    "agent_output": "",
+                    "context": [],
+                    "metadata": {"session_id": config["configurable"]["thread_id"]},
+                    "error": None,
+                },
+                config,
+            )
+            latencies.append((probe.write_seconds - before) * 1000)
+
+    latencies.sort()
+    print(
+        f"{name:<22} checkpoints={probe.checkpoints:<4}"
+        f" bytes/checkpoint={counting.bytes / probe.checkpoints:>8.0f}"
+        f" (full snapshot {probe.full_snapshot_bytes / probe.checkpoints:>7.0f})"
+        f"  write ms/turn p50={statistics.median(latencies):.2f}"
+        f" p95={latencies[int(len(latencies) * 0.95) - 1]:.2f}"
+        f" max={latencies[-1]:.2f}"
+    )
+
+
+_WORDS = (
+    "고객 주문 배송 환불 상품 결제 계정 설정 변경 확인 요청 처리 완료 오류 안내 정책 기간 "
+    "영업일 이내 가능 불가 재시도 문의 담당자 연결 조회 결과 이력 최근 다음 단계 필요 정보"
+).split()
+
+
+def main() -> None:
+    # 반복 문장은 zstd 압축률을 과장하므로 턴마다 다른 seed 고정 난수 단어열을 응답으로 쓴다.
+    rng = random.Random(0)
+    answers = [
+        " ".join(rng.choice(_WORDS) for _ in range(_args.answer_chars))[: _args.answer_chars]
+        for _ in range(_args.turns)
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        cases = [
+            ("memory/msgpack", lambda s: InMemorySaver(serde=s), JsonPlusSerializer()),
+            ("memory/msgpack+zstd", lambda s: InMemorySaver(serde=s), ZstdMsgpackSerializer()),
+            (
+                "sqlite/msgpack",
+                lambda s: SQLiteCheckpointSaver(f"{tmp}/plain.sqlite3", serde=s),
+                JsonPlusSerializer(),
+            ),
+            (
+                "sqlite/msgpack+zstd",
+                lambda s: SQLiteCheckpointSaver(f"{tmp}/zstd.sqlite3", serde=s),
+                ZstdMsgpackSerializer(),
+            ),
+        ]
+        print(f"turns={_args.turns} answer_chars={_args.answer_chars}")
+        for name, factory, serde in cases:
+            _run(name, factory, serde, answers)
+
+
+if __name__ == "__main__":
+    main()
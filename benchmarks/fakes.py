@@ -0,0 +1,167 @@
+# 벤치마크용 fake 의존성 — 지연 분포를 흉내 내는 chat model / retriever / MCP tool
+# 외부 호출 없이 seed 고정 난수로 동작하므로 그래프·executor·로깅·state 복사 비용만 따로 측정할 수 있다.
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Iterator
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+_Z99 = 2.326  # 표준정규분포 99 분위수
+
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    """지연 분포(ms). median만 주면 고정 지연, p99까지 주면 log-normal 분포로 뽑는다."""
+
+    median_ms: float = 0.0
+    p99_ms: float | None = None
+
+    def sample(self, rng: random.Random) -> float:
+        """지연 시간(초)을 하나 뽑는다."""
+        if self.median_ms <= 0:
+            return 0.0
+        if self.p99_ms is None or self.p99_ms <= self.median_ms:
+            return self.median_ms / 1000
+        sigma = math.log(self.p99_ms / self.median_ms) / _Z99
+        return rng.lognormvariate(math.log(self.median_ms), sigma) / 1000
+
+
+class _Sampler:
+    """여러 스레드/코루틴에서 공유하는 seed 고정 난수원."""
+
+    def __init__(self, seed: int) -> None:
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def __call__(self, profile: LatencyProfile) -> float:
+        with self._lock:
+            return profile.sample(self._rng)
+
+
+class FakeChatModel(BaseChatModel):
+    """respond(messages)가 돌려준 텍스트를 지연 프로필에 맞춰 응답하는 chat model.
+
+    첫 token까지 first_token 지연, 이후 token마다 per_token 지연을 둔다.
+    stream/astream은 공백 단위 token을 chunk로 흘려보낸다.
+    """
+
+    respond: Callable[[list[BaseMessage]], str]
+    first_token: LatencyProfile = LatencyProfile()
+    per_token: LatencyProfile = LatencyProfile()
+    seed: int = 0
+    calls: int = 0
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    def model_post_init(self, __context: Any) -> None:
+        self._sampler = _Sampler(self.seed)
+        self._count_lock = threading.Lock()
+
+    @property
+    def _llm_type(self) -> str:
+        return "benchmark-fake"
+
+    def _tokens(self, messages: list[BaseMessage]) -> list[str]:
+        with self._count_lock:
+            self.calls += 1
+        text = self.respond(messages)
+        words = text.split(" ")
+        return [w if i == len(words) - 1 else w + " " for i, w in enumerate(words)]
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        tokens = self._tokens(messages)
+        delay = self._sampler(self.first_token) + sum(
+            self._sampler(self.per_token) for _ in tokens[1:]
+        )
+        if delay:
+            time.sleep(delay)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content="".join(tokens)))])
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        tokens = self._tokens(messages)
+        delay = self._sampler(self.first_token) + sum(
+            self._sampler(self.per_token) for _ in tokens[1:]
+        )
+        if delay:
+            await asyncio.sleep(delay)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content="".join(tokens)))])
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs) -> Iterator[ChatGenerationChunk]:
+        for i, token in enumerate(self._tokens(messages)):
+            delay = self._sampler(self.first_token if i == 0 else self.per_token)
+            if delay:
+                time.sleep(delay)
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=token))
+            if run_manager:
+                run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+
+    async def _astream(
+        self, messages, stop=None, run_manager=None, **kwargs
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        for i, token in enumerate(self._tokens(messages)):
+            delay = self._sampler(self.first_token if i == 0 else self.per_token)
+            if delay:
+                await asyncio.sleep(delay)
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=token))
+            if run_manager:
+                await run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+
+
+class FakeRetriever:
+    """지연 후 고정 문서 num_docs개를 돌려준다. 실제 retriever 클래스의 retrieve/aretrieve를 대체한다."""
+
+    def __init__(self, name: str, latency: LatencyProfile, num_docs: int = 3, seed: int = 0) -> None:
+        self._name = name
+        self._latency = latency
+        self._num_docs = num_docs
+        self._sampler = _Sampler(seed)
+
+    def _documents(self, query: str) -> list[Any]:
+        from rag.base_retriever import Document
+
+        return [
+            Document(
+                page_content=f"[{self._name}] '{query}' 관련 문서 {i}: " + "본문 " * 40,
+                metadata={"score": 1.0 - i * 0.1},
+            )
+            for i in range(self._num_docs)
+        ]
+
+    def retrieve(self, query: str) -> list[Any]:
+        if delay := self._sampler(self._latency):
+            time.sleep(delay)
+        return self._documents(query)
+
+    async def aretrieve(self, query: str) -> list[Any]:
+        if delay := self._sampler(self._latency):
+            await asyncio.sleep(delay)
+        return self._documents(query)
+
+
+class FakeTool:
+    """지연 후 고정 결과를 돌려준다. 실제 MCP tool 클래스의 call/acall을 대체한다."""
+
+    def __init__(self, name: str, latency: LatencyProfile, seed: int = 0) -> None:
+        self._name = name
+        self._latency = latency
+        self._sampler = _Sampler(seed)
+
+    def call(self, args: dict[str, Any]) -> dict[str, Any]:
+        if delay := self._sampler(self._latency):
+            time.sleep(delay)
+        return {"tool": self._name, "query": args.get("query", ""), "results": ["결과"] * 3}
+
+    async def acall(self, args: dict[str, Any]) -> dict[str, Any]:
+        if delay := self._sampler(self._latency):
+            await asyncio.sleep(delay)
+        return {"tool": self._name, "query": args.get("query", ""), "results": ["결과"] * 3}
@@ -0,0 +1,452 @@
+# 전체 그래프 벤치마크 — fake LLM/retriever/MCP tool로 워크플로우 자체의 오버헤드와 처리량을 측정한다
+# - end-to-end / 노드별 지연 p50·p95·p99, 동시성별 처리량, 세션당 메모리(tracemalloc peak)
+# - 워크플로우 버전마다 모듈 이름이 같으므로 버전별로 별도 프로세스에서 실행한다.
+# - 버전마다 --repeats번 번갈아 실행하고 지표별 중앙값을 쓴다. 회귀 판정은 절대값이 아니라 v1_0 대비 비율
+#   (v1_1 / v1_0)을 --baseline의 같은 비율과 비교해, 실행 머신 속도나 일시적인 부하의 영향을 줄인다.
+#   tolerance 이상 나빠진 지표가 있으면 exit code 1로 종료한다. p99는 반복당 표본이 적어 보고만 한다.
+#   python benchmarks/graph_bench.py                          # v1_0, v1_1 측정 후 baseline 비교
+#   python benchmarks/graph_bench.py --profile realistic --concurrency 1,16,64
+#   python benchmarks/graph_bench.py --update-baseline        # 현재 결과를 baseline으로 저장
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+_root = Path(__file__).resolve().parent.parent
+_here = Path(__file__).resolve().parent
+WORKFLOWS = ("v1_0", "v1_1")
+REFERENCE_WORKFLOW = "v1_0"  # 회귀 판정의 비율 기준
+GATED_LATENCY = ("p50", "p95")
+DEFAULT_BASELINE = _here / "baseline.json"
+
+# 지연 프로필 — overhead: 모든 외부 호출 0ms (순수 프레임워크 비용), realistic: 운영 환경 근사치
+PROFILES: dict[str, dict[str, tuple[float, float | None]]] = {
+    "overhead": {
+        "llm_first_token": (0.0, None),
+        "llm_per_token": (0.0, None),
+        "retriever": (0.0, None),
+        "tool": (0.0, None),
+    },
+    "realistic": {
+        "llm_first_token": (250.0, 1200.0),
+        "llm_per_token": (8.0, 25.0),
+        "retriever": (40.0, 150.0),
+        "tool": (80.0, 400.0),
+    },
+}
+
+QUESTIONS = (
+    "[A] 지난주 주문한 상품의 배송 상태를 알려주세요",
+    "[B] 첨부한 회의록을 세 줄로 정리해 주세요",
+    "오늘 점심 메뉴 추천해 줄래?",
+)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="fake 의존성으로 전체 그래프 성능 측정")
+    parser.add_argument("--workflow", default="all", help="v1_0 | v1_1 | all (기본값: all)")
+    parser.add_argument("--profile", default="overhead", choices=sorted(PROFILES))
+    parser.add_argument("--requests", type=int, default=300, help="측정 단계별 요청 수")
+    parser.add_argument("--concurrency", default="1,8,32", help="처리량을 측정할 동시성 목록")
+    parser.add_argument("--answer-tokens", type=int, default=60, help="LLM 응답 token 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeats", type=int, default=5, help="버전별 반복 실행 횟수 (중앙값 사용)")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    parser.add_argument("--tolerance", type=float, default=0.3, help="허용 악화 비율 (0.3 = 30%%)")
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=2.0,
+        help="이 값보다 작은 지연 증가는 측정 잡음으로 보고 회귀로 판정하지 않는다",
+    )
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON 한 줄로 출력 (내부용)")
+    return parser.parse_args()
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    """초 단위 샘플의 p50/p95/p99(ms)."""
+    if not samples:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+    if len(samples) == 1:
+        return {key: round(samples[0] * 1000, 3) for key in ("p50", "p95", "p99")}
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "p50": round(statistics.median(samples) * 1000, 3),
+        "p95": round(cuts[94] * 1000, 3),
+        "p99": round(cuts[98] * 1000, 3),
+    }
+
+
+# ── 단일 워크플로우 측정 (워크플로우 폴더가 sys.path에 올라간 프로세스에서 실행) ──────────
+
+
+def _respond_factory(answer_tokens: int):
+    answer = " ".join(f"답변{i}" for i in range(answer_tokens))
+
+    def respond(messages) -> str:
+        prompt = messages[-1].content
+        if "intent를 하나만" in prompt:
+            if "[A]" in prompt:
+                return "INTENT_A"
+            if "[B]" in prompt:
+                return "INTENT_B"
+            return "UNKNOWN"
+        return answer
+
+    return respond
+
+
+def _node_timer():
+    from langchain_core.callbacks import BaseCallbackHandler
+
+    class NodeTimer(BaseCallbackHandler):
+        """LangGraph 노드 run의 시작/종료 시각으로 노드별 소요 시간을 모은다."""
+
+        run_inline = True
+
+        def __init__(self) -> None:
+            self.samples: dict[str, list[float]] = defaultdict(list)
+            self._starts: dict[Any, tuple[str, float]] = {}
+            self._lock = threading.Lock()
+
+        def on_chain_start(self, serialized, inputs, *, run_id, metadata=None, **kwargs) -> None:
+            node = (metadata or {}).get("langgraph_node")
+            if node and kwargs.get("name") == node:
+                with self._lock:
+                    self._starts[run_id] = (node, time.perf_counter())
+
+        def on_chain_end(self, outputs, *, run_id, **kwargs) -> None:
+            self._finish(run_id)
+
+        def on_chain_error(self, error, *, run_id, **kwargs) -> None:
+            self._finish(run_id)
+
+        def _finish(self, run_id) -> None:
+            with self._lock:
+                started = self._starts.pop(run_id, None)
+                if started is not None:
+                    node, at = started
+                    self.samples[node].append(time.perf_counter() - at)
+
+    return NodeTimer()
+
+
+def _patch_dependencies(stack: ExitStack, args: argparse.Namespace):
+    from fakes import FakeChatModel, FakeRetriever, FakeTool, LatencyProfile
+    from mcp.tool.search_tool import SearchTool
+    from mcp.tool.summary_tool import SummaryTool
+    from rag.iflow_retriever import IflowRetriever
+    from rag.xxx_retriever import XxxRetriever
+
+    profile = {key: LatencyProfile(*value) for key, value in PROFILES[args.profile].items()}
+    llm = FakeChatModel(
+        respond=_respond_factory(args.answer_tokens),
+        first_token=profile["llm_first_token"],
+        per_token=profile["llm_per_token"],
+        seed=args.seed,
+    )
+    stack.enter_context(patch("core.llm.get_llm", return_value=llm))
+    for cls, fake in (
+        (IflowRetriever, FakeRetriever("iflow", profile["retriever"], seed=args.seed + 1)),
+        (XxxRetriever, FakeRetriever("xxx", profile["retriever"], seed=args.seed + 2)),
+    ):
+        stack.enter_context(patch.object(cls, "retrieve", lambda self, q, f=fake: f.retrieve(q)))
+        stack.enter_context(
+            patch.object(cls, "aretrieve", lambda self, q, f=fake: f.aretrieve(q), create=True)
+        )
+    for cls, fake in (
+        (SearchTool, FakeTool("search", profile["tool"], seed=args.seed + 3)),
+        (SummaryTool, FakeTool("summary", profile["tool"], seed=args.seed + 4)),
+    ):
+        stack.enter_context(patch.object(cls, "call", lambda self, a, f=fake: f.call(a)))
+        stack.enter_context(
+            patch.object(cls, "acall", lambda self, a, f=fake: f.acall(a), create=True)
+        )
+    return llm
+
+
+def _state(i: int) -> dict[str, Any]:
+    from langchain_core.messages import HumanMessage
+
+    return {
+        "messages": [HumanMessage(content=QUESTIONS[i % len(QUESTIONS)])],
+        "intent": "",
+        "agent_output": "",
+        "context": [],
+        "metadata": {"session_id": f"bench-{i}"},
+        "error": None,
+    }
+
+
+async def _run_concurrent(graph, count: int, concurrency: int, config=None) -> list[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def _one(i: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await graph.ainvoke(_state(i), config)
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(_one(i) for i in range(count)))
+    return latencies
+
+
+def measure(args: argparse.Namespace) -> dict[str, Any]:
+    import logging
+
+    import structlog
+
+    concurrency_levels = [int(c) for c in args.concurrency.split(",") if c]
+
+    with ExitStack() as stack:
+        llm = _patch_dependencies(stack, args)
+        from workflow import build_graph
+
+        # core.logging이 import 시점에 structlog를 설정하므로 그 뒤에 출력만 버리도록 바꾼다.
+        # 로그 이벤트 생성/포맷팅 비용은 그대로 측정에 포함된다.
+        structlog.configure(
+            logger_factory=structlog.PrintLoggerFactory(
+                stack.enter_context(open(os.devnull, "w"))
+            ),
+            wrapper_class=structlog.make_filtering_bound_logger(logging.NOTSET),
+        )
+        graph = build_graph()
+        asyncio.run(_run_concurrent(graph, len(QUESTIONS) * 3, 1))  # lazy 초기화 warm-up
+
+        calls_before = llm.calls
+        latencies = asyncio.run(_run_concurrent(graph, args.requests, 1))
+        llm_calls = (llm.calls - calls_before) / args.requests
+
+        timer = _node_timer()
+        asyncio.run(_run_concurrent(graph, args.requests, 1, {"callbacks": [timer]}))
+
+        throughput: dict[str, float] = {}
+        for concurrency in concurrency_levels:
+            started = time.perf_counter()
+            asyncio.run(_run_concurrent(graph, args.requests, concurrency))
+            throughput[str(concurrency)] = round(args.requests / (time.perf_counter() - started), 2)
+
+        sessions = max(concurrency_levels)
+        tracemalloc.start()
+        baseline_bytes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        asyncio.run(_run_concurrent(graph, sessions, sessions))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "workflow": args.workflow,
+        "profile": args.profile,
+        "requests": args.requests,
+        "latency_ms": percentiles(latencies),
+        "nodes_ms": {node: percentiles(s) for node, s in sorted(timer.samples.items())},
+        "throughput_rps": throughput,
+        "memory_kb_per_session": round((peak - baseline_bytes) / sessions / 1024, 1),
+        "llm_calls_per_request": round(llm_calls, 2),
+    }
+
+
+# ── 여러 워크플로우 실행 / baseline 비교 ──────────────────────────────────────
+
+
+def _run_subprocess(workflow: str, args: argparse.Namespace) -> dict[str, Any]:
+    command = [
+        sys.executable,
+        __file__,
+        "--workflow", workflow,
+        "--profile", args.profile,
+        "--requests", str(args.requests),
+        "--concurrency", args.concurrency,
+        "--answer-tokens", str(args.answer_tokens),
+        "--seed", str(args.seed),
+        "--json",
+    ]
+    completed = subprocess.run(command, capture_output=True, text=True)
+    if completed.returncode != 0:
+        sys.stderr.write(completed.stderr)
+        raise SystemExit(f"{workflow} 벤치마크 실패 (exit {completed.returncode})")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def aggregate(runs: list[dict[str, Any]]) -> dict[str, Any]:
+    """같은 워크플로우를 반복 실행한 결과를 지표별 중앙값 하나로 합친다."""
+
+    def median(values: list[float]) -> float:
+        return round(statistics.median(values), 3)
+
+    first = runs[0]
+    return {
+        "workflow": first["workflow"],
+        "profile": first["profile"],
+        "requests": first["requests"],
+        "repeats": len(runs),
+        "latency_ms": {
+            key: median([r["latency_ms"][key] for r in runs]) for key in first["latency_ms"]
+        },
+        "nodes_ms": {
+            node: {key: median([r["nodes_ms"][node][key] for r in runs]) for key in stats}
+            for node, stats in first["nodes_ms"].items()
+        },
+        "throughput_rps": {
+            key: median([r["throughput_rps"][key] for r in runs]) for key in first["throughput_rps"]
+        },
+        "memory_kb_per_session": median([r["memory_kb_per_session"] for r in runs]),
+        "llm_calls_per_request": first["llm_calls_per_request"],
+    }
+
+
+def compare(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    reference: dict[str, Any],
+    baseline_reference: dict[str, Any],
+    tolerance: float,
+    min_delta_ms: float = 0.0,
+) -> list[str]:
+    """reference(v1_0) 대비 비율이 baseline의 같은 비율보다 tolerance 이상 나빠진 지표 목록.
+
+    기대값은 이번 reference 값에 baseline 비율을 곱한 값이다. 지연/메모리는 증가, 처리량은 감소가 악화다.
+    """
+    regressions = []
+
+    def check(
+        name: str,
+        now: float,
+        ref_now: float,
+        before: float,
+        ref_before: float,
+        higher_is_worse: bool = True,
+        floor: float = 0.0,
+    ) -> None:
+        if before <= 0 or ref_before <= 0 or ref_now <= 0:
+            return
+        expected = ref_now * before / ref_before
+        if higher_is_worse and now - expected <= floor:
+            return
+        change = (now - expected) / expected if higher_is_worse else (expected - now) / expected
+        if change > tolerance:
+            regressions.append(
+                f"{name}: {REFERENCE_WORKFLOW} 대비 {before / ref_before:.2f}x -> {now / ref_now:.2f}x"
+                f" ({change:+.0%})"
+            )
+
+    for key in GATED_LATENCY:
+        check(
+            f"latency_ms.{key}",
+            current["latency_ms"][key],
+            reference["latency_ms"][key],
+            baseline["latency_ms"].get(key, 0),
+            baseline_reference["latency_ms"].get(key, 0),
+            floor=min_delta_ms,
+        )
+    for key, value in current["throughput_rps"].items():
+        check(
+            f"throughput_rps@{key}",
+            value,
+            reference["throughput_rps"].get(key, 0),
+            baseline["throughput_rps"].get(key, 0),
+            baseline_reference["throughput_rps"].get(key, 0),
+            higher_is_worse=False,
+        )
+    check(
+        "memory_kb_per_session",
+        current["memory_kb_per_session"],
+        reference["memory_kb_per_session"],
+        baseline["memory_kb_per_session"],
+        baseline_reference["memory_kb_per_session"],
+    )
+    return regressions
+
+
+def _print_report(result: dict[str, Any]) -> None:
+    print(
+        f"\n[{result['workflow']}] profile={result['profile']} requests={result['requests']}"
+        f" x {result['repeats']} (중앙값)"
+        f" llm_calls/req={result['llm_calls_per_request']}"
+    )
+    rows = {"end-to-end": result["latency_ms"], **result["nodes_ms"]}
+    for name, stats in rows.items():
+        print(
+            f"  {name:<18} ms  p50={stats['p50']:>9.3f}"
+            f" p95={stats['p95']:>9.3f} p99={stats['p99']:>9.3f}"
+        )
+    throughput = "  ".join(f"c={c}: {rps}" for c, rps in result["throughput_rps"].items())
+    print(f"  throughput rps      {throughput}")
+    print(f"  memory/session      {result['memory_kb_per_session']} KiB (tracemalloc peak)")
+
+
+def main() -> None:
+    args = _parse_args()
+    if args.json:
+        sys.path.insert(0, str(_root / "src" / "workflows" / args.workflow))
+        sys.path.insert(0, str(_here))
+        print(json.dumps(measure(args), ensure_ascii=False))
+        return
+
+    workflows = WORKFLOWS if args.workflow == "all" else (args.workflow,)
+    runs: dict[str, list[dict[str, Any]]] = {workflow: [] for workflow in workflows}
+    # 버전을 번갈아 실행해 머신 부하 변화가 양쪽에 비슷하게 걸리게 한다.
+    for _ in range(args.repeats):
+        for workflow in workflows:
+            runs[workflow].append(_run_subprocess(workflow, args))
+    results = {workflow: aggregate(workflow_runs) for workflow, workflow_runs in runs.items()}
+    for result in results.values():
+        _print_report(result)
+
+    baseline_path = Path(args.baseline)
+    baseline = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+    if args.update_baseline:
+        baseline.setdefault(args.profile, {}).update(results)
+        baseline_path.write_text(json.dumps(baseline, ensure_ascii=False, indent=2) + "\n")
+        print(f"\nbaseline 저장: {baseline_path}")
+        return
+
+    stored = baseline.get(args.profile, {})
+    reference = results.get(REFERENCE_WORKFLOW)
+    if reference is None or REFERENCE_WORKFLOW not in stored:
+        print(f"\n비율 기준({REFERENCE_WORKFLOW}) 결과나 baseline이 없어 회귀 판정을 건너뜁니다.")
+        return
+
+    regressed = False
+    for workflow, result in results.items():
+        if workflow == REFERENCE_WORKFLOW:
+            continue
+        if workflow not in stored:
+            print(f"\n[{workflow}] baseline 없음 — --update-baseline으로 저장하세요.")
+            continue
+        regressions = compare(
+            result,
+            stored[workflow],
+            reference,
+            stored[REFERENCE_WORKFLOW],
+            args.tolerance,
+            args.min_delta_ms,
+        )
+        if stored[workflow]["requests"] != result["requests"]:
+            print(f"\n[{workflow}] 주의: baseline 요청 수({stored[workflow]['requests']})와 다릅니다.")
+        if regressions:
+            regressed = True
+            print(f"\n[{workflow}] baseline 대비 {args.tolerance:.0%} 이상 악화:")
+            for line in regressions:
+                print(f"  - {line}")
+        else:
+            print(f"\n[{workflow}] baseline 대비 회귀 없음")
+    sys.exit(1 if regressed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# LLM 요청 hedging 벤치마크 — 꼬리가 긴 지연 분포의 fake chat model에 acall_llm을 동시 호출해
+# hedging off/on의 p50/p95/p99와, p99를 줄인 만큼 추가로 보낸 요청 비율을 비교한다.
+#   python benchmarks/hedging_bench.py --requests 2000 --concurrency 16 --median-ms 20 --p99-ms 300
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from contextlib import ExitStack
+from pathlib import Path
+from unittest.mock import patch
+
+_root = Path(__file__).resolve().parent.parent
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="LLM 요청 hedging 전후 지연 분포/추가 요청 비율 비교")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--median-ms", type=float, default=20.0)
+    parser.add_argument("--p99-ms", type=float, default=300.0)
+    parser.add_argument("--quantile", type=float, default=0.95, help="hedge 기준 분위수")
+    parser.add_argument("--budget", type=float, default=0.1, help="hedge 요청 비율 상한")
+    parser.add_argument("--warmup", type=int, default=200, help="지연 분포를 채우는 측정 제외 요청 수")
+    return parser.parse_args()
+
+
+_args = _parse_args()
+sys.path.insert(0, str(_root / "src" / "workflows" / "v1_1"))
+sys.path.insert(0, str(_root / "benchmarks"))
+
+import structlog
+from langchain_core.messages import HumanMessage
+
+import core.resilience
+from core.llm import acall_llm
+from core.resilience import ResiliencePolicy
+from fakes import FakeChatModel, LatencyProfile
+
+structlog.configure(logger_factory=structlog.PrintLoggerFactory(sys.stderr))
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def _run(count: int, concurrency: int) -> list[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def _one(i: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await acall_llm([HumanMessage(content=f"질문 {i}")])
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(_one(i) for i in range(count)))
+    return latencies
+
+
+def _measure(hedge: bool) -> dict[str, float]:
+    model = FakeChatModel(
+        respond=lambda messages: "응답",
+        first_token=LatencyProfile(_args.median_ms, _args.p99_ms),
+        seed=42,
+    )
+    policy = ResiliencePolicy(
+        hedge=hedge,
+        hedge_quantile=_args.quantile,
+        hedge_min_samples=min(_args.warmup, 50),
+        hedge_budget_ratio=_args.budget,
+    )
+    core.resilience._trackers.clear()
+    with ExitStack() as stack:
+        stack.enter_context(patch("core.llm.get_llm", return_value=model))
+        stack.enter_context(patch("core.resilience.get_policy", return_value=policy))
+        asyncio.run(_run(_args.warmup, _args.concurrency))
+        calls_before = model.calls
+        latencies = asyncio.run(_run(_args.requests, _args.concurrency))
+    ms = [x * 1000 for x in latencies]
+    return {
+        "p50": _percentile(ms, 0.50),
+        "p95": _percentile(ms, 0.95),
+        "p99": _percentile(ms, 0.99),
+        "extra": (model.calls - calls_before) / _args.requests - 1,
+    }
+
+
+def main() -> None:
+    print(
+        f"requests={_args.requests} concurrency={_args.concurrency} "
+        f"latency median={_args.median_ms}ms p99={_args.p99_ms}ms "
+        f"hedge quantile={_args.quantile} budget={_args.budget}"
+    )
+    results = {"off": _measure(hedge=False), "on": _measure(hedge=True)}
+    for name, r in results.items():
+        print(
+            f"  hedge {name:<3}  p50={r['p50']:7.1f}ms p95={r['p95']:7.1f}ms p99={r['p99']:7.1f}ms"
+            f"  extra requests={r['extra'] * 100:5.1f}%"
+        )
+    off, on = results["off"], results["on"]
+    print(
+        f"  p99 removed: {off['p99'] - on['p99']:.1f}ms ({(1 - on['p99'] / off['p99']) * 100:.1f}%)"
+        f" for {on['extra'] * 100:.1f}% extra requests"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# LLM HTTP 연결 재사용 벤치마크 — 로컬 OpenAI 호환 서버에 동시 세션으로 chat 요청을 보내 새 연결 수와 지연을 비교한다
+# - default: ChatOpenAI 기본 HTTP 설정 (openai SDK 기본 연결 풀)
+# - pooled: core/llm.py가 settings로 구성한 연결 풀 / keep-alive / timeout
+# 서버는 TLS 없이 동작하므로 지연 차이는 실제보다 작게 나타난다. 새 연결 수가 운영 환경의 TLS handshake 수에 해당한다.
+#   python benchmarks/llm_http_bench.py --sessions 200 --rounds 5
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+_root = Path(__file__).resolve().parent.parent
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="LLM HTTP 연결 풀 설정별 새 연결 수/지연 측정")
+    parser.add_argument("--sessions", type=int, default=200, help="동시 세션 수")
+    parser.add_argument("--rounds", type=int, default=5, help="세션마다 보내는 요청 수")
+    parser.add_argument("--server-ms", type=float, default=50.0, help="서버 응답 지연(ms)")
+    parser.add_argument("--variants", default="default,pooled")
+    return parser.parse_args()
+
+
+_args = _parse_args()
+sys.path.insert(0, str(_root / "src" / "workflows" / "v1_1"))
+
+import structlog
+from langchain_core.messages import HumanMessage
+from langchain_openai import ChatOpenAI
+
+from core.llm import _client_options, http_timeout, httpx
+
+structlog.configure(logger_factory=structlog.PrintLoggerFactory(sys.stderr))
+
+_RESPONSE = json.dumps(
+    {
+        "id": "chatcmpl-bench",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "bench",
+        "choices": [
+            {"index": 0, "message": {"role": "assistant", "content": "응답"}, "finish_reason": "stop"}
+        ],
+        "usage": {"prompt_tokens": 5, "completion_tokens": 1, "total_tokens": 6},
+    }
+).encode("utf-8")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self) -> None:
+        super().setup()
+        with _Handler.lock:
+            _Handler.connections += 1
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(_args.server_ms / 1000)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_RESPONSE)))
+        self.end_headers()
+        self.wfile.write(_RESPONSE)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+async def _run(llm: ChatOpenAI) -> list[float]:
+    latencies: list[float] = []
+
+    async def _session(i: int) -> None:
+        for r in range(_args.rounds):
+            started = time.perf_counter()
+            await llm.ainvoke([HumanMessage(content=f"질문 {i}-{r}")])
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(_session(i) for i in range(_args.sessions)))
+    return latencies
+
+
+def main() -> None:
+    ThreadingHTTPServer.request_queue_size = 1024  # 동시 connect가 backlog에서 거절되지 않도록
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+    variants = {
+        "default": {},
+        "pooled": {"http_async_client": httpx.AsyncClient(**_client_options()), "timeout": http_timeout()},
+    }
+    print(f"sessions={_args.sessions} rounds={_args.rounds} server={_args.server_ms}ms")
+    for name in _args.variants.split(","):
+        options = variants[name]
+        llm = ChatOpenAI(api_key="bench", base_url=base_url, model="bench", max_retries=0, **options)
+        before = _Handler.connections
+        started = time.perf_counter()
+        latencies = asyncio.run(_run(llm))
+        elapsed = time.perf_counter() - started
+        ms = sorted(x * 1000 for x in latencies)
+        print(
+            f"  {name:<8} new connections={_Handler.connections - before:>5}"
+            f"  p50={statistics.median(ms):7.1f}ms p99={ms[int(len(ms) * 0.99) - 1]:7.1f}ms"
+            f"  {len(ms) / elapsed:7.1f} req/s"
+        )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+# 로깅 오버헤드 벤치마크 — log_mode별로 요청당 지연과 로그 호출 1회 비용을 비교한다
+# - off: warning 미만 로그를 모두 거르는 기준선, console: 기존 ConsoleRenderer + print, json: background writer
+# - console/json 모두 같은 조건이 되도록 로그는 임시 파일로 기록한다.
+# - fake LLM/retriever/tool(graph_bench와 같은 overhead 프로필)을 쓰므로 차이는 로깅 비용만 남는다.
+#   python benchmarks/logging_bench.py --requests 300
+#   python benchmarks/logging_bench.py --modes console,json --calls 50000
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any
+
+_root = Path(__file__).resolve().parent.parent
+_here = Path(__file__).resolve().parent
+
+# mode -> 자식 프로세스 환경 변수
+MODES: dict[str, dict[str, str]] = {
+    "off": {"LOG_MODE": "console", "LOG_LEVEL": "warning"},
+    "console": {"LOG_MODE": "console", "LOG_LEVEL": "debug"},
+    "json": {"LOG_MODE": "json", "LOG_LEVEL": "debug"},
+}
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="log_mode별 요청당 로깅 오버헤드 측정")
+    parser.add_argument("--modes", default="off,console,json")
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--calls", type=int, default=20000, help="로그 호출 단위 측정 횟수")
+    parser.add_argument("--answer-tokens", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--mode", help=argparse.SUPPRESS)
+    parser.add_argument("--result", help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def measure(args: argparse.Namespace) -> dict[str, Any]:
+    from graph_bench import _patch_dependencies, _run_concurrent, percentiles
+
+    args.profile = "overhead"
+    with ExitStack() as stack:
+        _patch_dependencies(stack, args)
+        from core.logging import get_logger, log_writer
+        from workflow import build_graph
+
+        graph = build_graph()
+        asyncio.run(_run_concurrent(graph, 9, 1))  # lazy 초기화 warm-up
+
+        latencies = asyncio.run(_run_concurrent(graph, args.requests, 1))
+
+        # 가장 큰 필드를 싣는 이벤트 하나로 호출 단위 비용을 잰다.
+        logger = get_logger("logging_bench")
+        tool_args = {"query": "배송 상태 " * 50, "filters": {"range": "7d", "limit": 20}}
+        started = time.perf_counter()
+        for _ in range(args.calls):
+            logger.info("mcp_tool_call_start", tool_name="search", args=tool_args)
+        per_call = time.perf_counter() - started
+
+        started = time.perf_counter()
+        if log_writer is not None:
+            log_writer.flush(timeout=60)
+        drain = time.perf_counter() - started
+
+    return {
+        "mode": args.mode,
+        "latency_ms": percentiles(latencies),
+        "per_call_us": round(per_call / args.calls * 1e6, 2),
+        "drain_ms": round(drain * 1000, 1),
+        "dropped": log_writer.dropped if log_writer is not None else 0,
+    }
+
+
+def _run_subprocess(mode: str, args: argparse.Namespace, workdir: str) -> dict[str, Any]:
+    result_path = os.path.join(workdir, f"{mode}.json")
+    log_path = os.path.join(workdir, f"{mode}.log")
+    env = {**os.environ, **MODES[mode], "LOG_FILE_PATH": log_path}
+    command = [
+        sys.executable,
+        __file__,
+        "--mode", mode,
+        "--result", result_path,
+        "--requests", str(args.requests),
+        "--calls", str(args.calls),
+        "--answer-tokens", str(args.answer_tokens),
+        "--seed", str(args.seed),
+    ]
+    # console 모드는 stdout에 print하므로 stdout 자체를 로그 파일로 돌린다.
+    with open(log_path, "a", encoding="utf-8") as stdout:
+        completed = subprocess.run(command, env=env, stdout=stdout, stderr=subprocess.PIPE, text=True)
+    if completed.returncode != 0:
+        sys.stderr.write(completed.stderr)
+        raise SystemExit(f"{mode} 벤치마크 실패 (exit {completed.returncode})")
+    result = json.loads(Path(result_path).read_text())
+    result["log_bytes"] = os.path.getsize(log_path)
+    return result
+
+
+def main() -> None:
+    args = _parse_args()
+    if args.mode:
+        sys.path.insert(0, str(_root / "src" / "workflows" / "v1_1"))
+        sys.path.insert(0, str(_here))
+        Path(args.result).write_text(json.dumps(measure(args)))
+        return
+
+    modes = [m for m in args.modes.split(",") if m]
+    with tempfile.TemporaryDirectory() as workdir:
+        results = {mode: _run_subprocess(mode, args, workdir) for mode in modes}
+
+    reference = results.get("off")
+    print(f"requests={args.requests} (동시성 1), 로그 호출 측정 {args.calls}회")
+    for mode, result in results.items():
+        latency = result["latency_ms"]
+        overhead = ""
+        if reference is not None and mode != "off":
+            delta = latency["p50"] - reference["latency_ms"]["p50"]
+            overhead = f" 로깅 오버헤드 p50 {delta:+.3f}ms"
+        print(
+            f"  {mode:<8} p50={latency['p50']:>8.3f}ms p95={latency['p95']:>8.3f}ms"
+            f"  call={result['per_call_us']:>7.2f}us  drain={result['drain_ms']:>7.1f}ms"
+            f"  log={result['log_bytes'] / 1024:>8.1f}KiB dropped={result['dropped']}{overhead}"
+        )
+
+
+if __name__ == "__main__":
+    main()
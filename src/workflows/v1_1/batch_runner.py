@@ -0,0 +1,133 @@
+# JSONL 질문 목록을 그래프로 일괄 처리하는 batch runner — 오프라인 평가 / 대량 질의용
+# - 입력: 한 줄에 JSON 객체 하나. question_key 필드를 질문으로, id_key/session_id 필드를 식별자로 사용한다.
+# - 실행: 하나의 이벤트 루프에서 workers개의 세션을 graph.ainvoke로 동시에 처리한다.
+#   intent 분류 LLM 호출은 intent_batch_size(없으면 intent_llm_batch_max_size 설정)에 따라 세션 간에 묶인다
+#   (node/intent_batcher.py).
+# - 출력: 세션이 끝나는 순서대로 결과를 한 줄씩 바로 기록한다 (입력 순서는 index 필드로 복원).
+#   입력 전체를 메모리에 올리지 않도록 입력 queue 크기를 workers의 2배로 제한한다.
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any, TextIO
+
+from langchain_core.messages import HumanMessage
+
+from config.settings import get_settings
+from core.checkpoint import session_config
+from core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_DONE = object()
+
+
+@dataclass
+class BatchSummary:
+    total: int = 0
+    failed: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        return self.total / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+def initial_state(question: str, session_id: str) -> dict[str, Any]:
+    return {
+        "messages": [HumanMessage(content=question)],
+        "intent": "",
+        "agent_output": "",
+        "context": [],
+        "metadata": {"session_id": session_id},
+        "error": None,
+    }
+
+
+async def arun_batch(
+    lines: Iterable[str],
+    output: TextIO,
+    graph: Any | None = None,
+    workers: int | None = None,
+    question_key: str = "question",
+    id_key: str = "id",
+    intent_batch_size: int | None = None,
+) -> BatchSummary:
+    """lines(JSONL)의 각 질문을 graph로 처리하고 결과 JSONL을 output에 기록한다.
+
+    잘못된 줄이나 실패한 세션도 error 필드를 채운 결과 줄로 기록하고 다음 줄을 계속 처리한다.
+    intent_batch_size를 지정하면 settings 대신 그 크기로 intent 분류 LLM 호출을 묶는다.
+    """
+    if intent_batch_size is not None:
+        from node.intent_classifier import configure_intent_batching
+
+        configure_intent_batching(intent_batch_size)
+    if graph is None:
+        from workflow import build_graph
+
+        graph = build_graph()
+    workers = workers or get_settings().batch_workers
+    queue: asyncio.Queue = asyncio.Queue(maxsize=workers * 2)
+    summary = BatchSummary()
+    started = time.perf_counter()
+
+    async def _produce() -> None:
+        for index, line in enumerate(lines):
+            if line.strip():
+                await queue.put((index, line))
+        for _ in range(workers):
+            await queue.put(_DONE)
+
+    async def _work() -> None:
+        while (item := await queue.get()) is not _DONE:
+            record = await _run_one(graph, *item, question_key=question_key, id_key=id_key)
+            summary.total += 1
+            summary.failed += record["error"] is not None
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+            output.flush()
+
+    await asyncio.gather(_produce(), *(_work() for _ in range(workers)))
+    summary.elapsed_seconds = time.perf_counter() - started
+    logger.info(
+        "batch_completed",
+        total=summary.total,
+        failed=summary.failed,
+        workers=workers,
+        elapsed_seconds=round(summary.elapsed_seconds, 3),
+        throughput=round(summary.throughput, 2),
+    )
+    return summary
+
+
+def run_batch(lines: Iterable[str], output: TextIO, **kwargs: Any) -> BatchSummary:
+    """arun_batch의 동기 진입점."""
+    return asyncio.run(arun_batch(lines, output, **kwargs))
+
+
+async def _run_one(
+    graph: Any, index: int, line: str, *, question_key: str, id_key: str
+) -> dict[str, Any]:
+    record: dict[str, Any] = {"index": index, "id": None, "intent": None, "answer": None, "error": None}
+    started = time.perf_counter()
+    try:
+        item = json.loads(line)
+        record["id"] = item.get(id_key, index)
+        question = item[question_key]
+        session_id = str(item.get("session_id") or f"batch-{record['id']}")
+        result = await graph.ainvoke(
+            initial_state(question, session_id), session_config(session_id)
+        )
+        record["intent"] = result.get("intent")
+        # 사용자가 받는 응답은 마지막 메시지다 (FALLBACK_MESSAGE 경로에서는 agent_output이 비어 있다).
+        messages = result.get("messages") or []
+        record["answer"] = messages[-1].content if messages else None
+        record["error"] = result.get("error")
+    except Exception as exc:
+        # 한 세션의 실패가 batch 전체를 멈추지 않도록 결과 줄에 기록하고 넘어간다.
+        logger.warning("batch_item_failed", index=index, error=str(exc))
+        record["error"] = f"{type(exc).__name__}: {exc}"
+    record["elapsed_seconds"] = round(time.perf_counter() - started, 4)
+    return record
@@ -0,0 +1,35 @@
+# Intent 규칙 테이블 — LLM 분류 전에 확인하는 키워드/정규식 fast path 정의
+# 새 규칙은 이 파일에 추가한다. 여러 intent의 규칙이 동시에 매칭되면 LLM 분류로 넘어간다.
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from config.intents import Intent
+
+
+@dataclass(frozen=True)
+class IntentRule:
+    """하나의 intent에 대응하는 키워드/정규식 묶음.
+
+    keywords는 대소문자 구분 없이 부분 문자열로 매칭되고,
+    patterns는 Python 정규식으로 그대로 사용된다.
+    """
+
+    intent: Intent
+    keywords: tuple[str, ...] = ()
+    patterns: tuple[str, ...] = ()
+
+
+# 규칙이 비어 있으면 fast path는 매칭되지 않는다 — 규칙을 추가한 뒤 settings.intent_rule_fast_path_enabled를 켠다.
+# 형식) IntentRule(Intent.INTENT_A, keywords=("iflow", "블로그"), patterns=(r"\biflow\s*글\b",))
+INTENT_RULES: list[IntentRule] = []
+
+
+# 후속 발화 표지 — 이 표현이 들어간 입력은 직전 턴의 주제를 이어가는 것으로 보고 세션 intent를 재사용한다
+# (node/intent_stickiness.py, settings.intent_sticky_enabled). 표지는 단어 경계에서만 매칭된다.
+# 새 주제에도 흔히 쓰이는 접속사/부사("그리고", "다시", "계속", "it", "that", "again")는 넣지 않는다.
+FOLLOW_UP_MARKERS: tuple[str, ...] = (
+    "그거", "그것", "그건", "그걸", "이거", "이것", "이건", "저거",
+    "자세히", "좀 더", "더 알려", "방금", "위에서", "앞에서",
+    "more detail", "more details", "in detail", "tell me more", "what about",
+)
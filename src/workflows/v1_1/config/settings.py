@@ -3,9 +3,20 @@ from __future__ import annotations
 
 from functools import lru_cache
 
+from pydantic import BaseModel, ConfigDict
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+class LLMProfile(BaseModel):
+    """노드별 LLM 설정 (core/llm.py get_llm). None인 필드는 Settings 기본값을 따른다."""
+
+    model_config = ConfigDict(frozen=True)
+
+    model: str | None = None
+    temperature: float | None = None
+    max_tokens: int | None = None  # None이면 제한 없음
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -16,9 +27,180 @@ class Settings(BaseSettings):
     openai_api_key: str = ""
     openai_model_name: str = "gpt-4o-mini"
     openai_temperature: float = 0.0
+    openai_embedding_model: str = "text-embedding-3-small"
+
+    # 노드별 LLM 프로필 — 이름별 model/temperature/max_tokens. 없는 프로필/필드는 위 openai_* 값을 따른다.
+    # 프로필 이름: intent_classifier, intent_batch, agent_a, agent_b, final_response
+    # 예) LLM_PROFILES='{"intent_classifier": {"model": "gpt-4.1-nano", "max_tokens": 8}}'
+    llm_profiles: dict[str, LLMProfile] = {"intent_classifier": LLMProfile(max_tokens=8)}
+
+    # LLM HTTP client (core/llm.py) — 동시 세션이 많을 때 연결을 재사용해 connect/TLS handshake를 줄인다
+    openai_http_max_connections: int = 256
+    openai_http_max_keepalive_connections: int = 256  # 동시 세션 수보다 작으면 응답마다 연결이 닫혔다 다시 열린다
+    openai_http_keepalive_expiry_seconds: float = 60.0
+    openai_http2: bool = True  # h2 패키지가 없으면 경고 후 HTTP/1.1로 동작한다
+    openai_connect_timeout_seconds: float = 5.0
+    openai_read_timeout_seconds: float = 60.0
+    openai_write_timeout_seconds: float = 10.0
+    openai_pool_timeout_seconds: float = 10.0  # 연결 풀이 가득 찼을 때 빈 연결을 기다리는 최대 시간
+
+    # LLM 호출 복원력 (core/resilience.py) — deadline은 재시도를 포함한 호출 1회 전체 시간 (None이면 제한 없음)
+    # stream 호출은 첫 chunk를 받기 전까지만 deadline/재시도/hedging을 적용한다.
+    llm_deadline_seconds: float | None = 90.0
+    llm_max_attempts: int = 3  # 1이면 재시도하지 않는다
+    llm_retry_backoff_base_seconds: float = 0.5
+    llm_retry_backoff_max_seconds: float = 8.0
+    # hedging — 첫 요청이 최근 지연의 hedge_quantile 분위수 안에 끝나지 않으면 같은 요청을 한 번 더 보낸다.
+    # 표본이 min_samples개 모이기 전에는 보내지 않고, hedge 요청 수는 전체의 budget_ratio 이하로 제한한다.
+    llm_hedge_enabled: bool = False
+    llm_hedge_quantile: float = 0.95
+    llm_hedge_min_samples: int = 50
+    llm_hedge_budget_ratio: float = 0.1
+    llm_sync_workers: int = 64  # sync 호출 hedging(llm_hedge_enabled)에만 쓰는 작업 스레드 수
+
+    # LLM 응답 exact-match 캐시 — temperature가 0일 때만 적용된다.
+    llm_cache_backend: str = "none"  # none | memory | sqlite
+    llm_cache_max_entries: int = 1024
+    llm_cache_ttl_seconds: float | None = 3600.0
+    llm_cache_sqlite_path: str = ".cache/llm_cache.sqlite3"
+
+    # 로깅 (core/logging.py) — console: 개발용 색상 텍스트, json: 운영용 background writer + JSON
+    log_mode: str = "console"  # console | json
+    log_level: str = "debug"  # debug | info | warning | error | critical
+    log_file_path: str | None = None  # json 모드 출력 파일 (None이면 stderr)
+    log_queue_max_size: int = 100_000
+    # json 모드: 긴 문자열 필드는 잘라내고, 아래 필드는 원문 대신 sha256 해시와 길이만 남긴다.
+    log_max_field_chars: int = 256
+    log_hash_fields: list[str] = ["args", "query", "user_input", "raw_intent"]
+    # json 모드 event별 샘플링 비율(0~1)과 초당 최대 개수 — warning 이상은 항상 기록된다.
+    # 예) LOG_SAMPLE_RATES='{"node_enter": 0.1}', LOG_RATE_LIMITS='{"retrieval_start": 50}'
+    log_sample_rates: dict[str, float] = {}
+    log_rate_limits: dict[str, float] = {}
+
+    # 분산 트레이싱 (core/tracing.py) — none이면 꺼짐(기본값). file: OTLP/JSON lines, otlp_http: collector로 POST
+    tracing_exporter: str = "none"  # none | file | otlp_http
+    tracing_file_path: str = "traces.otlp.jsonl"
+    tracing_otlp_endpoint: str = "http://127.0.0.1:4318/v1/traces"
+    tracing_service_name: str = "base_multi_agent"
+    tracing_sample_ratio: float = 1.0  # root span 기준 trace 샘플링 비율
+
+    # 메트릭 노출 (core/metrics.py) — 수집은 항상 켜져 있고, 아래 설정으로 Prometheus text format을 노출한다.
+    # metrics_http_port: /metrics endpoint 포트 (None이면 끔), metrics_textfile_path: 주기적 파일 덤프 경로
+    metrics_http_host: str = "127.0.0.1"
+    metrics_http_port: int | None = None
+    metrics_textfile_path: str | None = None
+    metrics_textfile_interval_seconds: float = 15.0
+
+    # checkpointer (core/checkpoint.py) — metadata.session_id를 thread_id로 세션 state를 이어간다.
+    # memory/sqlite를 사용하면 graph 호출 시 core.checkpoint.session_config(session_id)를 config로 넘긴다.
+    checkpointer_backend: str = "none"  # none | memory | sqlite
+    checkpointer_sqlite_path: str = ".cache/checkpoints.sqlite3"
+
+    # GraphState.messages history 제한 (core/history.py) — None이면 제한 없이 누적한다.
+    # 오래된 턴은 "생략 표시 + 최근 대화 발췌" 요약 메시지 하나(최대 history_summary_max_chars자)로 접힌다.
+    history_max_turns: int | None = 10
+    history_summary_max_chars: int = 2000
+
+    # intent 분류 LLM 호출 coalescing (node/intent_batcher.py) — 1이면 세션마다 따로 호출한다.
+    # 1보다 크면 max_wait_seconds 안에 동시에 들어온 분류 요청을 최대 max_size개씩 한 번에 분류한다.
+    intent_llm_batch_max_size: int = 1
+    intent_llm_batch_max_wait_seconds: float = 0.02
+    intent_llm_batch_max_inflight: int = 4  # 동시에 실행할 수 있는 batch 분류 호출 수
+
+    # batch runner (batch_runner.py) 동시 세션 수
+    batch_workers: int = 16
+
+    # intent 분류 출력 (node/intent_output.py) — text: 자유 텍스트를 Intent로 파싱한다.
+    # constrained: JSON schema enum으로 Intent 값만 생성하고(max_tokens는 가장 긴 label 기준),
+    # logprob 기반 confidence를 state["intent_confidence"]에 기록한다. batch 분류(batch 크기 > 1)와 함께 쓸 수 없다.
+    intent_output_mode: str = "text"  # text | constrained
+    # confidence가 이 값보다 낮으면 UNKNOWN(default_response)으로 보낸다. None이면 사용하지 않는다.
+    intent_min_confidence: float | None = None
+
+    # 세션 intent 유지 (node/intent_stickiness.py) — 후속 발화는 같은 session_id의 직전 intent를 재사용해 분류를 건너뛴다.
+    # 후속 발화: 후속 표지(config/intent_rules.FOLLOW_UP_MARKERS) 포함, 또는
+    # 직전 입력과의 임베딩 cosine 유사도가 similarity_threshold 이상 (None이면 임베딩을 쓰지 않는다).
+    # 세션 기록은 in-memory LRU(max_sessions)로 유지되고, 마지막으로 분류된 턴부터 ttl_seconds가 지나면 재사용하지 않는다.
+    intent_sticky_enabled: bool = False
+    intent_sticky_ttl_seconds: float = 600.0
+    intent_sticky_max_sessions: int = 10_000
+    intent_sticky_similarity_threshold: float | None = None
+
+    # config/intent_rules.py 규칙 fast path — 단일 intent로 매칭되면 LLM 분류를 건너뛴다.
+    # 규칙 테이블을 채운 배포에서만 켠다 (빈 테이블이면 매칭 비용만 든다).
+    intent_rule_fast_path_enabled: bool = False
+
+    # final_response 노드의 LLM 호출을 토큰 스트리밍으로 수행한다 (stream_mode="messages").
+    final_response_streaming: bool = True
+    # 이 intent들의 agent_output은 final_response에서 LLM 재작성 없이 그대로 응답한다.
+    final_response_passthrough_intents: list[str] = []
+
+    # intent semantic 캐시 — 유사 발화의 이전 분류 결과를 재사용해 LLM 호출을 건너뛴다.
+    intent_semantic_cache_enabled: bool = False
+    intent_semantic_cache_threshold: float = 0.92
+    intent_semantic_cache_max_entries: int = 10_000
+
+    # speculative 실행 — intent 분류와 동시에 유력한 Agent의 RAG/tool 단계를 미리 시작한다.
+    # 규칙 매칭이나 직전 세션 intent로 추정한 확률이 threshold 이상인 Agent만 대상이다.
+    speculative_execution_enabled: bool = False
+    speculative_threshold: float = 0.6
+    speculative_max_agents: int = 1
+    speculative_rule_prior: float = 0.9
+    speculative_session_prior: float = 0.6
+
+    # 임베딩 서비스 (rag/embedding.py) — 동시 요청을 batch로 묶고 (model, 텍스트) 단위로 캐시한다.
+    embedding_batch_max_size: int = 64
+    embedding_batch_max_wait_seconds: float = 0.005
+    embedding_batch_max_inflight: int = 4  # 동시에 실행할 수 있는 batch 임베딩 API 호출 수
+    embedding_cache_backend: str = "memory"  # memory | sqlite (memory LRU 뒤에 SQLite를 둔다)
+    embedding_cache_max_entries: int = 4096
+    embedding_cache_sqlite_path: str = ".cache/embedding_cache.sqlite3"
 
     milvus_uri: str = "http://localhost:19530"
     milvus_collection_name: str = "default_collection"
+    # Milvus 연결 풀 (rag/milvus_pool.py) — 같은 URI의 retriever들이 연결을 공유한다.
+    milvus_pool_max_size: int = 4
+    milvus_pool_idle_timeout_seconds: float | None = 300.0
+    milvus_pool_health_check_interval_seconds: float = 30.0
+    milvus_pool_acquire_timeout_seconds: float | None = 10.0
+    # 0보다 크면 build_graph 시점에 이 수만큼 미리 연결한다.
+    milvus_pool_warmup_size: int = 0
+
+    # in-process hybrid retriever (rag/local_hybrid_retriever.py) — 소규모 collection을
+    # snapshot으로 메모리에 올려 Milvus 왕복 없이 BM25 + 벡터 검색한다.
+    local_retriever_snapshot_path: str = "data/iflow_snapshot"
+    local_retriever_top_k: int = 5
+    local_retriever_reload_interval_seconds: float | None = 30.0
+    # AgentA가 사용할 retriever — milvus: IflowRetriever, local: LocalHybridRetriever
+    agent_a_retriever: str = "milvus"  # milvus | local
+
+    # LLM 호출 전 context 조립 (core/context_budget.py) — near-duplicate chunk를 제거하고
+    # tool 결과 → retrieval(retriever별 순위 round-robin) → 이전 context 순으로 token 예산 안에 채운다. None이면 예산 제한 없음.
+    context_token_budget: int | None = 4000
+    context_dedup_threshold: float = 0.85
+
+    # retriever fan-out — max_concurrency가 1이면 기존과 같이 순차 실행한다.
+    retrieval_max_concurrency: int = 1
+    retrieval_timeout_seconds: float | None = None
+    retrieval_failure_policy: str = "fail_fast"  # fail_fast | degrade
+
+    # MCP tool fan-out — 결과는 항상 tool 등록 순서로 수집한다.
+    tool_max_concurrency: int = 1
+    tool_timeout_seconds: float | None = None
+    tool_failure_policy: str = "fail_fast"  # fail_fast | degrade
+    # True이면 retrieval이 끝나기를 기다리지 않고 tool 호출을 함께 시작한다.
+    overlap_retrieval_and_tools: bool = False
+
+    def llm_profile(self, name: str) -> LLMProfile:
+        """name 프로필에 기본값(openai_model_name/openai_temperature)을 채운 LLMProfile을 반환한다."""
+        profile = self.llm_profiles.get(name) or LLMProfile()
+        return LLMProfile(
+            model=profile.model or self.openai_model_name,
+            temperature=(
+                profile.temperature if profile.temperature is not None else self.openai_temperature
+            ),
+            max_tokens=profile.max_tokens,
+        )
 
 
 @lru_cache
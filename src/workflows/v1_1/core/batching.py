@@ -0,0 +1,108 @@
+# Micro-batching — 짧은 시간 창 안에 동시에 들어온 요청을 한 번의 batch 호출로 묶는다
+# - 같은 key가 대기 중이거나 처리 중이면 새로 넣지 않고 기존 Future를 공유한다.
+# - batch는 전용 수집 thread가 모으고, batch 호출은 최대 max_inflight_batches개까지 동시에 executor에서 실행한다.
+#   실행 슬롯이 모두 차 있으면 수집 thread는 다음 batch를 더 채우며 기다린다. 호출자는 sync/async 모두 Future로 기다린다.
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Generic, Hashable, TypeVar
+
+from core.logging import get_logger
+
+logger = get_logger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class MicroBatcher(Generic[K, V]):
+    """submit된 key들을 모아 batch_fn(keys) 한 번으로 처리한다.
+
+    첫 요청이 들어온 뒤 max_wait_seconds 동안(또는 max_batch_size가 찰 때까지) 기다렸다가
+    모인 key를 중복 없이 batch_fn에 전달한다. batch_fn은 입력과 같은 순서·길이의 결과를 반환해야 한다.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[K]], list[V]],
+        max_batch_size: int = 64,
+        max_wait_seconds: float = 0.005,
+        name: str = "micro_batcher",
+        max_inflight_batches: int = 4,
+    ) -> None:
+        self._batch_fn = batch_fn
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_wait = max(0.0, max_wait_seconds)
+        self._name = name
+        inflight = max(1, max_inflight_batches)
+        self._slots = threading.BoundedSemaphore(inflight)
+        self._executor = ThreadPoolExecutor(max_workers=inflight, thread_name_prefix=f"{name}_batch")
+        self._pending: dict[K, Future[V]] = {}
+        self._inflight: dict[K, Future[V]] = {}
+        self._cond = threading.Condition()
+        self._worker: threading.Thread | None = None
+        self.batches = 0
+
+    def submit(self, key: K) -> Future[V]:
+        """key를 다음 batch에 추가하고 결과 Future를 반환한다."""
+        with self._cond:
+            future = self._pending.get(key) or self._inflight.get(key)
+            if future is None:
+                future = Future()
+                self._pending[key] = future
+                self._ensure_worker()
+                self._cond.notify()
+            return future
+
+    def submit_many(self, keys: list[K]) -> list[Future[V]]:
+        return [self.submit(key) for key in keys]
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._loop, name=self._name, daemon=True)
+            self._worker.start()
+
+    def _loop(self) -> None:
+        while True:
+            self._slots.acquire()
+            batch = self._next_batch()
+            self._executor.submit(self._dispatch, batch)
+
+    def _next_batch(self) -> dict[K, Future[V]]:
+        with self._cond:
+            while not self._pending:
+                self._cond.wait()
+            deadline = time.monotonic() + self._max_wait
+            while len(self._pending) < self._max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            keys = list(self._pending)[: self._max_batch_size]
+            batch = {key: self._pending.pop(key) for key in keys}
+            self._inflight.update(batch)
+            return batch
+
+    def _dispatch(self, batch: dict[K, Future[V]]) -> None:
+        keys = list(batch)
+        try:
+            values = self._batch_fn(keys)
+            if len(values) != len(keys):
+                raise ValueError(
+                    f"batch 결과 수가 입력과 다릅니다: {len(values)} != {len(keys)}"
+                )
+        except Exception as exc:
+            logger.warning("micro_batch_failed", name=self._name, size=len(keys), error=str(exc))
+            for future in batch.values():
+                future.set_exception(exc)
+        else:
+            for key, value in zip(keys, values):
+                batch[key].set_result(value)
+        finally:
+            with self._cond:
+                for key in keys:
+                    self._inflight.pop(key, None)
+                self.batches += 1
+            self._slots.release()
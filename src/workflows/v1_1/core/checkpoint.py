@@ -0,0 +1,400 @@
+# LangGraph checkpointer — metadata.session_id를 thread_id로 사용해 multi-turn 세션을 이어간다
+# - backend: memory(InMemorySaver) / sqlite(SQLiteCheckpointSaver, 로컬 파일)
+# - 직렬화: LangGraph 기본 msgpack 인코딩 뒤에 zstd 압축을 붙인 ZstdMsgpackSerializer
+# - delta 저장: checkpoint에는 channel version만 기록하고, 채널 값은 version이 바뀐 채널만
+#   (thread, ns, channel, version) 단위 blob으로 저장한다. 변하지 않은 채널은 super-step마다 다시 쓰지 않는다.
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+from collections.abc import AsyncIterator, Iterator, Sequence
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import zstandard
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    SerializerProtocol,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+    writes_sort_key,
+)
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from config.settings import get_settings
+
+_ZSTD_SUFFIX = "+zstd"
+
+
+class ZstdMsgpackSerializer(SerializerProtocol):
+    """LangGraph 기본 serializer(msgpack) 결과를 zstd로 압축한다.
+
+    min_size보다 작은 값은 압축 이득보다 frame 오버헤드가 커서 그대로 둔다.
+    """
+
+    def __init__(
+        self,
+        inner: SerializerProtocol | None = None,
+        level: int = 3,
+        min_size: int = 128,
+    ) -> None:
+        self._inner = inner or JsonPlusSerializer()
+        self._level = level
+        self._min_size = min_size
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        type_, data = self._inner.dumps_typed(obj)
+        if len(data) < self._min_size:
+            return type_, data
+        return type_ + _ZSTD_SUFFIX, zstandard.compress(data, self._level)
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        type_, payload = data
+        if type_.endswith(_ZSTD_SUFFIX):
+            type_, payload = type_[: -len(_ZSTD_SUFFIX)], zstandard.decompress(payload)
+        return self._inner.loads_typed((type_, payload))
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    parent_checkpoint_id TEXT,
+    type TEXT NOT NULL,
+    checkpoint BLOB NOT NULL,
+    metadata_type TEXT NOT NULL,
+    metadata BLOB NOT NULL,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+);
+CREATE TABLE IF NOT EXISTS blobs (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    channel TEXT NOT NULL,
+    version TEXT NOT NULL,
+    type TEXT NOT NULL,
+    blob BLOB,
+    PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+);
+CREATE TABLE IF NOT EXISTS writes (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    channel TEXT NOT NULL,
+    type TEXT NOT NULL,
+    value BLOB,
+    task_path TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+);
+"""
+
+
+class SQLiteCheckpointSaver(BaseCheckpointSaver[int]):
+    """로컬 SQLite 파일 기반 checkpointer. 프로세스 재시작 후에도 세션을 이어갈 수 있다.
+
+    저장 구조는 InMemorySaver와 같다 — checkpoints(채널 version만), blobs(채널 값 delta), writes.
+    """
+
+    def __init__(self, path: str, *, serde: SerializerProtocol | None = None) -> None:
+        super().__init__(serde=serde)
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            # WAL + synchronous=NORMAL: 턴마다 여러 번 commit해도 fsync는 checkpoint 시점에만 한다.
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+
+    # ── 조회 ──────────────────────────────────────────────────
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        query = (
+            "SELECT checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata_type, metadata"
+            " FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ?"
+        )
+        params: tuple[Any, ...] = (thread_id, checkpoint_ns)
+        if checkpoint_id := get_checkpoint_id(config):
+            query += " AND checkpoint_id = ?"
+            params += (checkpoint_id,)
+        else:
+            query += " ORDER BY checkpoint_id DESC LIMIT 1"
+        with self._lock:
+            row = self._conn.execute(query, params).fetchone()
+        if row is None:
+            return None
+        return self._to_tuple(thread_id, checkpoint_ns, row)
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        query = (
+            "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id,"
+            " type, checkpoint, metadata_type, metadata FROM checkpoints WHERE 1 = 1"
+        )
+        params: list[Any] = []
+        if config is not None:
+            query += " AND thread_id = ?"
+            params.append(config["configurable"]["thread_id"])
+            if (checkpoint_ns := config["configurable"].get("checkpoint_ns")) is not None:
+                query += " AND checkpoint_ns = ?"
+                params.append(checkpoint_ns)
+            if checkpoint_id := get_checkpoint_id(config):
+                query += " AND checkpoint_id = ?"
+                params.append(checkpoint_id)
+        if before is not None and (before_id := get_checkpoint_id(before)):
+            query += " AND checkpoint_id < ?"
+            params.append(before_id)
+        query += " ORDER BY checkpoint_id DESC"
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        remaining = limit
+        for thread_id, checkpoint_ns, *row in rows:
+            if remaining is not None and remaining <= 0:
+                break
+            metadata = self.serde.loads_typed((row[4], row[5]))
+            if filter and not all(metadata.get(k) == v for k, v in filter.items()):
+                continue
+            if remaining is not None:
+                remaining -= 1
+            yield self._to_tuple(thread_id, checkpoint_ns, row, metadata)
+
+    def _to_tuple(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        row: Sequence[Any],
+        metadata: CheckpointMetadata | None = None,
+    ) -> CheckpointTuple:
+        checkpoint_id, parent_id, type_, payload, metadata_type, metadata_payload = row
+        checkpoint: Checkpoint = self.serde.loads_typed((type_, payload))
+        with self._lock:
+            writes = self._conn.execute(
+                "SELECT task_id, idx, channel, type, value, task_path FROM writes"
+                " WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                (thread_id, checkpoint_ns, checkpoint_id),
+            ).fetchall()
+        writes.sort(key=lambda w: writes_sort_key(w[5], w[0], w[1]))
+        return CheckpointTuple(
+            config=_config(thread_id, checkpoint_ns, checkpoint_id),
+            checkpoint={
+                **checkpoint,
+                "channel_values": self._load_blobs(
+                    thread_id, checkpoint_ns, checkpoint["channel_versions"]
+                ),
+            },
+            metadata=(
+                metadata
+                if metadata is not None
+                else self.serde.loads_typed((metadata_type, metadata_payload))
+            ),
+            parent_config=_config(thread_id, checkpoint_ns, parent_id) if parent_id else None,
+            pending_writes=[
+                (task_id, channel, self.serde.loads_typed((w_type, value)))
+                for task_id, _, channel, w_type, value, _ in writes
+            ],
+        )
+
+    def _load_blobs(
+        self, thread_id: str, checkpoint_ns: str, versions: ChannelVersions
+    ) -> dict[str, Any]:
+        if not versions:
+            return {}
+        clauses = " OR ".join(["(channel = ? AND version = ?)"] * len(versions))
+        params: list[Any] = [thread_id, checkpoint_ns]
+        for channel, version in versions.items():
+            params.extend((channel, str(version)))
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT channel, type, blob FROM blobs"
+                f" WHERE thread_id = ? AND checkpoint_ns = ? AND ({clauses})",
+                params,
+            ).fetchall()
+        return {
+            channel: self.serde.loads_typed((type_, blob))
+            for channel, type_, blob in rows
+            if type_ != "empty"
+        }
+
+    # ── 저장 ──────────────────────────────────────────────────
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """checkpoint를 저장한다. 채널 값은 new_versions에 포함된(값이 바뀐) 채널만 기록한다."""
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        c = checkpoint.copy()
+        values: dict[str, Any] = c.pop("channel_values")  # type: ignore[misc]
+        blobs = [
+            (
+                thread_id,
+                checkpoint_ns,
+                channel,
+                str(version),
+                *(self.serde.dumps_typed(values[channel]) if channel in values else ("empty", b"")),
+            )
+            for channel, version in new_versions.items()
+        ]
+        type_, payload = self.serde.dumps_typed(c)
+        metadata_type, metadata_payload = self.serde.dumps_typed(
+            get_checkpoint_metadata(config, metadata)
+        )
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO blobs"
+                " (thread_id, checkpoint_ns, channel, version, type, blob)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                blobs,
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO checkpoints"
+                " (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id,"
+                " type, checkpoint, metadata_type, metadata)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint["id"],
+                    config["configurable"].get("checkpoint_id"),
+                    type_,
+                    payload,
+                    metadata_type,
+                    metadata_payload,
+                ),
+            )
+        return _config(thread_id, checkpoint_ns, checkpoint["id"])
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        rows = [
+            (
+                thread_id,
+                checkpoint_ns,
+                checkpoint_id,
+                task_id,
+                WRITES_IDX_MAP.get(channel, idx),
+                channel,
+                *self.serde.dumps_typed(value),
+                task_path,
+            )
+            for idx, (channel, value) in enumerate(writes)
+        ]
+        # 일반 write는 최초 기록을 유지하고, 특수 채널(음수 idx)은 덮어쓴다 (InMemorySaver와 동일).
+        regular = [row for row in rows if row[4] >= 0]
+        special = [row for row in rows if row[4] < 0]
+        columns = (
+            " INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx,"
+            " channel, type, value, task_path) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+        )
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR IGNORE" + columns, regular)
+            self._conn.executemany("INSERT OR REPLACE" + columns, special)
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock, self._conn:
+            for table in ("checkpoints", "blobs", "writes"):
+                self._conn.execute(f"DELETE FROM {table} WHERE thread_id = ?", (thread_id,))
+
+    # ── async — 로컬 파일 I/O를 worker thread에서 수행해 이벤트 루프를 막지 않는다 ──
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        items = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for item in items:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+
+def _config(thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> RunnableConfig:
+    return {
+        "configurable": {
+            "thread_id": thread_id,
+            "checkpoint_ns": checkpoint_ns,
+            "checkpoint_id": checkpoint_id,
+        }
+    }
+
+
+def session_config(session_id: str) -> RunnableConfig:
+    """graph.invoke/stream에 전달할 config. metadata.session_id를 checkpointer thread_id로 쓴다."""
+    return {"configurable": {"thread_id": session_id}}
+
+
+@lru_cache
+def get_checkpointer() -> BaseCheckpointSaver | None:
+    """settings.checkpointer_backend에 맞는 checkpointer 싱글턴을 반환한다. none이면 None."""
+    settings = get_settings()
+    backend = settings.checkpointer_backend
+    if backend == "none":
+        return None
+    if backend == "memory":
+        return InMemorySaver(serde=ZstdMsgpackSerializer())
+    if backend == "sqlite":
+        return SQLiteCheckpointSaver(
+            settings.checkpointer_sqlite_path, serde=ZstdMsgpackSerializer()
+        )
+    raise ValueError(f"지원하지 않는 checkpointer_backend: {backend}")
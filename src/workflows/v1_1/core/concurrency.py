@@ -0,0 +1,184 @@
+# 독립 작업 fan-out 유틸리티 — 동시 실행 수 제한, 작업별 timeout, 등록 순서 보존
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Awaitable, Callable
+
+
+class FailurePolicy(str, Enum):
+    """fan-out 작업 중 하나가 실패했을 때의 처리 방식."""
+
+    FAIL_FAST = "fail_fast"  # 첫 실패에서 나머지 작업을 취소하고 오류를 전파
+    DEGRADE = "degrade"  # 실패한 작업만 결과에서 제외하고 계속 진행
+
+
+@dataclass
+class TaskOutcome:
+    """fan-out 작업 한 건의 실행 결과."""
+
+    name: str
+    value: Any = None
+    error: BaseException | None = None
+    done: bool = False
+
+
+def run_bounded(
+    tasks: list[tuple[str, Callable[[], Any]]],
+    *,
+    max_concurrency: int = 1,
+    timeout: float | None = None,
+    fail_fast: bool = True,
+) -> list[TaskOutcome]:
+    """(이름, 호출 함수) 목록을 제한된 동시성으로 실행하고 등록 순서대로 결과를 반환한다.
+
+    Args:
+        tasks: 실행할 (이름, 인자 없는 호출 함수) 목록.
+        max_concurrency: 동시에 실행할 최대 작업 수. 1 이하이면 순차 실행한다.
+        timeout: 작업별 timeout(초). 작업이 실제로 시작된 시점부터 측정한다.
+        fail_fast: True이면 첫 실패 시 아직 시작되지 않은 작업을 취소하고 즉시 반환한다.
+
+    Returns:
+        tasks와 같은 순서의 TaskOutcome 목록. 취소된 작업은 done=False로 남는다.
+    """
+    outcomes = [TaskOutcome(name=name) for name, _ in tasks]
+    if not tasks:
+        return outcomes
+
+    if max_concurrency <= 1 and timeout is None:
+        for outcome, (_, fn) in zip(outcomes, tasks):
+            try:
+                outcome.value = fn()
+            except Exception as exc:
+                outcome.error = exc
+            outcome.done = True
+            if outcome.error is not None and fail_fast:
+                break
+        return outcomes
+
+    started_at: list[float | None] = [None] * len(tasks)
+
+    def _timed(index: int, fn: Callable[[], Any]) -> Any:
+        started_at[index] = time.monotonic()
+        return fn()
+
+    pool = ThreadPoolExecutor(
+        max_workers=max(1, min(max_concurrency, len(tasks))),
+        thread_name_prefix="fan-out",
+    )
+    try:
+        # 작업 스레드에서도 structlog contextvars 등 호출자 컨텍스트가 유지되도록 복사한다.
+        futures: dict[Future, int] = {
+            pool.submit(contextvars.copy_context().run, _timed, i, fn): i
+            for i, (_, fn) in enumerate(tasks)
+        }
+        pending = set(futures)
+        while pending:
+            wait_for = _next_wait(pending, futures, started_at, timeout)
+            done, pending = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+
+            failed = False
+            for future in done:
+                outcome = outcomes[futures[future]]
+                try:
+                    outcome.value = future.result()
+                except Exception as exc:
+                    outcome.error = exc
+                    failed = True
+                outcome.done = True
+
+            if timeout is not None:
+                now = time.monotonic()
+                for future in list(pending):
+                    index = futures[future]
+                    start = started_at[index]
+                    if start is not None and now - start >= timeout:
+                        future.cancel()
+                        pending.discard(future)
+                        outcomes[index].error = TimeoutError(
+                            f"{outcomes[index].name}: {timeout}s timeout 초과"
+                        )
+                        outcomes[index].done = True
+                        failed = True
+
+            if failed and fail_fast:
+                break
+    finally:
+        # timeout된 작업의 스레드는 기다리지 않는다 (결과는 이미 버려졌다).
+        pool.shutdown(wait=False, cancel_futures=True)
+    return outcomes
+
+
+async def arun_bounded(
+    tasks: list[tuple[str, Callable[[], Awaitable[Any]]]],
+    *,
+    max_concurrency: int = 1,
+    timeout: float | None = None,
+    fail_fast: bool = True,
+) -> list[TaskOutcome]:
+    """run_bounded의 async 버전. 작업은 이벤트 루프 위에서 coroutine으로 실행된다.
+
+    timeout은 semaphore를 획득해 작업이 실제로 시작된 시점부터 측정한다.
+    fail_fast이면 첫 실패 시 실행 중/대기 중인 나머지 작업을 cancel한다.
+    """
+    outcomes = [TaskOutcome(name=name) for name, _ in tasks]
+    if not tasks:
+        return outcomes
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _guarded(outcome: TaskOutcome, fn: Callable[[], Awaitable[Any]]) -> None:
+        async with semaphore:
+            try:
+                if timeout is None:
+                    outcome.value = await fn()
+                else:
+                    outcome.value = await asyncio.wait_for(fn(), timeout)
+            except asyncio.TimeoutError:
+                outcome.error = TimeoutError(f"{outcome.name}: {timeout}s timeout 초과")
+            except Exception as exc:
+                outcome.error = exc
+            outcome.done = True
+            if outcome.error is not None and fail_fast:
+                raise _FailFast()
+
+    running = [
+        asyncio.ensure_future(_guarded(outcome, fn))
+        for outcome, (_, fn) in zip(outcomes, tasks)
+    ]
+    try:
+        await asyncio.gather(*running)
+    except _FailFast:
+        pass
+    finally:
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+    return outcomes
+
+
+class _FailFast(Exception):
+    """arun_bounded 내부에서 fail_fast 중단을 알리는 신호."""
+
+
+def _next_wait(
+    pending: set[Future],
+    futures: dict[Future, int],
+    started_at: list[float | None],
+    timeout: float | None,
+) -> float | None:
+    """다음 timeout 검사까지 대기할 시간을 계산한다."""
+    if timeout is None:
+        return None
+    deadlines = [
+        started_at[futures[f]] + timeout
+        for f in pending
+        if started_at[futures[f]] is not None
+    ]
+    if not deadlines:
+        return timeout
+    return max(0.0, min(deadlines) - time.monotonic())
@@ -0,0 +1,170 @@
+# LLM 프롬프트 context 조립 — 중복 chunk 제거 후 token 예산 안으로 우선순위대로 채운다
+# - near-duplicate 판정: 문자 shingle의 MinHash 서명 일치율(추정 Jaccard)이 threshold 이상
+# - 우선순위: tool 결과 → 이번 턴 retrieval(retriever별 순위 round-robin) → 이전 노드/턴에서 넘어온 context
+# - token 수는 tiktoken으로 센다. encoding을 불러올 수 없으면(오프라인 등) byte 길이로 보수적으로 추정한다.
+from __future__ import annotations
+
+import zlib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+
+from config.settings import get_settings
+from core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_MINHASH_PRIME = (1 << 31) - 1
+
+
+@lru_cache
+def _get_encoder() -> Any | None:
+    try:
+        import tiktoken
+
+        try:
+            return tiktoken.encoding_for_model(get_settings().openai_model_name)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as exc:
+        logger.warning("token_encoder_unavailable", error=str(exc))
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """text의 token 수. encoder가 없으면 UTF-8 3바이트당 1 token으로 추정한다 (한글 기준 보수적)."""
+    encoder = _get_encoder()
+    if encoder is not None:
+        return len(encoder.encode(text, disallowed_special=()))
+    return (len(text.encode("utf-8")) + 2) // 3
+
+
+@lru_cache
+def _minhash_params(num_perm: int) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed=0x5EED)
+    a = rng.integers(1, _MINHASH_PRIME, size=num_perm, dtype=np.uint64)
+    b = rng.integers(0, _MINHASH_PRIME, size=num_perm, dtype=np.uint64)
+    return a, b
+
+
+def minhash_signature(text: str, num_perm: int = 64, shingle_size: int = 5) -> np.ndarray:
+    """공백/대소문자를 정규화한 문자 shingle 집합의 MinHash 서명."""
+    normalized = " ".join(text.lower().split())
+    if len(normalized) <= shingle_size:
+        shingles = {normalized}
+    else:
+        shingles = {
+            normalized[i : i + shingle_size] for i in range(len(normalized) - shingle_size + 1)
+        }
+    hashes = np.fromiter(
+        (zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles)
+    )
+    a, b = _minhash_params(num_perm)
+    return ((np.outer(hashes, a) + b) % _MINHASH_PRIME).min(axis=0)
+
+
+@dataclass
+class ContextPack:
+    """context 조립 결과. items/tool_results는 우선순위 순서다."""
+
+    items: list[str]
+    tool_results: list[Any]
+    tokens_before: int
+    tokens_after: int
+    duplicates_removed: int
+    dropped: int
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.tokens_before - self.tokens_after
+
+
+class ContextAssembler:
+    """context chunk를 중복 제거 후 token 예산 안으로 채운다.
+
+    budget_tokens가 None이면 예산 제한 없이 중복 제거만 한다.
+    dedup_threshold가 1.0 이상이면 정규화 후 완전히 같은 chunk만 제거한다.
+    """
+
+    def __init__(
+        self,
+        budget_tokens: int | None = None,
+        dedup_threshold: float = 0.85,
+        num_perm: int = 64,
+        shingle_size: int = 5,
+    ) -> None:
+        self._budget = budget_tokens
+        self._threshold = dedup_threshold
+        self._num_perm = num_perm
+        self._shingle_size = shingle_size
+
+    @classmethod
+    def from_settings(cls) -> ContextAssembler:
+        settings = get_settings()
+        return cls(
+            budget_tokens=settings.context_token_budget,
+            dedup_threshold=settings.context_dedup_threshold,
+        )
+
+    def assemble(
+        self,
+        context_items: list[str],
+        tool_results: list[Any] | None = None,
+        carried: int = 0,
+    ) -> ContextPack:
+        """context_items의 앞 carried개는 이전 노드/턴에서 넘어온 항목으로 보고 가장 낮은 우선순위를 준다."""
+        tool_results = tool_results or []
+        candidates: list[tuple[str, Any, str]] = [("tool", r, str(r)) for r in tool_results]
+        candidates += [("context", t, t) for t in context_items[carried:]]
+        candidates += [("context", t, t) for t in context_items[:carried]]
+
+        tokens = [count_tokens(text) for _, _, text in candidates]
+        tokens_before = sum(tokens)
+
+        kept: list[tuple[str, Any]] = []
+        signatures: list[np.ndarray] = []
+        seen: set[str] = set()
+        used = duplicates = dropped = 0
+        for (kind, value, text), cost in zip(candidates, tokens):
+            if not text.strip():
+                continue
+            normalized = " ".join(text.lower().split())
+            signature = None
+            if normalized in seen:
+                duplicates += 1
+                continue
+            if self._threshold < 1.0:
+                signature = minhash_signature(text, self._num_perm, self._shingle_size)
+                if any(np.mean(signature == other) >= self._threshold for other in signatures):
+                    duplicates += 1
+                    continue
+            if self._budget is not None and used + cost > self._budget:
+                # 더 작은 하위 chunk가 남은 예산에 들어갈 수 있으므로 계속 진행한다.
+                dropped += 1
+                continue
+            seen.add(normalized)
+            if signature is not None:
+                signatures.append(signature)
+            kept.append((kind, value))
+            used += cost
+
+        pack = ContextPack(
+            items=[value for kind, value in kept if kind == "context"],
+            tool_results=[value for kind, value in kept if kind == "tool"],
+            tokens_before=tokens_before,
+            tokens_after=used,
+            duplicates_removed=duplicates,
+            dropped=dropped,
+        )
+        logger.info(
+            "context_assembled",
+            tokens_before=pack.tokens_before,
+            tokens_after=pack.tokens_after,
+            tokens_saved=pack.tokens_saved,
+            duplicates_removed=pack.duplicates_removed,
+            dropped=pack.dropped,
+            budget=self._budget,
+        )
+        return pack
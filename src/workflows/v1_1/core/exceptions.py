@@ -29,6 +29,10 @@ class AgentExecutionError(MultiAgentBaseError):
     """Agent 실행 중 오류 발생 시."""
 
 
+class LLMDeadlineExceeded(MultiAgentBaseError, TimeoutError):
+    """LLM 호출이 재시도를 포함해 deadline 안에 끝나지 않았을 때 (core/resilience.py)."""
+
+
 class RAGRetrievalError(MultiAgentBaseError):
     """RAG 검색 실패 시 발생."""
 
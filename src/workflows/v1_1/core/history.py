@@ -0,0 +1,124 @@
+# GraphState.messages용 bounded history reducer — 최근 N턴만 원문으로 유지하고 나머지는 요약 메시지로 접는다
+# - 턴은 HumanMessage 하나와 그 뒤의 응답 메시지들로 본다.
+# - 접힌 턴은 "생략 표시 + 최근 대화 발췌"로 된 요약 SystemMessage 하나로 대체되어 state 크기가 바로 제한된다.
+# - reducer는 순수 함수다. LLM 호출이나 background 작업 없이, 같은 입력이면 항상 같은 요약을 만든다.
+from __future__ import annotations
+
+import re
+
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+
+from config.settings import get_settings
+from core.logging import get_logger
+
+logger = get_logger(__name__)
+
+SUMMARY_NAME = "history_summary"
+_ROLE_LABELS = {"human": "사용자", "ai": "어시스턴트"}
+_ELLIPSIS = "…"
+# 긴 발화를 자를 때 시작점으로 삼는 문장 경계 (없으면 공백 경계)
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?。])\s+")
+_WORD_BOUNDARY = re.compile(r"\s+")
+
+
+def is_summary(message: BaseMessage) -> bool:
+    return isinstance(message, SystemMessage) and message.name == SUMMARY_NAME
+
+
+def render_history(messages: list[BaseMessage]) -> list[str]:
+    """사용자/어시스턴트 메시지를 요약 발췌용 줄로 변환한다."""
+    lines = []
+    for message in messages:
+        label = _ROLE_LABELS.get(message.type)
+        if label and isinstance(message.content, str) and message.content:
+            lines.append(f"{label}: {message.content}")
+    return lines
+
+
+def _marker(folded: int) -> str:
+    return f"[이전 대화 {folded}개 메시지 생략 — 최근 내용 발췌]"
+
+
+def _tail(line: str, max_chars: int) -> str:
+    """line의 뒷부분을 max_chars 이내로 남기되, 문장(없으면 단어) 중간에서 시작하지 않게 한다."""
+    if len(line) <= max_chars:
+        return line
+    budget = max_chars - len(_ELLIPSIS)
+    if budget <= 0:
+        return ""
+    window = line[-budget:]
+    for boundary in (_SENTENCE_BOUNDARY, _WORD_BOUNDARY):
+        found = boundary.search(window)
+        if found is not None and found.end() < len(window):
+            return _ELLIPSIS + window[found.end():]
+    return ""
+
+
+def _excerpt(lines: list[str], max_chars: int) -> list[str]:
+    """최근 줄부터 max_chars 안에 들어가는 만큼만 온전한 줄로 남긴다."""
+    kept: list[str] = []
+    used = 0
+    for line in reversed(lines):
+        cost = len(line) + (1 if kept else 0)
+        if used + cost > max_chars:
+            if not kept:
+                # 가장 최근 줄 하나가 예산보다 길면 문장 경계에서 잘라 뒷부분만 남긴다.
+                tail = _tail(line, max_chars)
+                if tail:
+                    kept.append(tail)
+            break
+        kept.append(line)
+        used += cost
+    return kept[::-1]
+
+
+def _fold(
+    summary: SystemMessage | None, older: list[BaseMessage], max_chars: int
+) -> SystemMessage:
+    """이전 요약과 접힐 턴을 합쳐 새 요약 메시지를 만든다."""
+    folded = len(older)
+    lines: list[str] = []
+    if summary is not None:
+        folded += summary.additional_kwargs.get("folded_messages", 0)
+        # 첫 줄은 이전 생략 표시이므로 발췌 줄만 이어받는다.
+        lines.extend(summary.content.split("\n")[1:])
+    lines.extend(render_history(older))
+
+    marker = _marker(folded)
+    excerpt = _excerpt(lines, max_chars - len(marker) - 1)
+    return SystemMessage(
+        content="\n".join([marker, *excerpt]),
+        name=SUMMARY_NAME,
+        additional_kwargs={"folded_messages": folded},
+    )
+
+
+def bounded_messages(left: list, right: list) -> list:
+    """GraphState.messages reducer.
+
+    operator.add처럼 메시지를 이어 붙이되, history_max_turns를 넘는 오래된 턴은
+    맨 앞의 요약 SystemMessage 하나로 접는다. history_max_turns가 None이면 operator.add와 같다.
+    """
+    merged = list(left) + list(right)
+    settings = get_settings()
+    max_turns = settings.history_max_turns
+    if max_turns is None:
+        return merged
+
+    summary: SystemMessage | None = None
+    body: list[BaseMessage] = []
+    for message in merged:
+        if is_summary(message):
+            summary = message
+        else:
+            body.append(message)
+
+    turn_starts = [i for i, message in enumerate(body) if isinstance(message, HumanMessage)]
+    if len(turn_starts) <= max_turns:
+        return merged
+
+    cut = turn_starts[-max_turns] if max_turns > 0 else len(body)
+    older, body = body[:cut], body[cut:]
+    summary = _fold(summary, older, settings.history_summary_max_chars)
+    logger.info("history_folded", folded_messages=len(older), kept_turns=max_turns)
+    return [summary, *body]
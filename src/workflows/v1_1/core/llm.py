@@ -1,40 +1,395 @@
 # LLM 인스턴스 생성 및 관리 — 동일 설정으로 중복 생성 방지
+# - 노드별 LLM 프로필(settings.llm_profiles)마다 chat model을 하나씩 캐시한다. 설정이 같은 프로필은 공유한다.
+# - chat/embedding 모델은 이 모듈이 만든 sync/async httpx client(연결 풀, keep-alive, HTTP/2, timeout)를 공유한다.
+# - bind_tools/bind 결과는 tool 목록과 호출 옵션(response_format 등)의 fingerprint별로 재사용한다.
+# - 호출마다 core/resilience.py의 deadline/재시도/hedging을 적용한다 (SDK 자체 재시도는 끈다).
 from __future__ import annotations
 
+import json
+import threading
+import time
 from functools import lru_cache
-from typing import Any
+from typing import Any, AsyncIterator, Iterator
 
-from langchain_core.messages import BaseMessage
+try:
+    # openai SDK 3.x는 httpx2 위에서 동작한다. SDK와 같은 라이브러리의 client를 넘겨야 호환 계층을 거치지 않는다.
+    import httpx2 as httpx
+except ImportError:
+    import httpx
+from langchain_core.messages import AIMessageChunk, BaseMessage, BaseMessageChunk
 from langchain_core.language_models import BaseChatModel
-from langchain_openai import ChatOpenAI
+from langchain_core.runnables import Runnable
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 
-from config.settings import get_settings
+from config.settings import LLMProfile, get_settings
+from core.llm_cache import get_llm_cache, make_cache_key, tools_fingerprint
+from core.logging import get_logger
+from core.metrics import LLM_SECONDS, record_llm_usage
+from core.resilience import aopen_stream, arun_resilient, open_stream, run_resilient
+from core.tracing import SPAN_KIND_CLIENT, start_span
+
+logger = get_logger(__name__)
+
+# 프로필을 지정하지 않은 호출이 사용하는 이름 (settings.llm_profiles에 없으면 openai_* 기본값)
+DEFAULT_LLM_PROFILE = "default"
 
 
 @lru_cache
-def get_llm() -> ChatOpenAI:
+def _http2_enabled() -> bool:
+    """settings.openai_http2가 켜져 있고 h2 패키지가 설치되어 있으면 True."""
+    if not get_settings().openai_http2:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        logger.warning("llm_http2_unavailable", reason="h2 패키지가 없어 HTTP/1.1을 사용합니다")
+        return False
+    return True
+
+
+def http_timeout() -> httpx.Timeout:
+    settings = get_settings()
+    return httpx.Timeout(
+        connect=settings.openai_connect_timeout_seconds,
+        read=settings.openai_read_timeout_seconds,
+        write=settings.openai_write_timeout_seconds,
+        pool=settings.openai_pool_timeout_seconds,
+    )
+
+
+def request_timeout(remaining: float | None) -> httpx.Timeout:
+    """http_timeout()의 각 항목을 남은 deadline(초) 이하로 줄인다. sync 호출의 deadline은 이 timeout으로 강제한다."""
+    base = http_timeout()
+    if remaining is None:
+        return base
+
+    def _cap(value: float | None) -> float:
+        return remaining if value is None else min(value, remaining)
+
+    return httpx.Timeout(
+        connect=_cap(base.connect), read=_cap(base.read), write=_cap(base.write), pool=_cap(base.pool)
+    )
+
+
+def _client_options() -> dict[str, Any]:
+    settings = get_settings()
+    return {
+        "limits": httpx.Limits(
+            max_connections=settings.openai_http_max_connections,
+            max_keepalive_connections=settings.openai_http_max_keepalive_connections,
+            keepalive_expiry=settings.openai_http_keepalive_expiry_seconds,
+        ),
+        "timeout": http_timeout(),
+        "http2": _http2_enabled(),
+    }
+
+
+@lru_cache
+def get_http_client() -> httpx.Client:
+    """chat/embedding 모델이 공유하는 동기 HTTP client (프로세스당 1개)."""
+    return httpx.Client(**_client_options())
+
+
+@lru_cache
+def get_async_http_client() -> httpx.AsyncClient:
+    """chat/embedding 모델이 공유하는 async HTTP client.
+
+    연결 풀은 처음 사용한 이벤트 루프에 묶이므로 서비스는 하나의 이벤트 루프에서 사용해야 한다.
+    """
+    return httpx.AsyncClient(**_client_options())
+
+
+@lru_cache(maxsize=None)
+def _create_llm(profile: LLMProfile) -> ChatOpenAI:
     settings = get_settings()
     return ChatOpenAI(
         api_key=settings.openai_api_key,
-        model=settings.openai_model_name,
-        temperature=settings.openai_temperature,
+        model=profile.model,
+        temperature=profile.temperature,
+        max_tokens=profile.max_tokens,
+        # 스트리밍 응답에도 usage_metadata(token 수)가 포함되도록 한다.
+        stream_usage=True,
+        http_client=get_http_client(),
+        http_async_client=get_async_http_client(),
+        # openai SDK는 요청마다 자체 timeout(기본 600초)을 넘기므로 같은 값을 명시한다.
+        timeout=http_timeout(),
+        # 재시도는 core/resilience.py가 deadline 안에서 수행한다.
+        max_retries=0,
+    )
+
+
+def get_llm(profile: str = DEFAULT_LLM_PROFILE) -> ChatOpenAI:
+    """profile 이름의 chat model을 반환한다 (model/temperature/max_tokens 조합별로 1개)."""
+    return _create_llm(get_settings().llm_profile(profile))
+
+
+@lru_cache
+def get_embeddings() -> OpenAIEmbeddings:
+    settings = get_settings()
+    return OpenAIEmbeddings(
+        api_key=settings.openai_api_key,
+        model=settings.openai_embedding_model,
+        http_client=get_http_client(),
+        http_async_client=get_async_http_client(),
+        timeout=http_timeout(),
+    )
+
+
+# (모델 id, bind fingerprint) -> (bind에 사용한 모델, bind_tools/bind 결과)
+_bound_models: dict[tuple[int, str], tuple[BaseChatModel, Runnable]] = {}
+_bound_lock = threading.Lock()
+_MAX_BOUND_MODELS = 128
+
+
+def _bind_fingerprint(tools: list[Any] | None, options: dict[str, Any] | None) -> str:
+    """tool 목록과 호출 옵션을 합친 fingerprint — bind 결과 재사용과 응답 캐시 키에 쓴다."""
+    tools_fp = tools_fingerprint(tools)
+    if not options:
+        return tools_fp
+    return f"{tools_fp}|{json.dumps(options, sort_keys=True, ensure_ascii=False, default=str)}"
+
+
+def _bound(
+    llm: BaseChatModel,
+    tools: list[Any] | None,
+    options: dict[str, Any] | None,
+    bind_fp: str,
+) -> Runnable:
+    """tool 목록/호출 옵션이 있으면 bind_tools(또는 bind) 결과를 fingerprint별로 재사용해 반환한다.
+
+    bind_tools는 호출마다 tool schema를 변환하고 새 runnable을 만들기 때문에 매 호출에서 반복하지 않는다.
+    """
+    if not tools and not options:
+        return llm
+    with _bound_lock:
+        cached = _bound_models.get((id(llm), bind_fp))
+    if cached is not None and cached[0] is llm:
+        return cached[1]
+    bound = llm.bind_tools(tools, **(options or {})) if tools else llm.bind(**options)
+    with _bound_lock:
+        if len(_bound_models) >= _MAX_BOUND_MODELS:
+            _bound_models.clear()
+        _bound_models[(id(llm), bind_fp)] = (llm, bound)
+    return bound
+
+
+def _cache_key(messages: list[BaseMessage], bind_fp: str, profile: LLMProfile) -> str | None:
+    """응답 캐시를 사용할 수 있으면 캐시 키를, 아니면 None을 반환한다.
+
+    temperature가 0이 아니면 같은 입력이라도 응답이 달라야 하므로 캐시하지 않는다.
+    max_tokens가 다르면 잘린 응답이 섞이지 않도록 bind fingerprint와 함께 키에 넣는다.
+    """
+    if profile.temperature != 0 or get_llm_cache() is None:
+        return None
+    return make_cache_key(
+        profile.model,
+        profile.temperature,
+        bind_fp if profile.max_tokens is None else f"{bind_fp}|max_tokens={profile.max_tokens}",
+        messages,
+    )
+
+
+def _target(profile: LLMProfile, kind: str) -> str:
+    """지연 분포/재시도 메트릭을 구분하는 이름 — kind는 complete(응답 전체) 또는 first_token(stream 첫 chunk)."""
+    return f"{profile.model}/{kind}"
+
+
+def _llm_span(mode: str, profile: LLMProfile, name: str):
+    """LLM 호출 1회에 대한 span (OTel GenAI 속성 이름을 따른다).
+
+    stream 함수는 generator라 yield 사이에 호출자 코드가 실행되므로 현재 span으로 설정하지 않는다.
+    """
+    return start_span(
+        f"chat {profile.model}",
+        {
+            "gen_ai.operation.name": "chat",
+            "gen_ai.request.model": profile.model,
+            "gen_ai.request.max_tokens": profile.max_tokens,
+            "llm.mode": mode,
+            "llm.profile": name,
+        },
+        SPAN_KIND_CLIENT,
+        activate=mode in ("invoke", "ainvoke"),
     )
 
 
+def _observe(
+    span, started: float, mode: str, model: str, key: str | None, hit: bool, message=None
+) -> None:
+    """LLM 호출 시간과 token 수를 core/metrics.py와 현재 span에 기록한다."""
+    cache = "none" if key is None else "hit" if hit else "miss"
+    LLM_SECONDS.observe(time.perf_counter() - started, model=model, mode=mode, cache=cache)
+    span.set_attribute("llm.cache", cache)
+    if message is not None and not hit:
+        record_llm_usage(model, message)
+        usage = getattr(message, "usage_metadata", None) or {}
+        span.set_attribute("gen_ai.usage.input_tokens", usage.get("input_tokens"))
+        span.set_attribute("gen_ai.usage.output_tokens", usage.get("output_tokens"))
+
+
 def call_llm(
     messages: list[BaseMessage],
     tools: list[Any] | None = None,
+    profile: str = DEFAULT_LLM_PROFILE,
+    options: dict[str, Any] | None = None,
 ) -> BaseMessage:
     """LLM을 호출하고 응답 메시지를 반환한다.
 
+    응답 캐시가 켜져 있으면 동일한 요청은 LLM 호출 없이 캐시된 응답을 반환한다.
+
     Args:
         messages: LLM에 전달할 메시지 목록.
         tools: bind_tools에 전달할 tool 목록. None이면 tool 없이 호출한다.
+        profile: settings.llm_profiles의 프로필 이름 (model/temperature/max_tokens).
+        options: bind에 함께 넘길 호출 옵션 (예: response_format, logprobs, max_tokens).
 
     Returns:
         LLM 응답 BaseMessage.
     """
-    llm: BaseChatModel = get_llm()
-    if tools:
-        llm = llm.bind_tools(tools)
-    return llm.invoke(messages)
+    resolved = get_settings().llm_profile(profile)
+    with _llm_span("invoke", resolved, profile) as span:
+        started = time.perf_counter()
+        bind_fp = _bind_fingerprint(tools, options)
+        key = _cache_key(messages, bind_fp, resolved)
+        if key is not None:
+            cached = get_llm_cache().lookup(key)
+            if cached is not None:
+                _observe(span, started, "invoke", resolved.model, key, hit=True)
+                return cached
+
+        llm = _bound(get_llm(profile), tools, options, bind_fp)
+        response = run_resilient(
+            lambda remaining: llm.invoke(messages, timeout=request_timeout(remaining)),
+            _target(resolved, "complete"),
+        )
+        _observe(span, started, "invoke", resolved.model, key, hit=False, message=response)
+
+        if key is not None:
+            get_llm_cache().update(key, response)
+        return response
+
+
+async def acall_llm(
+    messages: list[BaseMessage],
+    tools: list[Any] | None = None,
+    profile: str = DEFAULT_LLM_PROFILE,
+    options: dict[str, Any] | None = None,
+) -> BaseMessage:
+    """call_llm의 async 버전. 이벤트 루프를 막지 않도록 ainvoke로 호출한다."""
+    resolved = get_settings().llm_profile(profile)
+    with _llm_span("ainvoke", resolved, profile) as span:
+        started = time.perf_counter()
+        bind_fp = _bind_fingerprint(tools, options)
+        key = _cache_key(messages, bind_fp, resolved)
+        if key is not None:
+            cached = get_llm_cache().lookup(key)
+            if cached is not None:
+                _observe(span, started, "ainvoke", resolved.model, key, hit=True)
+                return cached
+
+        llm = _bound(get_llm(profile), tools, options, bind_fp)
+        response = await arun_resilient(
+            lambda: llm.ainvoke(messages), _target(resolved, "complete")
+        )
+        _observe(span, started, "ainvoke", resolved.model, key, hit=False, message=response)
+
+        if key is not None:
+            get_llm_cache().update(key, response)
+        return response
+
+
+def _merge_chunks(chunks: list[BaseMessageChunk]) -> BaseMessageChunk | None:
+    """stream chunk들을 마지막에 한 번에 합친다.
+
+    chunk마다 `merged + chunk`로 누적하면 content와 metadata를 매번 복사해 token 수에 대해 O(n²)이다.
+    chunk 객체는 langchain의 astream/stream도 on_llm_end까지 들고 있으므로 모아 두는 추가 비용은 없다.
+    """
+    if not chunks:
+        return None
+    first, rest = chunks[0], chunks[1:]
+    return first + rest if rest else first
+
+
+def stream_llm(
+    messages: list[BaseMessage],
+    tools: list[Any] | None = None,
+    profile: str = DEFAULT_LLM_PROFILE,
+    options: dict[str, Any] | None = None,
+) -> Iterator[BaseMessageChunk]:
+    """LLM 응답을 토큰 chunk 단위로 yield한다.
+
+    그래프 노드 안에서 호출되면 각 chunk가 LangGraph stream_mode="messages"로 전달된다.
+    캐시 적중 시에는 캐시된 응답 전체를 chunk 하나로 yield한다.
+    """
+    resolved = get_settings().llm_profile(profile)
+    with _llm_span("stream", resolved, profile) as span:
+        started = time.perf_counter()
+        bind_fp = _bind_fingerprint(tools, options)
+        key = _cache_key(messages, bind_fp, resolved)
+        if key is not None:
+            cached = get_llm_cache().lookup(key)
+            if cached is not None:
+                _observe(span, started, "stream", resolved.model, key, hit=True)
+                yield AIMessageChunk(content=cached.content)
+                return
+
+        llm = _bound(get_llm(profile), tools, options, bind_fp)
+        chunks: list[BaseMessageChunk] = []
+        try:
+            first, rest = open_stream(
+                lambda remaining: iter(llm.stream(messages, timeout=request_timeout(remaining))),
+                _target(resolved, "first_token"),
+            )
+            if first is not None:
+                chunks.append(first)
+                yield first
+                for chunk in rest:
+                    chunks.append(chunk)
+                    yield chunk
+        finally:
+            # 소비자가 중간에 멈춰도 그때까지의 시간/usage를 기록한다.
+            merged = _merge_chunks(chunks)
+            _observe(span, started, "stream", resolved.model, key, hit=False, message=merged)
+
+        if key is not None and merged is not None:
+            get_llm_cache().update(key, merged)
+
+
+async def astream_llm(
+    messages: list[BaseMessage],
+    tools: list[Any] | None = None,
+    profile: str = DEFAULT_LLM_PROFILE,
+    options: dict[str, Any] | None = None,
+) -> AsyncIterator[BaseMessageChunk]:
+    """stream_llm의 async 버전."""
+    resolved = get_settings().llm_profile(profile)
+    with _llm_span("astream", resolved, profile) as span:
+        started = time.perf_counter()
+        bind_fp = _bind_fingerprint(tools, options)
+        key = _cache_key(messages, bind_fp, resolved)
+        if key is not None:
+            cached = get_llm_cache().lookup(key)
+            if cached is not None:
+                _observe(span, started, "astream", resolved.model, key, hit=True)
+                yield AIMessageChunk(content=cached.content)
+                return
+
+        llm = _bound(get_llm(profile), tools, options, bind_fp)
+        chunks: list[BaseMessageChunk] = []
+        try:
+            first, rest = await aopen_stream(
+                lambda: llm.astream(messages), _target(resolved, "first_token")
+            )
+            if first is not None:
+                chunks.append(first)
+                yield first
+                async for chunk in rest:
+                    chunks.append(chunk)
+                    yield chunk
+        finally:
+            # 소비자가 중간에 멈춰도 그때까지의 시간/usage를 기록한다.
+            merged = _merge_chunks(chunks)
+            _observe(span, started, "astream", resolved.model, key, hit=False, message=merged)
+
+        if key is not None and merged is not None:
+            get_llm_cache().update(key, merged)
@@ -0,0 +1,211 @@
+# LLM 응답 exact-match 캐시 — 동일 모델/온도/tool/메시지 조합의 응답을 재사용한다
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from langchain_core.messages import BaseMessage, messages_from_dict, messages_to_dict
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from config.settings import get_settings
+from core.stats import HitMissCounter
+
+
+# id(tool) 목록 -> (tool 객체 목록, fingerprint). tool 객체를 잡아 두므로 id가 재사용되지 않는다.
+_fingerprints: dict[tuple[int, ...], tuple[tuple[Any, ...], str]] = {}
+_MAX_FINGERPRINTS = 128
+
+
+def tools_fingerprint(tools: list[Any] | None) -> str:
+    """bind_tools에 전달되는 tool 목록을 순서를 유지한 채 안정적인 해시로 변환한다.
+
+    schema 변환 비용이 크므로 같은 tool 객체 목록의 결과는 재사용한다 (tool 정의는 불변으로 취급).
+    """
+    if not tools:
+        return ""
+    ids = tuple(id(tool) for tool in tools)
+    cached = _fingerprints.get(ids)
+    if cached is not None and all(a is b for a, b in zip(cached[0], tools)):
+        return cached[1]
+    schemas = [convert_to_openai_tool(tool) for tool in tools]
+    payload = json.dumps(schemas, sort_keys=True, ensure_ascii=False)
+    fingerprint = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    if len(_fingerprints) >= _MAX_FINGERPRINTS:
+        _fingerprints.clear()
+    _fingerprints[ids] = (tuple(tools), fingerprint)
+    return fingerprint
+
+
+def make_cache_key(
+    model: str,
+    temperature: float,
+    tools_fp: str,
+    messages: list[BaseMessage],
+) -> str:
+    """캐시 키를 만든다. 메시지는 id/metadata를 제외한 역할·내용만으로 정규화한다."""
+    normalized = [
+        {
+            "type": message.type,
+            "content": message.content,
+            "name": getattr(message, "name", None),
+            "tool_calls": getattr(message, "tool_calls", None) or None,
+            "tool_call_id": getattr(message, "tool_call_id", None),
+        }
+        for message in messages
+    ]
+    payload = json.dumps(
+        {
+            "model": model,
+            "temperature": temperature,
+            "tools": tools_fp,
+            "messages": normalized,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _dumps(message: BaseMessage) -> str:
+    return json.dumps(messages_to_dict([message]), ensure_ascii=False)
+
+
+def _loads(payload: str) -> BaseMessage:
+    return messages_from_dict(json.loads(payload))[0]
+
+
+class BaseLLMCache(ABC):
+    """LLM 응답 캐시 backend 인터페이스. lookup/update 시 hit/miss를 집계한다."""
+
+    def __init__(self) -> None:
+        self.stats = HitMissCounter("llm_response_cache")
+
+    def lookup(self, key: str) -> BaseMessage | None:
+        payload = self._get(key)
+        if payload is None:
+            self.stats.miss()
+            return None
+        self.stats.hit()
+        return _loads(payload)
+
+    def update(self, key: str, message: BaseMessage) -> None:
+        self._set(key, _dumps(message))
+
+    @abstractmethod
+    def _get(self, key: str) -> str | None:
+        """직렬화된 응답을 반환한다. 없거나 만료되었으면 None."""
+
+    @abstractmethod
+    def _set(self, key: str, payload: str) -> None:
+        """직렬화된 응답을 저장한다."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """저장된 응답을 모두 삭제한다."""
+
+
+class InMemoryLLMCache(BaseLLMCache):
+    """프로세스 메모리 LRU + TTL 캐시."""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float | None = None) -> None:
+        super().__init__()
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float | None, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def _set(self, key: str, payload: str) -> None:
+        expires_at = time.monotonic() + self._ttl if self._ttl else None
+        with self._lock:
+            self._entries[key] = (expires_at, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteLLMCache(BaseLLMCache):
+    """로컬 SQLite 파일 기반 캐시. 프로세스 재시작 후에도 응답을 재사용한다."""
+
+    def __init__(self, path: str, ttl_seconds: float | None = None) -> None:
+        super().__init__()
+        self._ttl = ttl_seconds
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                " key TEXT PRIMARY KEY, payload TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+
+    def _get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        payload, created_at = row
+        if self._ttl and created_at + self._ttl <= time.time():
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            return None
+        return payload
+
+    def _set(self, key: str, payload: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, payload, created_at) VALUES (?, ?, ?)",
+                (key, payload, time.time()),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM llm_cache")
+
+
+@lru_cache
+def get_llm_cache() -> BaseLLMCache | None:
+    """settings.llm_cache_backend에 맞는 캐시 싱글턴을 반환한다. none이면 None."""
+    settings = get_settings()
+    backend = settings.llm_cache_backend
+    if backend == "none":
+        return None
+    if backend == "memory":
+        return InMemoryLLMCache(
+            max_entries=settings.llm_cache_max_entries,
+            ttl_seconds=settings.llm_cache_ttl_seconds,
+        )
+    if backend == "sqlite":
+        return SQLiteLLMCache(
+            settings.llm_cache_sqlite_path,
+            ttl_seconds=settings.llm_cache_ttl_seconds,
+        )
+    raise ValueError(f"지원하지 않는 llm_cache_backend: {backend}")
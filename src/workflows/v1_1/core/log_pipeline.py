@@ -0,0 +1,169 @@
+# 운영용 structlog 파이프라인 구성 요소 — core/logging.py가 log_mode=json일 때 사용한다
+# - EventSampler: event 이름별 샘플링 비율 / 초당 허용 개수 제한 (warning 이상은 항상 기록)
+# - FieldLimiter: 큰 필드는 잘라내고, 지정한 필드(args, query 등)는 원문 대신 해시로 기록
+# - BackgroundLogWriter: event dict를 queue에 넣기만 하고, 별도 스레드가 JSON 렌더링 후 모아서 한 번에 write한다.
+#   요청 처리 경로에서는 직렬화와 동기 I/O(print/flush)가 일어나지 않는다. queue가 가득 차면 버리고 개수만 센다.
+from __future__ import annotations
+
+import atexit
+import hashlib
+import queue
+import random
+import sys
+import threading
+import time
+from typing import Any, Callable, TextIO
+
+import structlog
+
+_ALWAYS_KEEP = frozenset({"warning", "warn", "error", "exception", "critical", "fatal"})
+
+
+class EventSampler:
+    """structlog processor — event별 샘플링과 초당 개수 제한을 적용한다.
+
+    sample_rates: {event: 0~1 비율}, rate_limits: {event: 초당 최대 개수}.
+    제한으로 버려진 개수는 같은 event의 다음 기록에 suppressed 필드로 붙는다.
+    """
+
+    def __init__(
+        self,
+        sample_rates: dict[str, float] | None = None,
+        rate_limits: dict[str, float] | None = None,
+        rng: random.Random | None = None,
+    ) -> None:
+        self._rates = dict(sample_rates or {})
+        self._limits = dict(rate_limits or {})
+        self._rng = rng or random.Random()
+        # event -> [남은 token, 마지막 보충 시각, 버려진 개수]
+        self._buckets: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, logger: Any, method_name: str, event_dict: dict) -> dict:
+        if method_name in _ALWAYS_KEEP:
+            return event_dict
+        event = event_dict.get("event")
+        rate = self._rates.get(event)
+        if rate is not None and self._rng.random() >= rate:
+            raise structlog.DropEvent
+        limit = self._limits.get(event)
+        if limit is not None:
+            suppressed = self._take(event, limit)
+            if suppressed is None:
+                raise structlog.DropEvent
+            if suppressed:
+                event_dict["suppressed"] = suppressed
+        return event_dict
+
+    def _take(self, event: str, limit: float) -> int | None:
+        """token을 하나 쓸 수 있으면 그동안 버려진 개수를, 없으면 None을 반환한다."""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.setdefault(event, [limit, now, 0])
+            bucket[0] = min(limit, bucket[0] + (now - bucket[1]) * limit)
+            bucket[1] = now
+            if bucket[0] < 1:
+                bucket[2] += 1
+                return None
+            bucket[0] -= 1
+            suppressed, bucket[2] = int(bucket[2]), 0
+            return suppressed
+
+
+class FieldLimiter:
+    """structlog processor — hash_fields는 sha256 앞 16자와 길이로, 긴 문자열은 max_chars로 자른다."""
+
+    def __init__(self, max_chars: int = 256, hash_fields: tuple[str, ...] = ()) -> None:
+        self._max_chars = max_chars
+        self._hash_fields = frozenset(hash_fields)
+
+    def __call__(self, logger: Any, method_name: str, event_dict: dict) -> dict:
+        for key, value in event_dict.items():
+            if key in self._hash_fields:
+                text = value if isinstance(value, str) else repr(value)
+                digest = hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+                event_dict[key] = f"sha256:{digest} len={len(text)}"
+            elif isinstance(value, str) and len(value) > self._max_chars:
+                event_dict[key] = f"{value[: self._max_chars]}…(+{len(value) - self._max_chars})"
+        return event_dict
+
+
+class BackgroundLogWriter:
+    """event dict를 background thread에서 render한 뒤 batch로 기록한다."""
+
+    def __init__(
+        self,
+        stream: TextIO | None = None,
+        render: Callable[[dict], str] | None = None,
+        max_queue: int = 100_000,
+        batch_size: int = 512,
+    ) -> None:
+        self._stream = stream or sys.stderr
+        self._render = render or json_serializer()
+        self._queue: queue.Queue[dict] = queue.Queue(maxsize=max_queue)
+        self._batch_size = batch_size
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, name="log_writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def write(self, event: dict) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            # 로그 때문에 요청 처리가 막히지 않도록 버린다.
+            self.dropped += 1
+
+    def flush(self, timeout: float = 2.0) -> None:
+        """queue에 쌓인 줄이 모두 기록될 때까지 최대 timeout초 기다린다."""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.005)
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._stream.write("\n".join(self._render(event) for event in batch) + "\n")
+                self._stream.flush()
+            except Exception:
+                self.dropped += len(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+
+class QueueLogger:
+    """structlog logger — 마지막 processor가 넘긴 event dict를 BackgroundLogWriter로 넘긴다."""
+
+    def __init__(self, writer: BackgroundLogWriter) -> None:
+        self._writer = writer
+
+    def msg(self, **event: Any) -> None:
+        self._writer.write(event)
+
+    debug = info = warning = warn = error = critical = exception = fatal = msg
+
+
+class QueueLoggerFactory:
+    def __init__(self, writer: BackgroundLogWriter) -> None:
+        self._logger = QueueLogger(writer)
+
+    def __call__(self, *args: Any) -> QueueLogger:
+        return self._logger
+
+
+def json_serializer() -> Callable[[dict], str]:
+    """orjson이 있으면 사용하고, 없으면 표준 json으로 렌더링한다."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        return lambda event: json.dumps(event, ensure_ascii=False, default=str)
+    return lambda event: orjson.dumps(event, default=str).decode("utf-8")
@@ -2,23 +2,71 @@
 from __future__ import annotations
 
 import functools
+import inspect
+import sys
 import time
 from typing import Any, Callable
 
 import structlog
 
-structlog.configure(
-    processors=[
+from config.settings import get_settings
+from core.log_pipeline import (
+    BackgroundLogWriter,
+    EventSampler,
+    FieldLimiter,
+    QueueLoggerFactory,
+)
+
+_LEVELS = {"debug": 10, "info": 20, "warning": 30, "error": 40, "critical": 50}
+
+
+def configure_logging() -> BackgroundLogWriter | None:
+    """settings.log_mode에 맞게 structlog를 설정한다. json 모드이면 background writer를 반환한다.
+
+    console: 개발용 — 색상 텍스트를 요청 스레드에서 바로 stderr로 print한다.
+    json: 운영용 — 샘플링/필드 제한만 요청 스레드에서 하고, JSON 렌더링과 쓰기는 background thread가 한다.
+    """
+    settings = get_settings()
+    common = [
         structlog.contextvars.merge_contextvars,
         structlog.processors.add_log_level,
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.dev.ConsoleRenderer(),
-    ],
-    wrapper_class=structlog.make_filtering_bound_logger(0),
-    context_class=dict,
-    logger_factory=structlog.PrintLoggerFactory(),
-    cache_logger_on_first_use=True,
-)
+    ]
+    writer = None
+    if settings.log_mode == "console":
+        processors = [
+            *common,
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.dev.ConsoleRenderer(),
+        ]
+        # json 모드 기본 출력과 같이 stderr로 보내 stdout은 프로그램 출력(batch 결과 JSONL 등)에 남겨 둔다.
+        logger_factory = structlog.PrintLoggerFactory(sys.stderr)
+    elif settings.log_mode == "json":
+        stream = open(settings.log_file_path, "a", encoding="utf-8") if settings.log_file_path else None
+        writer = BackgroundLogWriter(stream, max_queue=settings.log_queue_max_size)
+        processors = [
+            *common,
+            EventSampler(settings.log_sample_rates, settings.log_rate_limits),
+            FieldLimiter(settings.log_max_field_chars, tuple(settings.log_hash_fields)),
+            structlog.processors.TimeStamper(fmt=None),
+            structlog.processors.format_exc_info,
+            # 마지막 processor가 dict를 넘기면 QueueLogger가 렌더링 없이 queue에 넣는다.
+            lambda logger, method_name, event_dict: event_dict,
+        ]
+        logger_factory = QueueLoggerFactory(writer)
+    else:
+        raise ValueError(f"지원하지 않는 log_mode: {settings.log_mode}")
+
+    structlog.configure(
+        processors=processors,
+        wrapper_class=structlog.make_filtering_bound_logger(_LEVELS[settings.log_level]),
+        context_class=dict,
+        logger_factory=logger_factory,
+        cache_logger_on_first_use=True,
+    )
+    return writer
+
+
+log_writer = configure_logging()
 
 
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
@@ -26,11 +74,19 @@ def get_logger(name: str) -> structlog.stdlib.BoundLogger:
 
 
 def log_node_execution(func: Callable[..., Any]) -> Callable[..., Any]:
-    """노드 함수에 적용하여 진입/종료, 소요시간, intent, session_id를 자동 로깅한다."""
+    """노드 함수에 적용하여 진입/종료, 소요시간, intent, session_id를 자동 로깅한다.
+
+    동기 함수와 async 함수(coroutine function) 모두에 적용할 수 있다.
+    소요 시간은 workflow_node_duration_seconds histogram(core/metrics.py)에도 기록되고,
+    tracing이 켜져 있으면 노드 실행 구간이 span(core/tracing.py)으로 남는다.
+    """
+    # core.metrics/core.tracing이 이 모듈의 get_logger를 사용하므로 순환 import를 피해 여기서 가져온다.
+    from core.metrics import NODE_SECONDS
+    from core.tracing import start_span
+
     logger = get_logger(func.__qualname__)
 
-    @functools.wraps(func)
-    def wrapper(state: dict[str, Any]) -> dict[str, Any]:
+    def _enter(state: dict[str, Any]) -> tuple[str, str]:
         intent = state.get("intent", "N/A")
         session_id = state.get("metadata", {}).get("session_id", "N/A")
         logger.info(
@@ -39,27 +95,59 @@ def log_node_execution(func: Callable[..., Any]) -> Callable[..., Any]:
             intent=intent,
             session_id=session_id,
         )
+        return intent, session_id
+
+    def _span(intent: str, session_id: str):
+        return start_span(
+            f"node {func.__name__}",
+            {"node.name": func.__name__, "intent": intent, "session.id": session_id},
+        )
+
+    def _exit(event: str, intent: str, session_id: str, start: float) -> None:
+        elapsed = time.perf_counter() - start
+        NODE_SECONDS.observe(
+            elapsed,
+            node=func.__name__,
+            intent=intent or "N/A",
+            status="error" if event == "node_error" else "ok",
+        )
+        log = logger.exception if event == "node_error" else logger.info
+        log(
+            event,
+            node=func.__name__,
+            intent=intent,
+            session_id=session_id,
+            elapsed_seconds=round(elapsed, 4),
+        )
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(state: dict[str, Any]) -> dict[str, Any]:
+            intent, session_id = _enter(state)
+            start = time.perf_counter()
+            with _span(intent, session_id):
+                try:
+                    result = await func(state)
+                    _exit("node_exit", intent, session_id, start)
+                    return result
+                except Exception:
+                    _exit("node_error", intent, session_id, start)
+                    raise
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(state: dict[str, Any]) -> dict[str, Any]:
+        intent, session_id = _enter(state)
         start = time.perf_counter()
-        try:
-            result = func(state)
-            elapsed = round(time.perf_counter() - start, 4)
-            logger.info(
-                "node_exit",
-                node=func.__name__,
-                intent=intent,
-                session_id=session_id,
-                elapsed_seconds=elapsed,
-            )
-            return result
-        except Exception:
-            elapsed = round(time.perf_counter() - start, 4)
-            logger.exception(
-                "node_error",
-                node=func.__name__,
-                intent=intent,
-                session_id=session_id,
-                elapsed_seconds=elapsed,
-            )
-            raise
+        with _span(intent, session_id):
+            try:
+                result = func(state)
+                _exit("node_exit", intent, session_id, start)
+                return result
+            except Exception:
+                _exit("node_error", intent, session_id, start)
+                raise
 
     return wrapper
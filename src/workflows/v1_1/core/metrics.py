@@ -0,0 +1,345 @@
+# In-process 메트릭 — 고정 bucket histogram / counter를 모아 Prometheus text format으로 내보낸다
+# - 노드·intent·retriever·MCP tool·LLM 호출별 소요 시간, LLM prompt/completion token 수, 캐시 적중률
+# - 수집은 항상 켜져 있고(lock + bisect 수준의 비용), 노출 방법은 settings로 고른다.
+#   metrics_http_port: /metrics HTTP endpoint, metrics_textfile_path: 주기적 파일 덤프 (node_exporter textfile 형식)
+from __future__ import annotations
+
+import bisect
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Iterator
+
+from config.settings import get_settings
+from core.logging import get_logger
+from core.stats import all_counters
+
+logger = get_logger(__name__)
+
+# 노드/LLM 호출 지연 분포에 맞춘 기본 bucket (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+Labels = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Labels, values: Labels, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric(ABC):
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Labels = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> Labels:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} label 불일치: {sorted(labels)} != {list(self.labelnames)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+            *self._samples(),
+        ]
+
+    @abstractmethod
+    def _samples(self) -> list[str]:
+        """label 조합별 exposition sample 줄을 반환한다."""
+
+
+class Counter(_Metric):
+    """단조 증가 counter."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Labels = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram(_Metric):
+    """고정 bucket histogram. bucket 경계는 생성 시 정하며 le는 누적 개수로 내보낸다."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Labels = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # label 조합별 [bucket별 개수..., +Inf 개수], 합계
+        self._counts: dict[Labels, list[int]] = {}
+        self._sums: dict[Labels, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+                self._sums[key] = 0.0
+            counts[index] += 1
+            self._sums[key] += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """with 블록의 소요 시간(초)을 기록한다. 예외가 나도 기록한다."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            return sum(self._counts.get(self._key(labels), ()))
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted((key, list(counts), self._sums[key]) for key, counts in self._counts.items())
+        lines = []
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}"
+                )
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """이름으로 메트릭을 등록/조회하고 전체를 Prometheus text format으로 렌더링한다."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], list[str]]] = []
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: Labels = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Labels = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def register_collector(self, collector: Callable[[], list[str]]) -> None:
+        """render 시점에 값을 읽어 오는 collector(이미 렌더링된 줄 목록 반환)를 등록한다."""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def _get_or_create(self, cls, name, documentation, labelnames, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            elif not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"이미 다른 형태로 등록된 메트릭: {name}")
+            return metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+            collectors = list(self._collectors)
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        for collector in collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+@lru_cache
+def get_registry() -> MetricsRegistry:
+    registry = MetricsRegistry()
+    registry.register_collector(_cache_samples)
+    return registry
+
+
+def _cache_samples() -> list[str]:
+    """core.stats.HitMissCounter들을 캐시 이름별로 합산해 내보낸다."""
+    totals: dict[str, list[int]] = {}
+    for counter in all_counters():
+        snapshot = counter.snapshot()
+        hits_misses = totals.setdefault(counter.name, [0, 0])
+        hits_misses[0] += int(snapshot["hits"])
+        hits_misses[1] += int(snapshot["misses"])
+    lines = [
+        "# HELP cache_requests_total 캐시/fast path 조회 수",
+        "# TYPE cache_requests_total counter",
+    ]
+    for name, (hits, misses) in sorted(totals.items()):
+        lines.append(f'cache_requests_total{{cache="{_escape(name)}",result="hit"}} {hits}')
+        lines.append(f'cache_requests_total{{cache="{_escape(name)}",result="miss"}} {misses}')
+    lines += [
+        "# HELP cache_hit_ratio 캐시/fast path 적중률",
+        "# TYPE cache_hit_ratio gauge",
+    ]
+    for name, (hits, misses) in sorted(totals.items()):
+        ratio = hits / (hits + misses) if hits + misses else 0.0
+        lines.append(f'cache_hit_ratio{{cache="{_escape(name)}"}} {_format_value(ratio)}')
+    return lines
+
+
+# ── 공용 메트릭 ─────────────────────────────────────────────────
+
+NODE_SECONDS = get_registry().histogram(
+    "workflow_node_duration_seconds", "그래프 노드 실행 시간", ("node", "intent", "status")
+)
+RETRIEVAL_SECONDS = get_registry().histogram(
+    "rag_retrieval_duration_seconds", "retriever 조회 시간 (실패 포함)", ("retriever",)
+)
+RETRIEVAL_DOCUMENTS = get_registry().histogram(
+    "rag_retrieval_documents", "retriever 조회 결과 문서 수", ("retriever",), buckets=COUNT_BUCKETS
+)
+TOOL_SECONDS = get_registry().histogram(
+    "mcp_tool_duration_seconds", "MCP tool 호출 시간 (실패 포함)", ("tool",)
+)
+LLM_SECONDS = get_registry().histogram(
+    "llm_request_duration_seconds", "LLM 호출 시간 (캐시 적중 포함)", ("model", "mode", "cache")
+)
+TOOL_ERRORS = get_registry().counter("mcp_tool_errors_total", "MCP tool 호출 실패 수", ("tool",))
+LLM_RETRIES = get_registry().counter(
+    "llm_retries_total", "재시도 가능한 오류로 LLM 호출을 다시 시도한 수", ("target", "reason")
+)
+LLM_HEDGES = get_registry().counter(
+    "llm_hedged_requests_total", "hedge 요청 수 (fired: 보낸 수, won: 먼저 끝난 수)", ("target", "outcome")
+)
+LLM_TOKENS = get_registry().counter(
+    "llm_tokens_total", "LLM prompt/completion token 수", ("model", "type")
+)
+
+
+def record_llm_usage(model: str, message: object) -> None:
+    """AIMessage.usage_metadata가 있으면 prompt/completion token 수를 기록한다."""
+    usage = getattr(message, "usage_metadata", None)
+    if not usage:
+        return
+    LLM_TOKENS.inc(usage.get("input_tokens", 0), model=model, type="prompt")
+    LLM_TOKENS.inc(usage.get("output_tokens", 0), model=model, type="completion")
+
+
+# ── 노출 ─────────────────────────────────────────────────────
+
+
+def write_textfile(path: str, registry: MetricsRegistry | None = None) -> None:
+    """현재 메트릭을 path에 원자적으로 기록한다 (임시 파일 작성 후 rename)."""
+    registry = registry or get_registry()
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(registry.render())
+    os.replace(tmp, path)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server 규약
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass  # scrape 요청마다 stderr에 쓰지 않는다
+
+
+def start_http_server(
+    port: int, host: str = "127.0.0.1", registry: MetricsRegistry | None = None
+) -> ThreadingHTTPServer:
+    """/metrics를 제공하는 HTTP 서버를 daemon thread로 띄운다."""
+    handler = type("MetricsHandler", (_MetricsHandler,), {"registry": registry or get_registry()})
+    server = ThreadingHTTPServer((host, port), handler)
+    threading.Thread(target=server.serve_forever, name="metrics_http", daemon=True).start()
+    logger.info("metrics_http_started", host=host, port=server.server_address[1])
+    return server
+
+
+def _textfile_loop(path: str, interval: float) -> None:
+    while True:
+        time.sleep(interval)
+        try:
+            write_textfile(path)
+        except OSError as exc:
+            logger.warning("metrics_textfile_failed", path=path, error=str(exc))
+
+
+@lru_cache
+def start_exporters() -> None:
+    """settings에 설정된 노출 방법(HTTP endpoint / textfile 덤프)을 한 번만 시작한다."""
+    settings = get_settings()
+    if settings.metrics_http_port is not None:
+        try:
+            start_http_server(settings.metrics_http_port, settings.metrics_http_host)
+        except OSError as exc:
+            # 메트릭 노출 실패로 서비스가 멈추지 않도록 경고만 남긴다.
+            logger.warning("metrics_http_failed", port=settings.metrics_http_port, error=str(exc))
+    if settings.metrics_textfile_path:
+        threading.Thread(
+            target=_textfile_loop,
+            args=(settings.metrics_textfile_path, settings.metrics_textfile_interval_seconds),
+            name="metrics_textfile",
+            daemon=True,
+        ).start()
@@ -0,0 +1,380 @@
+# LLM 호출 복원력 — 호출별 deadline, 재시도 가능한 오류의 지수 backoff(full jitter) 재시도, 요청 hedging
+# - hedging: 첫 요청이 최근 지연 p95(첫 token 기준) 안에 끝나지 않으면 같은 요청을 하나 더 보내고 먼저 끝난 쪽을 쓴다.
+#   진 쪽은 async 경로에서는 취소된다. sync 경로에서는 시작 전이면 취소되고, 실행 중이면 남은 deadline으로 잡힌
+#   HTTP timeout 안에 끝나며 결과만 버려진다. sync 경로는 hedging이 켜졌을 때만 작업 스레드를 사용한다.
+#   hedge 요청 수는 전체 요청의 hedge_budget_ratio 이하로 제한한다.
+# - 지연 분포는 LatencyTracker가 이름(예: "gpt-4o-mini/complete")별 최근 window개로 유지한다.
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, TypeVar
+
+import openai
+
+from config.settings import get_settings
+from core.exceptions import LLMDeadlineExceeded
+from core.logging import get_logger
+from core.metrics import LLM_HEDGES, LLM_RETRIES
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS = frozenset({408, 409, 429, 500, 502, 503, 504})
+_RETRYABLE_TYPES = (
+    openai.APIConnectionError,  # APITimeoutError 포함
+    openai.RateLimitError,
+    openai.InternalServerError,
+    TimeoutError,
+    ConnectionError,
+)
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """일시적인 오류(연결/timeout/429/5xx)이면 True."""
+    if isinstance(exc, LLMDeadlineExceeded):
+        return False
+    return isinstance(exc, _RETRYABLE_TYPES) or getattr(exc, "status_code", None) in RETRYABLE_STATUS
+
+
+@dataclass(frozen=True)
+class ResiliencePolicy:
+    """LLM 호출 1회(재시도 포함)에 적용할 deadline / 재시도 / hedging 설정."""
+
+    deadline_seconds: float | None = None
+    max_attempts: int = 1
+    backoff_base_seconds: float = 0.5
+    backoff_max_seconds: float = 8.0
+    hedge: bool = False
+    hedge_quantile: float = 0.95
+    hedge_min_samples: int = 50
+    hedge_budget_ratio: float = 0.1
+
+    @classmethod
+    def from_settings(cls) -> ResiliencePolicy:
+        settings = get_settings()
+        return cls(
+            deadline_seconds=settings.llm_deadline_seconds,
+            max_attempts=max(1, settings.llm_max_attempts),
+            backoff_base_seconds=settings.llm_retry_backoff_base_seconds,
+            backoff_max_seconds=settings.llm_retry_backoff_max_seconds,
+            hedge=settings.llm_hedge_enabled,
+            hedge_quantile=settings.llm_hedge_quantile,
+            hedge_min_samples=settings.llm_hedge_min_samples,
+            hedge_budget_ratio=settings.llm_hedge_budget_ratio,
+        )
+
+    def backoff(self, attempt: int, rng: random.Random | None = None) -> float:
+        """attempt번째 실패 뒤 대기 시간 — [0, min(max, base * 2^(attempt-1))] 구간의 균등 난수 (full jitter)."""
+        ceiling = min(self.backoff_max_seconds, self.backoff_base_seconds * 2 ** (attempt - 1))
+        return (rng or random).uniform(0, ceiling)
+
+
+@lru_cache
+def get_policy() -> ResiliencePolicy:
+    return ResiliencePolicy.from_settings()
+
+
+class LatencyTracker:
+    """최근 window개 지연(초)으로 hedge 기준 분위수를 구하고, hedge 예산을 관리한다."""
+
+    def __init__(self, window: int = 500, refresh_every: int = 16) -> None:
+        self._samples: deque[float] = deque(maxlen=window)
+        self._refresh_every = refresh_every
+        self._since_refresh = 0
+        self._cached: dict[float, float] = {}
+        self.requests = 0
+        self.hedged = 0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+            self._since_refresh += 1
+            if self._since_refresh >= self._refresh_every:
+                self._since_refresh = 0
+                self._cached.clear()
+
+    def quantile(self, q: float, min_samples: int) -> float | None:
+        """표본이 min_samples 미만이면 None."""
+        with self._lock:
+            if len(self._samples) < min_samples:
+                return None
+            if q not in self._cached:
+                ordered = sorted(self._samples)
+                self._cached[q] = ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+            return self._cached[q]
+
+    def hedge_delay(self, policy: ResiliencePolicy) -> float | None:
+        """이번 요청에 hedge를 걸 수 있으면 대기 시간(초)을, 아니면 None을 반환한다. 요청 수도 함께 센다."""
+        with self._lock:
+            self.requests += 1
+            within_budget = self.hedged < self.requests * policy.hedge_budget_ratio
+        if not (policy.hedge and within_budget):
+            return None
+        return self.quantile(policy.hedge_quantile, policy.hedge_min_samples)
+
+    def record_hedge(self) -> None:
+        with self._lock:
+            self.hedged += 1
+
+
+_trackers: dict[str, LatencyTracker] = {}
+_trackers_lock = threading.Lock()
+
+
+def latency_tracker(name: str) -> LatencyTracker:
+    with _trackers_lock:
+        tracker = _trackers.get(name)
+        if tracker is None:
+            tracker = _trackers[name] = LatencyTracker()
+        return tracker
+
+
+# ── async ───────────────────────────────────────────────────
+
+
+async def _ahedged(call: Callable[[], Awaitable[T]], tracker: LatencyTracker, delay: float | None, label: str) -> T:
+    started = time.perf_counter()
+    primary = asyncio.ensure_future(call())
+    if delay is None:
+        result = await primary
+        tracker.observe(time.perf_counter() - started)
+        return result
+
+    tasks: set[asyncio.Future] = {primary}
+    backup: asyncio.Future | None = None
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if not done:
+            tracker.record_hedge()
+            LLM_HEDGES.inc(target=label, outcome="fired")
+            backup_started = time.perf_counter()
+            backup = asyncio.ensure_future(call())
+            tasks.add(backup)
+        error: BaseException | None = None
+        while tasks:
+            done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is backup:
+                        LLM_HEDGES.inc(target=label, outcome="won")
+                        tracker.observe(time.perf_counter() - backup_started)
+                    else:
+                        tracker.observe(time.perf_counter() - started)
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in (primary, backup):
+            if task is not None and not task.done():
+                task.cancel()
+
+
+async def arun_resilient(
+    call: Callable[[], Awaitable[T]],
+    label: str,
+    policy: ResiliencePolicy | None = None,
+) -> T:
+    """call을 deadline 안에서 재시도/hedging하며 실행한다. label은 지연 분포와 메트릭을 구분하는 이름."""
+    policy = policy or get_policy()
+    tracker = latency_tracker(label)
+    timeout = asyncio.timeout(policy.deadline_seconds)
+    try:
+        async with timeout:
+            for attempt in range(1, policy.max_attempts + 1):
+                try:
+                    return await _ahedged(call, tracker, tracker.hedge_delay(policy), label)
+                except Exception as exc:
+                    if attempt == policy.max_attempts or not is_retryable(exc):
+                        raise
+                    _log_retry(label, attempt, exc)
+                    await asyncio.sleep(policy.backoff(attempt))
+    except TimeoutError as exc:
+        if timeout.expired():
+            raise LLMDeadlineExceeded(
+                f"LLM 호출이 {policy.deadline_seconds}초 안에 끝나지 않았습니다",
+                cause=exc,
+                context={"target": label},
+            ) from exc
+        raise
+    raise AssertionError("unreachable")
+
+
+async def aopen_stream(
+    open_stream: Callable[[], AsyncIterator[T]],
+    label: str,
+    policy: ResiliencePolicy | None = None,
+) -> tuple[T | None, AsyncIterator[T] | None]:
+    """첫 chunk를 받을 때까지만 deadline/재시도/hedging을 적용하고 (첫 chunk, 나머지 iterator)를 반환한다.
+
+    첫 chunk 이후에는 이미 출력이 나갔으므로 재시도하지 않는다. 빈 stream이면 (None, None).
+    """
+
+    async def _first() -> tuple[T | None, AsyncIterator[T] | None]:
+        stream = open_stream()
+        try:
+            return await stream.__anext__(), stream
+        except StopAsyncIteration:
+            return None, None
+        except BaseException:
+            # hedging에서 진 쪽/실패한 쪽의 연결을 정리한다.
+            await stream.aclose()
+            raise
+
+    return await arun_resilient(_first, label, policy)
+
+
+# ── sync ────────────────────────────────────────────────────
+# sync 경로의 call은 남은 deadline(초, 없으면 None)을 인자로 받아 HTTP 요청 timeout으로 사용해야 한다.
+# 실행 중인 스레드는 중단할 수 없으므로 deadline은 요청 자체의 timeout으로 강제하고,
+# hedging이 꺼져 있으면 호출 스레드에서 그대로 실행한다.
+
+
+@lru_cache
+def _executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=get_settings().llm_sync_workers, thread_name_prefix="llm_hedge")
+
+
+def _remaining(deadline: float | None) -> float | None:
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+def _submit(call: Callable[[float | None], T], deadline: float | None) -> Future:
+    # tracing span/structlog contextvars가 작업 스레드에서도 이어지도록 복사한다.
+    return _executor().submit(contextvars.copy_context().run, call, _remaining(deadline))
+
+
+def _hedged(
+    call: Callable[[float | None], T],
+    tracker: LatencyTracker,
+    delay: float | None,
+    deadline: float | None,
+    label: str,
+) -> T:
+    started = time.perf_counter()
+    if delay is None:
+        result = call(_remaining(deadline))
+        tracker.observe(time.perf_counter() - started)
+        return result
+
+    primary = _submit(call, deadline)
+    futures = {primary}
+    backup: Future | None = None
+    try:
+        done, _ = wait(futures, timeout=delay)
+        if not done and (deadline is None or _remaining(deadline) > 0):
+            tracker.record_hedge()
+            LLM_HEDGES.inc(target=label, outcome="fired")
+            backup_started = time.perf_counter()
+            backup = _submit(call, deadline)
+            futures.add(backup)
+
+        error: BaseException | None = None
+        while futures:
+            # 각 요청의 HTTP timeout이 남은 deadline 이하이므로 deadline 무렵에는 모두 끝난다.
+            done, futures = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is backup:
+                        LLM_HEDGES.inc(target=label, outcome="won")
+                        tracker.observe(time.perf_counter() - backup_started)
+                    else:
+                        tracker.observe(time.perf_counter() - started)
+                    return future.result()
+                error = future.exception()
+        raise error
+    finally:
+        # 진 쪽이 아직 시작 전이면 취소한다. 이미 실행 중이면 자기 HTTP timeout 안에 끝나고 결과는 버려진다.
+        for future in (primary, backup):
+            if future is not None:
+                future.cancel()
+
+
+def run_resilient(
+    call: Callable[[float | None], T],
+    label: str,
+    policy: ResiliencePolicy | None = None,
+) -> T:
+    """arun_resilient의 sync 버전. call은 남은 deadline(초)을 받아 요청 timeout으로 사용한다.
+
+    hedging이 켜져 있을 때만 작업 스레드를 사용하고, 그 외에는 호출 스레드에서 실행한다.
+    """
+    policy = policy or get_policy()
+    tracker = latency_tracker(label)
+    deadline = (
+        time.monotonic() + policy.deadline_seconds if policy.deadline_seconds is not None else None
+    )
+    for attempt in range(1, policy.max_attempts + 1):
+        try:
+            return _hedged(call, tracker, tracker.hedge_delay(policy), deadline, label)
+        except Exception as exc:
+            expired = deadline is not None and time.monotonic() >= deadline
+            if expired:
+                raise LLMDeadlineExceeded(
+                    f"LLM 호출이 {policy.deadline_seconds}초 안에 끝나지 않았습니다",
+                    cause=exc,
+                    context={"target": label},
+                ) from exc
+            if attempt == policy.max_attempts or not is_retryable(exc):
+                raise
+            _log_retry(label, attempt, exc)
+            pause = policy.backoff(attempt)
+            if deadline is not None:
+                pause = min(pause, _remaining(deadline))
+            time.sleep(pause)
+    raise AssertionError("unreachable")
+
+
+def open_stream(
+    open_stream: Callable[[float | None], Iterator[T]],
+    label: str,
+    policy: ResiliencePolicy | None = None,
+) -> tuple[T | None, Iterator[T] | None]:
+    """aopen_stream의 sync 버전. generator는 스레드 사이에서 정리할 수 없으므로 hedging은 하지 않는다."""
+    policy = policy or get_policy()
+    if policy.hedge:
+        policy = ResiliencePolicy(**{**policy.__dict__, "hedge": False})
+
+    def _first(timeout: float | None) -> tuple[T | None, Iterator[T] | None]:
+        stream = open_stream(timeout)
+        try:
+            return next(stream), stream
+        except StopIteration:
+            return None, None
+        except BaseException:
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+            raise
+
+    return run_resilient(_first, label, policy)
+
+
+def _log_retry(label: str, attempt: int, exc: BaseException) -> None:
+    LLM_RETRIES.inc(target=label, reason=type(exc).__name__)
+    logger.warning("llm_retry", target=label, attempt=attempt, error=str(exc))
+
+
+def hedge_report() -> dict[str, dict[str, Any]]:
+    """이름별 요청 수, hedge 수, 추가 요청 비율, 현재 hedge 기준 지연(p95)을 반환한다."""
+    policy = get_policy()
+    with _trackers_lock:
+        trackers = dict(_trackers)
+    return {
+        name: {
+            "requests": tracker.requests,
+            "hedged": tracker.hedged,
+            "extra_ratio": round(tracker.hedged / tracker.requests, 4) if tracker.requests else 0.0,
+            "hedge_delay_seconds": tracker.quantile(policy.hedge_quantile, policy.hedge_min_samples),
+        }
+        for name, tracker in sorted(trackers.items())
+    }
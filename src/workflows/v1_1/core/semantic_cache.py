@@ -0,0 +1,91 @@
+# 임베딩 최근접 이웃 기반 semantic 캐시 — NumPy brute-force cosine 검색
+from __future__ import annotations
+
+import threading
+from typing import Any, Generic, Sequence, TypeVar
+
+import numpy as np
+
+from core.stats import HitMissCounter
+
+T = TypeVar("T")
+
+
+class SemanticCache(Generic[T]):
+    """임베딩 벡터와 label 쌍을 저장하고 가장 가까운 항목의 label을 돌려준다.
+
+    벡터는 L2 정규화된 float32 행렬 하나에 저장되므로 조회는 행렬-벡터 곱 한 번이다.
+    수천~수만 건 규모에서는 ANN 인덱스 없이도 1ms 안팎으로 조회된다.
+    max_entries에 도달하면 가장 오래된 항목부터 덮어쓴다 (ring buffer).
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        max_entries: int = 10_000,
+        name: str = "semantic_cache",
+    ) -> None:
+        self._threshold = threshold
+        self._max_entries = max_entries
+        self._matrix: np.ndarray | None = None
+        self._labels: list[Any] = []
+        self._size = 0
+        self._cursor = 0
+        self._lock = threading.Lock()
+        self.stats = HitMissCounter(name)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def lookup(self, vector: Sequence[float]) -> tuple[T, float] | None:
+        """threshold 이상으로 가장 유사한 항목의 (label, similarity)를 반환한다."""
+        query = _normalize(vector)
+        with self._lock:
+            if self._size == 0 or self._matrix is None:
+                self.stats.miss()
+                return None
+            scores = self._matrix[: self._size] @ query
+            best = int(np.argmax(scores))
+            score = float(scores[best])
+            label = self._labels[best]
+        if score < self._threshold:
+            self.stats.miss()
+            return None
+        self.stats.hit()
+        return label, score
+
+    def insert(self, vector: Sequence[float], label: T) -> None:
+        """새 (벡터, label) 항목을 추가한다."""
+        row = _normalize(vector)
+        with self._lock:
+            if self._matrix is None:
+                self._matrix = np.empty((min(64, self._max_entries), row.shape[0]), dtype=np.float32)
+            if self._size < self._max_entries:
+                if self._size == self._matrix.shape[0]:
+                    grown = np.empty(
+                        (min(self._size * 2, self._max_entries), row.shape[0]),
+                        dtype=np.float32,
+                    )
+                    grown[: self._size] = self._matrix
+                    self._matrix = grown
+                index = self._size
+                self._size += 1
+                self._labels.append(label)
+            else:
+                index = self._cursor
+                self._cursor = (self._cursor + 1) % self._max_entries
+                self._labels[index] = label
+            self._matrix[index] = row
+
+    def clear(self) -> None:
+        with self._lock:
+            self._matrix = None
+            self._labels = []
+            self._size = 0
+            self._cursor = 0
+
+
+def _normalize(vector: Sequence[float]) -> np.ndarray:
+    array = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(array))
+    return array / norm if norm else array
@@ -0,0 +1,59 @@
+# 캐시/fast path 적중률 집계용 경량 카운터
+from __future__ import annotations
+
+import threading
+import weakref
+from dataclasses import dataclass, field
+
+# 살아 있는 카운터 목록 — core/metrics.py가 캐시 적중률을 내보낼 때 읽는다.
+_counters: list[weakref.ref] = []
+_counters_lock = threading.Lock()
+
+
+@dataclass
+class HitMissCounter:
+    """스레드 안전한 hit/miss 카운터."""
+
+    name: str
+    hits: int = 0
+    misses: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        with _counters_lock:
+            _counters[:] = [ref for ref in _counters if ref() is not None]
+            _counters.append(weakref.ref(self))
+
+    def hit(self) -> None:
+        with self._lock:
+            self.hits += 1
+
+    def miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def snapshot(self) -> dict[str, float]:
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / total if total else 0.0,
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+
+def all_counters() -> list[HitMissCounter]:
+    """생성된 뒤 아직 살아 있는 HitMissCounter 목록."""
+    with _counters_lock:
+        return [counter for ref in _counters if (counter := ref()) is not None]
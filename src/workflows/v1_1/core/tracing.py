@@ -0,0 +1,429 @@
+# 분산 트레이싱 — OpenTelemetry와 같은 span 모델(trace_id/span_id/parent, kind, attributes, status)
+# - graph.invoke/ainvoke/stream/astream 1회 = root span, 그 아래 node / retriever / tool / LLM 호출이 child span
+# - 현재 span은 contextvars로 전달되므로 asyncio task, fan-out 스레드(core/concurrency.py)에서도 부모가 이어진다.
+# - trace 하나가 끝나면(root span 종료) 그 trace의 span을 모아 OTLP/JSON 한 줄로 내보낸다.
+#   exporter: file(OTLP/JSON lines) | otlp_http(POST /v1/traces — OTel collector 또는 start_collector)
+# - 기본값(tracing_exporter=none)이면 get_tracer()가 None이고 start_span은 공유 no-op 객체만 반환한다.
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+import urllib.request
+from contextvars import ContextVar, Token
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+
+from config.settings import get_settings
+from core.log_pipeline import BackgroundLogWriter, json_serializer
+from core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# OTLP SpanKind / StatusCode 값
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+_current_span: ContextVar[Span | _NoopSpan | None] = ContextVar("current_span", default=None)
+_ids = random.Random()
+_ids_lock = threading.Lock()
+
+
+def _new_id(bits: int) -> str:
+    with _ids_lock:
+        return format(_ids.getrandbits(bits), f"0{bits // 4}x")
+
+
+class Span:
+    """종료 시 Tracer에 넘겨지는 span 한 건."""
+
+    __slots__ = (
+        "name", "kind", "trace_id", "span_id", "parent_span_id", "attributes",
+        "events", "status_code", "status_message", "start_ns", "end_ns", "_tracer",
+    )
+    is_recording = True
+
+    def __init__(
+        self,
+        tracer: Tracer,
+        name: str,
+        trace_id: str,
+        parent_span_id: str | None,
+        kind: int,
+        attributes: dict[str, Any] | None,
+    ) -> None:
+        self._tracer = tracer
+        self.name = name
+        self.kind = kind
+        self.trace_id = trace_id
+        self.span_id = _new_id(64)
+        self.parent_span_id = parent_span_id
+        self.attributes: dict[str, Any] = dict(attributes) if attributes else {}
+        self.events: list[tuple[int, str, dict[str, Any]]] = []
+        self.status_code = STATUS_UNSET
+        self.status_message = ""
+        self.start_ns = time.time_ns()
+        self.end_ns: int | None = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if value is not None:
+            self.attributes[key] = value
+
+    def set_attributes(self, attributes: dict[str, Any]) -> None:
+        for key, value in attributes.items():
+            self.set_attribute(key, value)
+
+    def record_exception(self, exc: BaseException) -> None:
+        self.events.append(
+            (
+                time.time_ns(),
+                "exception",
+                {"exception.type": type(exc).__name__, "exception.message": str(exc)},
+            )
+        )
+        self.status_code = STATUS_ERROR
+        self.status_message = str(exc)
+
+    def end(self) -> None:
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+            self._tracer._on_end(self)
+
+
+class _NoopSpan:
+    """tracing이 꺼졌거나 샘플링에서 빠진 trace에서 쓰는 span. 아무것도 기록하지 않는다."""
+
+    is_recording = False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, attributes: dict[str, Any]) -> None:
+        pass
+
+    def record_exception(self, exc: BaseException) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+
+class _SpanScope:
+    """span을 현재 span으로 설정하고, 블록이 끝나면 예외를 기록한 뒤 종료한다."""
+
+    __slots__ = ("_span", "_activate", "_token")
+
+    def __init__(self, span: Span | _NoopSpan, activate: bool = True) -> None:
+        self._span = span
+        self._activate = activate
+        self._token: Token | None = None
+
+    def __enter__(self) -> Span | _NoopSpan:
+        if self._activate:
+            self._token = _current_span.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc is not None:
+            self._span.record_exception(exc)
+        self._span.end()
+        if self._token is None:
+            return False
+        try:
+            _current_span.reset(self._token)
+        except ValueError:
+            # 끝까지 소비되지 않은 generator가 다른 context에서 정리되는 경우 — 되돌릴 context가 없다.
+            pass
+        return False
+
+
+class _NoopScope:
+    __slots__ = ()
+
+    def __enter__(self) -> _NoopSpan:
+        return NOOP_SPAN
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+_NOOP_SCOPE = _NoopScope()
+
+
+class Tracer:
+    """span을 만들고, trace별로 모았다가 root span이 끝나면 exporter로 내보낸다.
+
+    root 종료 뒤에 끝난 child span(예: 취소된 background 작업)은 혼자 내보낸다.
+    """
+
+    def __init__(
+        self,
+        exporter: Any,
+        sample_ratio: float = 1.0,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.exporter = exporter
+        self._sample_ratio = sample_ratio
+        self._rng = rng or random.Random()
+        self._pending: dict[str, list[Span]] = {}
+        self._lock = threading.Lock()
+
+    def start_span(
+        self,
+        name: str,
+        attributes: dict[str, Any] | None = None,
+        kind: int = SPAN_KIND_INTERNAL,
+    ) -> Span | _NoopSpan:
+        parent = _current_span.get()
+        if parent is NOOP_SPAN:
+            return NOOP_SPAN
+        if parent is None:
+            if self._sample_ratio < 1.0 and self._rng.random() >= self._sample_ratio:
+                return NOOP_SPAN
+            trace_id = _new_id(128)
+            with self._lock:
+                self._pending[trace_id] = []
+            return Span(self, name, trace_id, None, kind, attributes)
+        return Span(self, name, parent.trace_id, parent.span_id, kind, attributes)
+
+    def _on_end(self, span: Span) -> None:
+        with self._lock:
+            if span.parent_span_id is None:
+                spans = self._pending.pop(span.trace_id, [])
+                spans.append(span)
+            else:
+                pending = self._pending.get(span.trace_id)
+                if pending is not None:
+                    pending.append(span)
+                    return
+                spans = [span]
+        self.exporter.export(spans)
+
+
+@lru_cache
+def get_tracer() -> Tracer | None:
+    """settings.tracing_exporter에 맞는 Tracer를 만든다. none이면 None (tracing 꺼짐)."""
+    settings = get_settings()
+    if settings.tracing_exporter == "none":
+        return None
+    if settings.tracing_exporter == "file":
+        exporter = OTLPFileExporter(settings.tracing_file_path, settings.tracing_service_name)
+    elif settings.tracing_exporter == "otlp_http":
+        exporter = OTLPHTTPExporter(settings.tracing_otlp_endpoint, settings.tracing_service_name)
+    else:
+        raise ValueError(f"지원하지 않는 tracing_exporter: {settings.tracing_exporter}")
+    logger.info("tracing_enabled", exporter=settings.tracing_exporter)
+    return Tracer(exporter, settings.tracing_sample_ratio)
+
+
+def start_span(
+    name: str,
+    attributes: dict[str, Any] | None = None,
+    kind: int = SPAN_KIND_INTERNAL,
+    activate: bool = True,
+) -> _SpanScope | _NoopScope:
+    """with 블록 동안 현재 span이 되는 child span을 시작한다 (현재 span이 없으면 새 trace의 root).
+
+    activate=False이면 span을 기록만 하고 현재 span으로 설정하지 않는다 (generator 내부용).
+    tracing이 꺼져 있으면 공유 no-op scope를 그대로 반환하므로 호출 비용이 거의 없다.
+    """
+    tracer = get_tracer()
+    if tracer is None:
+        return _NOOP_SCOPE
+    return _SpanScope(tracer.start_span(name, attributes, kind), activate)
+
+
+def instrument_graph(graph: Any, name: str = "graph") -> Any:
+    """compile된 그래프의 stream/astream에 root span을 씌운다. tracing이 꺼져 있으면 그대로 반환한다.
+
+    invoke/ainvoke는 내부에서 stream/astream을 호출하므로 같은 root span으로 묶인다.
+    """
+    if get_tracer() is None:
+        return graph
+    stream, astream = graph.stream, graph.astream
+
+    def _attributes(input: Any, config: Any) -> dict[str, Any]:
+        configurable = (config or {}).get("configurable", {})
+        metadata = input.get("metadata", {}) if isinstance(input, dict) else {}
+        return {
+            "graph.name": name,
+            "session.id": configurable.get("thread_id") or metadata.get("session_id"),
+        }
+
+    def traced_stream(input: Any, config: Any = None, **kwargs: Any):
+        with start_span(f"{name}.invoke", _attributes(input, config), SPAN_KIND_SERVER):
+            yield from stream(input, config, **kwargs)
+
+    async def traced_astream(input: Any, config: Any = None, **kwargs: Any):
+        with start_span(f"{name}.invoke", _attributes(input, config), SPAN_KIND_SERVER):
+            async for chunk in astream(input, config, **kwargs):
+                yield chunk
+
+    graph.stream, graph.astream = traced_stream, traced_astream
+    return graph
+
+
+# ── OTLP/JSON 인코딩 / exporter ─────────────────────────────
+
+
+def _any_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [_any_value(v) for v in value]}}
+    return {"stringValue": str(value)}
+
+
+def _key_values(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    return [{"key": key, "value": _any_value(value)} for key, value in attributes.items()]
+
+
+def encode_spans(spans: list[Span], service_name: str) -> dict[str, Any]:
+    """span 목록을 OTLP/JSON ExportTraceServiceRequest 형식으로 변환한다."""
+    encoded = []
+    for span in spans:
+        item: dict[str, Any] = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": span.kind,
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns),
+            "attributes": _key_values(span.attributes),
+            "status": {"code": span.status_code},
+        }
+        if span.parent_span_id:
+            item["parentSpanId"] = span.parent_span_id
+        if span.status_message:
+            item["status"]["message"] = span.status_message
+        if span.events:
+            item["events"] = [
+                {"timeUnixNano": str(ts), "name": event, "attributes": _key_values(attrs)}
+                for ts, event, attrs in span.events
+            ]
+        encoded.append(item)
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": _key_values({"service.name": service_name})},
+                "scopeSpans": [{"scope": {"name": "workflows.v1_1"}, "spans": encoded}],
+            }
+        ]
+    }
+
+
+class InMemorySpanExporter:
+    """테스트/벤치마크용 — 내보낸 span을 리스트에 보관한다."""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+
+    def export(self, spans: list[Span]) -> None:
+        self.spans.extend(spans)
+
+    def flush(self, timeout: float = 2.0) -> None:
+        pass
+
+
+class OTLPFileExporter:
+    """trace마다 OTLP/JSON 한 줄을 background thread에서 파일에 추가한다."""
+
+    def __init__(self, path: str, service_name: str = "workflow") -> None:
+        serialize = json_serializer()
+        self._writer = BackgroundLogWriter(
+            open(path, "a", encoding="utf-8"),
+            render=lambda batch: serialize(encode_spans(batch["spans"], service_name)),
+        )
+
+    def export(self, spans: list[Span]) -> None:
+        self._writer.write({"spans": spans})
+
+    def flush(self, timeout: float = 2.0) -> None:
+        self._writer.flush(timeout)
+
+
+class _OTLPHTTPStream:
+    """BackgroundLogWriter가 모아 쓴 OTLP/JSON 줄들을 하나의 요청으로 합쳐 POST한다."""
+
+    def __init__(self, endpoint: str, timeout: float) -> None:
+        self._endpoint = endpoint
+        self._timeout = timeout
+
+    def write(self, text: str) -> None:
+        resource_spans = [
+            rs for line in text.splitlines() if line for rs in json.loads(line)["resourceSpans"]
+        ]
+        request = urllib.request.Request(
+            self._endpoint,
+            data=json.dumps({"resourceSpans": resource_spans}).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self._timeout) as response:
+            response.read()
+
+    def flush(self) -> None:
+        pass
+
+
+class OTLPHTTPExporter:
+    """OTLP/HTTP JSON으로 collector에 보낸다. 전송 실패는 writer의 dropped 개수로만 남는다."""
+
+    def __init__(self, endpoint: str, service_name: str = "workflow", timeout: float = 2.0) -> None:
+        serialize = json_serializer()
+        self._writer = BackgroundLogWriter(
+            _OTLPHTTPStream(endpoint, timeout),
+            render=lambda batch: serialize(encode_spans(batch["spans"], service_name)),
+            batch_size=64,
+        )
+
+    def export(self, spans: list[Span]) -> None:
+        self._writer.write({"spans": spans})
+
+    def flush(self, timeout: float = 2.0) -> None:
+        self._writer.flush(timeout)
+
+
+# ── 로컬 collector 대용 ──────────────────────────────────────
+
+
+class _CollectorHandler(BaseHTTPRequestHandler):
+    on_request: Callable[[dict[str, Any]], None]
+
+    def do_POST(self) -> None:
+        if self.path != "/v1/traces":
+            self.send_error(404)
+            return
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.on_request(json.loads(body))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def start_collector(
+    port: int,
+    on_request: Callable[[dict[str, Any]], None],
+    host: str = "127.0.0.1",
+) -> ThreadingHTTPServer:
+    """OTLP/HTTP JSON(POST /v1/traces)을 받아 on_request로 넘기는 로컬 collector를 daemon thread로 띄운다."""
+    handler = type("CollectorHandler", (_CollectorHandler,), {"on_request": staticmethod(on_request)})
+    server = ThreadingHTTPServer((host, port), handler)
+    threading.Thread(target=server.serve_forever, name="trace_collector", daemon=True).start()
+    logger.info("trace_collector_started", host=host, port=server.server_address[1])
+    return server
@@ -5,11 +5,19 @@ from typing import Any
 
 from core.exceptions import MCPConnectionError, MCPToolError
 from core.logging import get_logger
+from core.metrics import TOOL_ERRORS, TOOL_SECONDS
+from core.tracing import SPAN_KIND_CLIENT, start_span
 from mcp.tool.base_tool import BaseTool
 
 logger = get_logger(__name__)
 
 
+def _result_count(result: Any) -> int | None:
+    """tool 결과에 results 리스트가 있으면 그 길이를 반환한다 (span 속성용)."""
+    results = result.get("results") if isinstance(result, dict) else None
+    return len(results) if isinstance(results, list) else None
+
+
 class MCPClient:
     """MCP 서버에 연결하여 tool을 관리하고 호출하는 클라이언트."""
 
@@ -51,12 +59,43 @@ class MCPClient:
         logger.info("mcp_tool_call_start", tool_name=tool_name, args=args)
         tool = self.get_tool(tool_name)
         try:
-            result = tool.call(args)
+            with (
+                start_span(f"tool {tool_name}", {"tool.name": tool_name}, SPAN_KIND_CLIENT) as span,
+                TOOL_SECONDS.time(tool=tool_name),
+            ):
+                result = tool.call(args)
+                span.set_attribute("tool.result_count", _result_count(result))
+            logger.info("mcp_tool_call_end", tool_name=tool_name)
+            return result
+        except MCPToolError:
+            TOOL_ERRORS.inc(tool=tool_name)
+            raise
+        except Exception as exc:
+            TOOL_ERRORS.inc(tool=tool_name)
+            raise MCPToolError(
+                f"Tool 호출 실패: {tool_name}",
+                cause=exc,
+                context={"tool_name": tool_name, "args": args},
+            ) from exc
+
+    async def acall_tool(self, tool_name: str, args: dict[str, Any]) -> dict[str, Any]:
+        """call_tool의 async 버전."""
+        logger.info("mcp_tool_call_start", tool_name=tool_name, args=args)
+        tool = self.get_tool(tool_name)
+        try:
+            with (
+                start_span(f"tool {tool_name}", {"tool.name": tool_name}, SPAN_KIND_CLIENT) as span,
+                TOOL_SECONDS.time(tool=tool_name),
+            ):
+                result = await tool.acall(args)
+                span.set_attribute("tool.result_count", _result_count(result))
             logger.info("mcp_tool_call_end", tool_name=tool_name)
             return result
         except MCPToolError:
+            TOOL_ERRORS.inc(tool=tool_name)
             raise
         except Exception as exc:
+            TOOL_ERRORS.inc(tool=tool_name)
             raise MCPToolError(
                 f"Tool 호출 실패: {tool_name}",
                 cause=exc,
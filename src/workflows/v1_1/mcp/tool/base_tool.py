@@ -1,6 +1,7 @@
 # MCP tool 추상 클래스 — 새 tool 추가 시 이 클래스를 상속
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -26,3 +27,7 @@ class BaseTool(ABC):
     @abstractmethod
     def call(self, args: dict[str, Any]) -> dict[str, Any]:
         """tool을 실행하고 결과를 반환한다."""
+
+    async def acall(self, args: dict[str, Any]) -> dict[str, Any]:
+        """call의 async 버전. 기본 구현은 동기 call을 worker thread에서 실행한다."""
+        return await asyncio.to_thread(self.call, args)
@@ -1,6 +1,7 @@
 # Agent 추상 클래스 — 인터페이스 정의만 담당, 실행 로직은 executor.py에 위임
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 
 from state import GraphState
@@ -12,3 +13,7 @@ class BaseAgent(ABC):
     @abstractmethod
     def run(self, state: GraphState) -> GraphState:
         """state를 받아 처리한 뒤 갱신된 state를 반환한다."""
+
+    async def arun(self, state: GraphState) -> GraphState:
+        """run의 async 버전. 기본 구현은 동기 run을 worker thread에서 실행한다."""
+        return await asyncio.to_thread(self.run, state)
@@ -1,20 +1,65 @@
 # Agent 공통 실행 로직 — RAG 조회, MCP tool 호출, LLM 호출을 조율한다
 from __future__ import annotations
 
-from typing import Any
+import threading
+from concurrent.futures import CancelledError
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
 
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage, BaseMessageChunk, HumanMessage, SystemMessage
 
+from config.settings import get_settings
+from core.concurrency import FailurePolicy, TaskOutcome, arun_bounded, run_bounded
+from core.context_budget import ContextAssembler
 from core.exceptions import AgentExecutionError
-from core.llm import call_llm
+from core.llm import DEFAULT_LLM_PROFILE, acall_llm, astream_llm, call_llm, stream_llm
 from core.logging import get_logger
+from core.metrics import RETRIEVAL_DOCUMENTS, RETRIEVAL_SECONDS
+from core.tracing import SPAN_KIND_CLIENT, start_span
 from mcp.client import MCPClient
-from rag.base_retriever import BaseRetriever
+from rag.base_retriever import BaseRetriever, Document
 from state import GraphState
 
 logger = get_logger(__name__)
 
 
+def extract_user_input(state: GraphState) -> str:
+    """state의 마지막 메시지에서 사용자 입력 문자열을 꺼낸다."""
+    messages = state.get("messages", [])
+    last_message = messages[-1] if messages else None
+    return (
+        last_message.content
+        if last_message and hasattr(last_message, "content")
+        else str(last_message) if last_message else ""
+    )
+
+
+@dataclass
+class PrefetchedInputs:
+    """LLM 호출 전 단계(RAG 조회 + tool 호출)를 미리 수행한 결과.
+
+    speculative 실행에서 intent 분류와 동시에 만들어지며, 같은 user_input에 대해서만 재사용된다.
+    """
+
+    user_input: str
+    context_items: list[str]
+    tool_results: list[dict[str, Any]]
+
+
+def _raise_if_cancelled(cancelled: threading.Event | None) -> None:
+    if cancelled is not None and cancelled.is_set():
+        raise CancelledError("prefetch가 취소되었습니다.")
+
+
+def _chunk_text(chunk: BaseMessageChunk) -> str:
+    if isinstance(chunk.content, str):
+        return chunk.content
+    return "".join(
+        part.get("text", "") if isinstance(part, dict) else str(part)
+        for part in chunk.content
+    )
+
+
 class AgentExecutor:
     """주입된 retriever/tool 조합으로 Agent 실행을 조율한다."""
 
@@ -25,33 +70,117 @@ class AgentExecutor:
         retrievers: list[BaseRetriever] | None = None,
         mcp_client: MCPClient | None = None,
         tools: list[str] | None = None,
+        retrieval_concurrency: int | None = None,
+        retrieval_timeout: float | None = None,
+        retrieval_failure_policy: FailurePolicy | str | None = None,
+        tool_concurrency: int | None = None,
+        tool_timeout: float | None = None,
+        tool_failure_policy: FailurePolicy | str | None = None,
+        overlap_phases: bool | None = None,
+        stream: bool = False,
+        context_assembler: ContextAssembler | None = None,
+        llm_profile: str = DEFAULT_LLM_PROFILE,
     ) -> None:
+        settings = get_settings()
         self._system_prompt = system_prompt
         self._user_prompt_template = user_prompt_template
         self._retrievers = retrievers or []
         self._mcp_client = mcp_client
         self._tools = tools or []
+        # 지정하지 않은 fan-out 옵션은 settings 기본값을 따른다.
+        self._retrieval_concurrency = (
+            retrieval_concurrency
+            if retrieval_concurrency is not None
+            else settings.retrieval_max_concurrency
+        )
+        self._retrieval_timeout = (
+            retrieval_timeout
+            if retrieval_timeout is not None
+            else settings.retrieval_timeout_seconds
+        )
+        self._retrieval_failure_policy = FailurePolicy(
+            retrieval_failure_policy or settings.retrieval_failure_policy
+        )
+        self._tool_concurrency = (
+            tool_concurrency if tool_concurrency is not None else settings.tool_max_concurrency
+        )
+        self._tool_timeout = (
+            tool_timeout if tool_timeout is not None else settings.tool_timeout_seconds
+        )
+        self._tool_failure_policy = FailurePolicy(
+            tool_failure_policy or settings.tool_failure_policy
+        )
+        self._overlap_phases = (
+            overlap_phases if overlap_phases is not None else settings.overlap_retrieval_and_tools
+        )
+        # True이면 LLM 응답을 토큰 단위로 스트리밍하면서 최종 문자열로 조립한다.
+        self._stream = stream
+        # LLM 호출 직전에 context 중복 제거 + token 예산 적용 (core/context_budget.py)
+        self._assembler = context_assembler or ContextAssembler.from_settings()
+        # settings.llm_profiles의 프로필 이름 — 노드마다 다른 model/max_tokens를 사용할 수 있다.
+        self._llm_profile = llm_profile
 
     def execute(
         self,
         state: GraphState,
         extra_prompt_vars: dict[str, Any] | None = None,
+        prefetched: PrefetchedInputs | None = None,
     ) -> GraphState:
-        """RAG 조회 → MCP tool 호출 → LLM 호출 순서로 실행한다."""
-        messages = state.get("messages", [])
-        last_message = messages[-1] if messages else None
-        user_input = (
-            last_message.content
-            if last_message and hasattr(last_message, "content")
-            else str(last_message) if last_message else ""
-        )
+        """RAG 조회 → MCP tool 호출 → context 조립 → LLM 호출 순서로 실행한다.
+
+        overlap_phases가 켜져 있으면 RAG 조회와 MCP tool 호출을 동시에 진행한다.
+        같은 입력에 대한 prefetched 결과가 주어지면 RAG/tool 단계를 건너뛴다.
+        context 조립 단계는 중복 chunk를 제거하고 token 예산 안으로 채우며,
+        반환 state의 context도 조립된 결과로 교체되어 노드/턴을 거쳐도 무한히 커지지 않는다.
+        """
+        user_input = extract_user_input(state)
+        context_items: list[str] = list(state.get("context", []))
+
+        try:
+            if prefetched is not None and prefetched.user_input == user_input:
+                context_items, tool_results = prefetched.context_items, prefetched.tool_results
+            else:
+                context_items, tool_results = self._gather_inputs(user_input, context_items)
+            pack = self._assembler.assemble(
+                context_items, tool_results, carried=len(state.get("context", []))
+            )
+            context_items = pack.items
+            agent_output = self._run_llm(
+                user_input, context_items, pack.tool_results, extra_prompt_vars
+            )
+        except AgentExecutionError:
+            raise
+        except Exception as exc:
+            raise AgentExecutionError(
+                "Agent 실행 중 오류 발생",
+                cause=exc,
+                context={"user_input": user_input},
+            ) from exc
+
+        return self._build_result(state, agent_output, context_items)
 
+    async def aexecute(
+        self,
+        state: GraphState,
+        extra_prompt_vars: dict[str, Any] | None = None,
+        prefetched: PrefetchedInputs | None = None,
+    ) -> GraphState:
+        """execute의 async 버전. 모든 I/O를 이벤트 루프를 막지 않고 수행한다."""
+        user_input = extract_user_input(state)
         context_items: list[str] = list(state.get("context", []))
 
         try:
-            context_items = self._run_retrieval(user_input, context_items)
-            tool_results = self._run_tools(user_input)
-            agent_output = self._run_llm(user_input, context_items, tool_results, extra_prompt_vars)
+            if prefetched is not None and prefetched.user_input == user_input:
+                context_items, tool_results = prefetched.context_items, prefetched.tool_results
+            else:
+                context_items, tool_results = await self._agather_inputs(user_input, context_items)
+            pack = self._assembler.assemble(
+                context_items, tool_results, carried=len(state.get("context", []))
+            )
+            context_items = pack.items
+            agent_output = await self._arun_llm(
+                user_input, context_items, pack.tool_results, extra_prompt_vars
+            )
         except AgentExecutionError:
             raise
         except Exception as exc:
@@ -61,6 +190,84 @@ class AgentExecutor:
                 context={"user_input": user_input},
             ) from exc
 
+        return self._build_result(state, agent_output, context_items)
+
+    def prefetch(
+        self, state: GraphState, cancelled: threading.Event | None = None
+    ) -> PrefetchedInputs:
+        """LLM 호출 없이 RAG 조회와 tool 호출만 미리 수행한다.
+
+        cancelled가 설정되면 아직 시작하지 않은 단계를 건너뛰고 CancelledError를 던진다.
+        이미 진행 중인 retriever/tool 호출은 중단하지 못하고 끝까지 실행된다.
+        """
+        user_input = extract_user_input(state)
+        context_items, tool_results = self._gather_inputs(
+            user_input, list(state.get("context", [])), cancelled
+        )
+        return PrefetchedInputs(user_input, context_items, tool_results)
+
+    async def aprefetch(self, state: GraphState) -> PrefetchedInputs:
+        """prefetch의 async 버전."""
+        user_input = extract_user_input(state)
+        context_items, tool_results = await self._agather_inputs(
+            user_input, list(state.get("context", []))
+        )
+        return PrefetchedInputs(user_input, context_items, tool_results)
+
+    def _gather_inputs(
+        self,
+        user_input: str,
+        context_items: list[str],
+        cancelled: threading.Event | None = None,
+    ) -> tuple[list[str], list[dict[str, Any]]]:
+        """RAG 조회와 tool 호출 결과를 모은다. 가능하면 두 단계를 겹쳐 실행한다.
+
+        cancelled는 speculative prefetch의 취소 신호로, 단계를 시작하기 전마다 확인한다.
+        """
+        _raise_if_cancelled(cancelled)
+        if not (self._overlap_phases and self._retrievers and self._tools):
+            retrieved = self._run_retrieval(user_input, context_items)
+            _raise_if_cancelled(cancelled)
+            return retrieved, self._run_tools(user_input)
+
+        retrieval, tools = run_bounded(
+            [
+                ("retrieval", lambda: self._run_retrieval(user_input, context_items)),
+                ("tools", lambda: self._run_tools(user_input)),
+            ],
+            max_concurrency=2,
+        )
+        for phase in (retrieval, tools):
+            if phase.error is not None:
+                raise phase.error
+        return retrieval.value, tools.value
+
+    async def _agather_inputs(
+        self, user_input: str, context_items: list[str]
+    ) -> tuple[list[str], list[dict[str, Any]]]:
+        """_gather_inputs의 async 버전."""
+        if not (self._overlap_phases and self._retrievers and self._tools):
+            return (
+                await self._arun_retrieval(user_input, context_items),
+                await self._arun_tools(user_input),
+            )
+
+        retrieval, tools = await arun_bounded(
+            [
+                ("retrieval", lambda: self._arun_retrieval(user_input, context_items)),
+                ("tools", lambda: self._arun_tools(user_input)),
+            ],
+            max_concurrency=2,
+        )
+        for phase in (retrieval, tools):
+            if phase.error is not None:
+                raise phase.error
+        return retrieval.value, tools.value
+
+    @staticmethod
+    def _build_result(
+        state: GraphState, agent_output: str, context_items: list[str]
+    ) -> GraphState:
         return {
             "messages": [],
             "intent": state.get("intent", ""),
@@ -72,24 +279,112 @@ class AgentExecutor:
     def _run_retrieval(
         self, query: str, context_items: list[str]
     ) -> list[str]:
-        """주입된 모든 retriever로 RAG 조회를 수행한다."""
-        for retriever in self._retrievers:
-            logger.info("retrieval_start", retriever=type(retriever).__name__)
-            try:
-                docs = retriever.retrieve(query)
-                context_items.extend(doc.page_content for doc in docs)
-            except Exception as exc:
+        """주입된 모든 retriever로 RAG 조회를 수행한다.
+
+        retrieval_concurrency가 2 이상이면 retriever들을 동시에 실행한다.
+        결과는 완료 순서와 무관하게 retriever 등록 순서대로 병합되어 프롬프트가 안정적으로 유지된다.
+        실패 시 FAIL_FAST는 즉시 AgentExecutionError를, DEGRADE는 실패한 소스만 제외한다.
+        """
+        if not self._retrievers:
+            return context_items
+
+        outcomes = run_bounded(
+            [
+                (type(retriever).__name__, self._retrieval_task(retriever, query))
+                for retriever in self._retrievers
+            ],
+            max_concurrency=self._retrieval_concurrency,
+            timeout=self._retrieval_timeout,
+            fail_fast=self._retrieval_failure_policy is FailurePolicy.FAIL_FAST,
+        )
+        return self._merge_retrieval(outcomes, query, context_items)
+
+    async def _arun_retrieval(
+        self, query: str, context_items: list[str]
+    ) -> list[str]:
+        """_run_retrieval의 async 버전. 정책과 병합 순서는 동일하다."""
+        if not self._retrievers:
+            return context_items
+
+        outcomes = await arun_bounded(
+            [
+                (type(retriever).__name__, self._aretrieval_task(retriever, query))
+                for retriever in self._retrievers
+            ],
+            max_concurrency=self._retrieval_concurrency,
+            timeout=self._retrieval_timeout,
+            fail_fast=self._retrieval_failure_policy is FailurePolicy.FAIL_FAST,
+        )
+        return self._merge_retrieval(outcomes, query, context_items)
+
+    def _merge_retrieval(
+        self, outcomes: list[TaskOutcome], query: str, context_items: list[str]
+    ) -> list[str]:
+        """fan-out 결과를 실패 정책에 따라 검사한 뒤 retriever별 순위를 번갈아(round-robin) context에 병합한다."""
+        fail_fast = self._retrieval_failure_policy is FailurePolicy.FAIL_FAST
+        for outcome in outcomes:
+            if outcome.error is None:
+                continue
+            if fail_fast:
                 raise AgentExecutionError(
-                    f"RAG 조회 실패: {type(retriever).__name__}",
-                    cause=exc,
-                    context={"retriever": type(retriever).__name__, "query": query},
-                ) from exc
+                    f"RAG 조회 실패: {outcome.name}",
+                    cause=outcome.error,
+                    context={"retriever": outcome.name, "query": query},
+                ) from outcome.error
+            logger.warning(
+                "retrieval_degraded",
+                retriever=outcome.name,
+                error=str(outcome.error),
+            )
+
+        ranked = [outcome.value for outcome in outcomes if outcome.done and outcome.error is None]
+        # retriever마다 score 척도(RRF, 거리 등)가 달라 score끼리 비교하지 않는다. 각 retriever가 반환한
+        # 순위대로 1위들(등록 순) → 2위들 → ... 순으로 넣어, token 예산이 모자라도 retriever마다 상위 문서가 남는다.
+        for rank in range(max(map(len, ranked), default=0)):
+            context_items.extend(docs[rank].page_content for docs in ranked if rank < len(docs))
         return context_items
 
+    @staticmethod
+    def _retrieval_task(
+        retriever: BaseRetriever, query: str
+    ) -> Callable[[], list[Document]]:
+        def _task():
+            name = type(retriever).__name__
+            logger.info("retrieval_start", retriever=name)
+            with (
+                start_span(f"retriever {name}", {"retriever.name": name}, SPAN_KIND_CLIENT) as span,
+                RETRIEVAL_SECONDS.time(retriever=name),
+            ):
+                docs = retriever.retrieve(query)
+            span.set_attribute("retrieval.documents", len(docs))
+            RETRIEVAL_DOCUMENTS.observe(len(docs), retriever=name)
+            return docs
+
+        return _task
+
+    @staticmethod
+    def _aretrieval_task(
+        retriever: BaseRetriever, query: str
+    ) -> Callable[[], Awaitable[list[Document]]]:
+        async def _task():
+            name = type(retriever).__name__
+            logger.info("retrieval_start", retriever=name)
+            with (
+                start_span(f"retriever {name}", {"retriever.name": name}, SPAN_KIND_CLIENT) as span,
+                RETRIEVAL_SECONDS.time(retriever=name),
+            ):
+                docs = await retriever.aretrieve(query)
+            span.set_attribute("retrieval.documents", len(docs))
+            RETRIEVAL_DOCUMENTS.observe(len(docs), retriever=name)
+            return docs
+
+        return _task
+
     def _run_tools(self, user_input: str) -> list[dict[str, Any]]:
         """주입된 MCP client를 통해 등록된 tool들을 호출한다.
 
-        현재는 등록된 tool을 순서대로 모두 호출하는 단순 파이프라인 방식이다.
+        현재는 등록된 tool을 모두 호출하는 단순 파이프라인 방식이다.
+        tool_concurrency가 2 이상이면 tool들을 동시에 호출하며, 결과는 항상 등록 순서로 수집한다.
 
         TODO: 아래 중 하나로 교체하면 진짜 '에이전트' 동작이 된다.
           - LLM tool calling 루프: LLM이 tool 선택 + args 생성 → 결과를 다시 LLM에 전달
@@ -98,22 +393,67 @@ class AgentExecutor:
           - ReAct 패턴: Reasoning → Action → Observation 반복
             (langgraph: ToolNode + should_continue 조건 엣지 조합)
         """
-        results: list[dict[str, Any]] = []
         if not self._mcp_client or not self._tools:
-            return results
+            return []
 
-        for tool_name in self._tools:
-            logger.info("tool_call_start", tool_name=tool_name)
-            try:
-                result = self._mcp_client.call_tool(tool_name, {"query": user_input})
-                results.append(result)
-            except Exception as exc:
+        outcomes = run_bounded(
+            [(tool_name, self._tool_task(tool_name, user_input)) for tool_name in self._tools],
+            max_concurrency=self._tool_concurrency,
+            timeout=self._tool_timeout,
+            fail_fast=self._tool_failure_policy is FailurePolicy.FAIL_FAST,
+        )
+        return self._collect_tool_results(outcomes, user_input)
+
+    async def _arun_tools(self, user_input: str) -> list[dict[str, Any]]:
+        """_run_tools의 async 버전."""
+        if not self._mcp_client or not self._tools:
+            return []
+
+        outcomes = await arun_bounded(
+            [(tool_name, self._atool_task(tool_name, user_input)) for tool_name in self._tools],
+            max_concurrency=self._tool_concurrency,
+            timeout=self._tool_timeout,
+            fail_fast=self._tool_failure_policy is FailurePolicy.FAIL_FAST,
+        )
+        return self._collect_tool_results(outcomes, user_input)
+
+    def _collect_tool_results(
+        self, outcomes: list[TaskOutcome], user_input: str
+    ) -> list[dict[str, Any]]:
+        """tool 호출 결과를 실패 정책에 따라 검사한 뒤 등록 순서대로 모은다."""
+        fail_fast = self._tool_failure_policy is FailurePolicy.FAIL_FAST
+        for outcome in outcomes:
+            if outcome.error is None:
+                continue
+            if fail_fast:
                 raise AgentExecutionError(
-                    f"MCP tool 호출 실패: {tool_name}",
-                    cause=exc,
-                    context={"tool_name": tool_name, "user_input": user_input},
-                ) from exc
-        return results
+                    f"MCP tool 호출 실패: {outcome.name}",
+                    cause=outcome.error,
+                    context={"tool_name": outcome.name, "user_input": user_input},
+                ) from outcome.error
+            logger.warning("tool_call_degraded", tool_name=outcome.name, error=str(outcome.error))
+
+        return [
+            outcome.value
+            for outcome in outcomes
+            if outcome.done and outcome.error is None
+        ]
+
+    def _tool_task(self, tool_name: str, user_input: str) -> Callable[[], dict[str, Any]]:
+        def _task():
+            logger.info("tool_call_start", tool_name=tool_name)
+            return self._mcp_client.call_tool(tool_name, {"query": user_input})
+
+        return _task
+
+    def _atool_task(
+        self, tool_name: str, user_input: str
+    ) -> Callable[[], Awaitable[dict[str, Any]]]:
+        async def _task():
+            logger.info("tool_call_start", tool_name=tool_name)
+            return await self._mcp_client.acall_tool(tool_name, {"query": user_input})
+
+        return _task
 
     def _run_llm(
         self,
@@ -123,6 +463,38 @@ class AgentExecutor:
         extra_prompt_vars: dict[str, Any] | None = None,
     ) -> str:
         """수집된 컨텍스트와 tool 결과를 바탕으로 LLM 호출을 수행한다."""
+        messages = self._build_messages(user_input, context_items, tool_results, extra_prompt_vars)
+        if self._stream:
+            return "".join(
+                _chunk_text(chunk) for chunk in stream_llm(messages, profile=self._llm_profile)
+            )
+        return call_llm(messages, profile=self._llm_profile).content
+
+    async def _arun_llm(
+        self,
+        user_input: str,
+        context_items: list[str],
+        tool_results: list[dict[str, Any]],
+        extra_prompt_vars: dict[str, Any] | None = None,
+    ) -> str:
+        """_run_llm의 async 버전."""
+        messages = self._build_messages(user_input, context_items, tool_results, extra_prompt_vars)
+        if self._stream:
+            return "".join(
+                [
+                    _chunk_text(chunk)
+                    async for chunk in astream_llm(messages, profile=self._llm_profile)
+                ]
+            )
+        return (await acall_llm(messages, profile=self._llm_profile)).content
+
+    def _build_messages(
+        self,
+        user_input: str,
+        context_items: list[str],
+        tool_results: list[dict[str, Any]],
+        extra_prompt_vars: dict[str, Any] | None = None,
+    ) -> list[BaseMessage]:
         context_text = "\n".join(context_items) if context_items else "없음"
         if tool_results:
             context_text += "\n\n[Tool 결과]\n" + "\n".join(
@@ -130,8 +502,7 @@ class AgentExecutor:
             )
 
         extra = extra_prompt_vars or {}
-        response = call_llm([
+        return [
             SystemMessage(content=self._system_prompt.format(context=context_text, **extra)),
             HumanMessage(content=self._user_prompt_template.format(user_input=user_input, **extra)),
-        ])
-        return response.content
+        ]
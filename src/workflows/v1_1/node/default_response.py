@@ -1,5 +1,5 @@
 # 기본 응답 노드 — intent 미매칭 또는 분류 오류 시 처리
-# - error 필드가 있으면 시스템 오류 응답 (LLM 호출 없이 고정 메시지)
+# - error 필드가 있으면 시스템 오류 응답 (LLM 호출 없이 고정 메시지, final_response도 그대로 통과)
 # - error 필드가 없으면 AgentExecutor를 통해 LLM으로 단순 질의 응답
 from __future__ import annotations
 
@@ -26,19 +26,33 @@ class DefaultResponseNode(BaseAgent):
         error = state.get("error")
 
         if error:
-            logger.warning("default_response_error_case", error=error)
-            return {
-                "agent_output": ERROR_MESSAGE,
-                "messages": [],
-                "intent": state.get("intent", Intent.UNKNOWN.value),
-                "context": state.get("context", []),
-                "metadata": state.get("metadata", {}),
-                "error": error,
-            }
+            return self._error_response(state, error)
 
         logger.info("default_response_general_query")
         return self._executor.execute(state)
 
+    async def arun(self, state: GraphState) -> GraphState:
+        error = state.get("error")
+
+        if error:
+            return self._error_response(state, error)
+
+        logger.info("default_response_general_query")
+        return await self._executor.aexecute(state)
+
+    @staticmethod
+    def _error_response(state: GraphState, error: str) -> GraphState:
+        logger.warning("default_response_error_case", error=error)
+        return {
+            "agent_output": ERROR_MESSAGE,
+            "messages": [],
+            "intent": state.get("intent", Intent.UNKNOWN.value),
+            "context": state.get("context", []),
+            "metadata": state.get("metadata", {}),
+            "error": error,
+            "output_is_final": True,
+        }
+
 
 _node: DefaultResponseNode | None = None
 
@@ -54,3 +68,9 @@ def _get_node() -> DefaultResponseNode:
 def default_response(state: GraphState) -> GraphState:
     """intent 미매칭 또는 분류 오류 발생 시 기본 응답을 생성한다."""
     return _get_node().run(state)
+
+
+@log_node_execution
+async def adefault_response(state: GraphState) -> GraphState:
+    """default_response의 async 버전 — graph.ainvoke 경로에서 사용된다."""
+    return await _get_node().arun(state)
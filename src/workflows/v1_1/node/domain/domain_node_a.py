@@ -1,18 +1,38 @@
 # Domain Agent A (intent: INTENT_A) — 추후 비즈니스 로직을 채워넣을 자리
 from __future__ import annotations
 
+import threading
+
+from config.settings import get_settings
 from core.logging import get_logger, log_node_execution
 from mcp.client import MCPClient
 from mcp.tool.search_tool import SearchTool
 from node._base_agent import BaseAgent
-from node._executor import AgentExecutor
+from node._executor import AgentExecutor, PrefetchedInputs
+from node.speculation import aclaim_prefetch, claim_prefetch
 from prompt.agent.agent_a_prompt import SYSTEM_PROMPT, USER_PROMPT_TEMPLATE
+from rag.base_retriever import BaseRetriever
 from rag.iflow_retriever import IflowRetriever
+from rag.local_hybrid_retriever import LocalHybridRetriever
 from state import GraphState
 
 logger = get_logger(__name__)
 
 
+def _make_retriever() -> BaseRetriever:
+    """settings.agent_a_retriever에 맞는 retriever를 만든다.
+
+    local은 iflow collection snapshot을 메모리에 올려 검색하므로 소규모 collection에서
+    Milvus 왕복 비용을 없앤다.
+    """
+    kind = get_settings().agent_a_retriever
+    if kind == "milvus":
+        return IflowRetriever()
+    if kind == "local":
+        return LocalHybridRetriever()
+    raise ValueError(f"지원하지 않는 agent_a_retriever: {kind}")
+
+
 class AgentA(BaseAgent):
     """INTENT_A intent 처리 Agent — retriever + tool 조합을 주입받는다."""
 
@@ -24,13 +44,26 @@ class AgentA(BaseAgent):
         self._executor = AgentExecutor(
             system_prompt=SYSTEM_PROMPT,
             user_prompt_template=USER_PROMPT_TEMPLATE,
-            retrievers=[IflowRetriever()],
+            retrievers=[_make_retriever()],
             mcp_client=mcp_client,
             tools=["search"],
+            llm_profile="agent_a",
         )
 
     def run(self, state: GraphState) -> GraphState:
-        return self._executor.execute(state)
+        return self._executor.execute(state, prefetched=claim_prefetch(state))
+
+    async def arun(self, state: GraphState) -> GraphState:
+        return await self._executor.aexecute(state, prefetched=await aclaim_prefetch(state))
+
+    def prefetch(
+        self, state: GraphState, cancelled: threading.Event | None = None
+    ) -> PrefetchedInputs:
+        """speculative 실행용 — intent 분류 중에 RAG/tool 단계를 미리 수행한다."""
+        return self._executor.prefetch(state, cancelled)
+
+    async def aprefetch(self, state: GraphState) -> PrefetchedInputs:
+        return await self._executor.aprefetch(state)
 
 
 _agent: AgentA | None = None
@@ -49,3 +82,9 @@ def _get_agent() -> AgentA:
 def agent_a_node(state: GraphState) -> GraphState:
     """LangGraph 노드 함수로 Agent A를 실행한다."""
     return _get_agent().run(state)
+
+
+@log_node_execution
+async def aagent_a_node(state: GraphState) -> GraphState:
+    """agent_a_node의 async 버전 — graph.ainvoke 경로에서 사용된다."""
+    return await _get_agent().arun(state)
@@ -1,11 +1,14 @@
 # Domain Agent B (intent: INTENT_B) — 추후 비즈니스 로직을 채워넣을 자리
 from __future__ import annotations
 
+import threading
+
 from core.logging import get_logger, log_node_execution
 from mcp.client import MCPClient
 from mcp.tool.summary_tool import SummaryTool
 from node._base_agent import BaseAgent
-from node._executor import AgentExecutor
+from node._executor import AgentExecutor, PrefetchedInputs
+from node.speculation import aclaim_prefetch, claim_prefetch
 from prompt.agent.agent_b_prompt import SYSTEM_PROMPT, USER_PROMPT_TEMPLATE
 from rag.xxx_retriever import XxxRetriever
 from state import GraphState
@@ -27,10 +30,23 @@ class AgentB(BaseAgent):
             retrievers=[XxxRetriever()],
             mcp_client=mcp_client,
             tools=["summary"],
+            llm_profile="agent_b",
         )
 
     def run(self, state: GraphState) -> GraphState:
-        return self._executor.execute(state)
+        return self._executor.execute(state, prefetched=claim_prefetch(state))
+
+    async def arun(self, state: GraphState) -> GraphState:
+        return await self._executor.aexecute(state, prefetched=await aclaim_prefetch(state))
+
+    def prefetch(
+        self, state: GraphState, cancelled: threading.Event | None = None
+    ) -> PrefetchedInputs:
+        """speculative 실행용 — intent 분류 중에 RAG/tool 단계를 미리 수행한다."""
+        return self._executor.prefetch(state, cancelled)
+
+    async def aprefetch(self, state: GraphState) -> PrefetchedInputs:
+        return await self._executor.aprefetch(state)
 
 
 _agent: AgentB | None = None
@@ -49,3 +65,9 @@ def _get_agent() -> AgentB:
 def agent_b_node(state: GraphState) -> GraphState:
     """LangGraph 노드 함수로 Agent B를 실행한다."""
     return _get_agent().run(state)
+
+
+@log_node_execution
+async def aagent_b_node(state: GraphState) -> GraphState:
+    """agent_b_node의 async 버전 — graph.ainvoke 경로에서 사용된다."""
+    return await _get_agent().arun(state)
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from langchain_core.messages import AIMessage
 
+from config.settings import get_settings
 from core.logging import log_node_execution
 from node._base_agent import BaseAgent
 from node._executor import AgentExecutor
@@ -11,26 +12,30 @@ from state import GraphState
 
 
 class FinalResponseNode(BaseAgent):
-    """agent_output과 context를 종합하여 최종 응답을 생성하는 노드."""
+    """agent_output과 context를 종합하여 최종 응답을 생성하는 노드.
+
+    agent가 output_is_final을 설정했거나 intent가 passthrough 정책에 해당하면
+    LLM 재작성 없이 agent_output을 그대로 AIMessage로 응답한다.
+    스트리밍이 켜져 있으면 토큰이 생성되는 대로 graph.stream(stream_mode="messages")로 흘러가고,
+    완성된 응답은 기존과 동일하게 AIMessage 하나로 state에 기록된다.
+    """
 
     def __init__(self) -> None:
+        settings = get_settings()
         self._executor = AgentExecutor(
             system_prompt=SYSTEM_PROMPT,
             user_prompt_template=USER_PROMPT,
+            stream=settings.final_response_streaming,
+            llm_profile="final_response",
         )
+        self._passthrough_intents = frozenset(settings.final_response_passthrough_intents)
 
     def run(self, state: GraphState) -> GraphState:
         agent_output = state.get("agent_output", "")
-        context_items = state.get("context", [])
-
-        if not agent_output and not context_items:
-            return {
-                "messages": [AIMessage(content=FALLBACK_MESSAGE)],
-                "intent": state.get("intent", ""),
-                "agent_output": agent_output,
-                "context": context_items,
-                "metadata": state.get("metadata", {}),
-            }
+        if not agent_output and not state.get("context", []):
+            return self._respond(state, FALLBACK_MESSAGE)
+        if agent_output and self._is_passthrough(state):
+            return self._respond(state, agent_output)
 
         result = self._executor.execute(
             state,
@@ -39,6 +44,41 @@ class FinalResponseNode(BaseAgent):
         return {
             **result,
             "messages": [AIMessage(content=result["agent_output"])],
+            "output_is_final": False,
+        }
+
+    async def arun(self, state: GraphState) -> GraphState:
+        agent_output = state.get("agent_output", "")
+        if not agent_output and not state.get("context", []):
+            return self._respond(state, FALLBACK_MESSAGE)
+        if agent_output and self._is_passthrough(state):
+            return self._respond(state, agent_output)
+
+        result = await self._executor.aexecute(
+            state,
+            extra_prompt_vars={"agent_output": agent_output},
+        )
+        return {
+            **result,
+            "messages": [AIMessage(content=result["agent_output"])],
+            "output_is_final": False,
+        }
+
+    def _is_passthrough(self, state: GraphState) -> bool:
+        return bool(state.get("output_is_final")) or (
+            state.get("intent", "") in self._passthrough_intents
+        )
+
+    @staticmethod
+    def _respond(state: GraphState, content: str) -> GraphState:
+        """LLM 호출 없이 content를 최종 응답으로 내보낸다. output_is_final은 다음 턴을 위해 초기화한다."""
+        return {
+            "messages": [AIMessage(content=content)],
+            "intent": state.get("intent", ""),
+            "agent_output": state.get("agent_output", ""),
+            "context": state.get("context", []),
+            "metadata": state.get("metadata", {}),
+            "output_is_final": False,
         }
 
 
@@ -56,3 +96,9 @@ def _get_node() -> FinalResponseNode:
 def generate_final_response(state: GraphState) -> GraphState:
     """agent_output과 context를 종합하여 최종 응답을 생성한다."""
     return _get_node().run(state)
+
+
+@log_node_execution
+async def agenerate_final_response(state: GraphState) -> GraphState:
+    """generate_final_response의 async 버전 — graph.ainvoke 경로에서 사용된다."""
+    return await _get_node().arun(state)
@@ -0,0 +1,106 @@
+# intent 분류 LLM 호출 coalescing — 동시에 들어온 여러 세션의 분류 요청을 LLM 호출 한 번으로 묶는다
+# - core/batching.MicroBatcher로 짧은 시간 창 안의 요청을 모으고, 같은 입력은 한 번만 분류한다.
+# - batch 응답에서 빠진 항목은 단건 프롬프트(노드 기본 경로와 같은 메시지)로 다시 분류한다.
+# - batch 크기가 1이면 단건 프롬프트를 그대로 사용하므로 LLM 응답 캐시 키도 기본 경로와 같다.
+from __future__ import annotations
+
+import asyncio
+import re
+from functools import lru_cache
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from config.settings import get_settings
+from core.batching import MicroBatcher
+from core.llm import call_llm
+from core.logging import get_logger
+from prompt.intent_classifier_prompt import (
+    BATCH_SYSTEM_PROMPT,
+    BATCH_USER_PROMPT_TEMPLATE,
+    SYSTEM_PROMPT,
+    USER_PROMPT_TEMPLATE,
+)
+
+logger = get_logger(__name__)
+
+_LINE = re.compile(r"^\s*(\d+)\s*[:.)]\s*(\S+)")
+
+
+def parse_batch_output(text: str, count: int) -> list[str | None]:
+    """"번호: intent" 줄들을 입력 순서의 raw intent 목록으로 변환한다. 없는 번호는 None."""
+    parsed: list[str | None] = [None] * count
+    for line in text.splitlines():
+        match = _LINE.match(line)
+        if match is None:
+            continue
+        index = int(match.group(1)) - 1
+        if 0 <= index < count and parsed[index] is None:
+            parsed[index] = match.group(2).strip("`'\"")
+    return parsed
+
+
+class IntentBatchClassifier:
+    """user_input을 받아 LLM이 반환한 raw intent 문자열을 돌려준다. 파싱/검증은 호출 측 책임이다."""
+
+    def __init__(
+        self, max_batch_size: int = 16, max_wait_seconds: float = 0.02, max_inflight_batches: int = 4
+    ) -> None:
+        self._batcher: MicroBatcher[str, str] = MicroBatcher(
+            self._classify_batch,
+            max_batch_size=max_batch_size,
+            max_wait_seconds=max_wait_seconds,
+            name="intent_batch",
+            max_inflight_batches=max_inflight_batches,
+        )
+
+    def classify(self, user_input: str) -> str:
+        return self._batcher.submit(user_input).result()
+
+    async def aclassify(self, user_input: str) -> str:
+        return await asyncio.wrap_future(self._batcher.submit(user_input))
+
+    def _classify_batch(self, inputs: list[str]) -> list[str]:
+        if len(inputs) == 1:
+            return [_classify_one(inputs[0])]
+
+        questions = "\n".join(
+            f"{i}: {' '.join(text.split())}" for i, text in enumerate(inputs, start=1)
+        )
+        response = call_llm(
+            [
+                SystemMessage(content=BATCH_SYSTEM_PROMPT),
+                HumanMessage(
+                    content=BATCH_USER_PROMPT_TEMPLATE.format(
+                        questions=questions, count=len(inputs)
+                    )
+                ),
+            ],
+            profile="intent_batch",
+        )
+        parsed = parse_batch_output(response.content, len(inputs))
+        missing = [i for i, raw in enumerate(parsed) if raw is None]
+        if missing:
+            logger.warning("intent_batch_parse_incomplete", size=len(inputs), missing=len(missing))
+        logger.info("intent_batch_classified", size=len(inputs))
+        return [raw if raw is not None else _classify_one(inputs[i]) for i, raw in enumerate(parsed)]
+
+
+def _classify_one(user_input: str) -> str:
+    return call_llm(
+        [
+            SystemMessage(content=SYSTEM_PROMPT),
+            HumanMessage(content=USER_PROMPT_TEMPLATE.format(user_input=user_input)),
+        ],
+        profile="intent_classifier",
+    ).content
+
+
+@lru_cache
+def get_intent_batcher(max_batch_size: int | None = None) -> IntentBatchClassifier:
+    """max_batch_size가 None이면 settings.intent_llm_batch_max_size를 사용한다."""
+    settings = get_settings()
+    return IntentBatchClassifier(
+        max_batch_size=max_batch_size or settings.intent_llm_batch_max_size,
+        max_wait_seconds=settings.intent_llm_batch_max_wait_seconds,
+        max_inflight_batches=settings.intent_llm_batch_max_inflight,
+    )
@@ -2,58 +2,280 @@
 from __future__ import annotations
 
 from config.intents import Intent
+from config.settings import get_settings
 from core.exceptions import AgentExecutionError
 from core.logging import get_logger, log_node_execution
+from core.semantic_cache import SemanticCache
 from node._base_agent import BaseAgent
-from node._executor import AgentExecutor
+from node._executor import AgentExecutor, extract_user_input
+from node.intent_batcher import IntentBatchClassifier, get_intent_batcher
+from node.intent_output import IntentPrediction, aclassify_constrained, classify_constrained
+from node.intent_rule_matcher import IntentRuleMatcher
+from node.intent_stickiness import SessionIntentStore, StickyIntent
 from prompt.intent_classifier_prompt import SYSTEM_PROMPT, USER_PROMPT_TEMPLATE
+from rag.embedding import get_embedding_service
 from state import GraphState
 
 logger = get_logger(__name__)
 
 
 class IntentClassifierNode(BaseAgent):
-    """사용자 입력의 intent를 분류하는 노드."""
+    """사용자 입력의 intent를 분류하는 노드.
 
-    def __init__(self) -> None:
+    먼저 config/intent_rules.py 규칙 fast path를 확인하고, 규칙이 하나의 intent로
+    결정되지 않을 때만 세션 intent 유지 → semantic 캐시 → LLM 순으로 진행한다.
+    세션 intent 유지가 켜져 있으면 후속 발화는 같은 세션의 직전 intent를 그대로 사용한다.
+    semantic 캐시가 켜져 있으면 입력 임베딩과 충분히 유사한 과거 발화의 intent를
+    LLM 호출 없이 재사용하고, 새 LLM 분류 결과는 캐시에 즉시 추가한다.
+    batch 크기(batch_max_size, 지정하지 않으면 intent_llm_batch_max_size)가 1보다 크면
+    동시에 들어온 세션들의 LLM 분류를 한 번의 호출로 묶는다.
+    intent_output_mode가 constrained이면 LLM이 Intent 값만 생성하도록 제약하고 confidence를 함께 기록한다.
+    """
+
+    def __init__(self, batch_max_size: int | None = None) -> None:
+        settings = get_settings()
+        if batch_max_size is None:
+            batch_max_size = settings.intent_llm_batch_max_size
         self._executor = AgentExecutor(
             system_prompt=SYSTEM_PROMPT,
             user_prompt_template=USER_PROMPT_TEMPLATE,
+            llm_profile="intent_classifier",
+        )
+        self._semantic_cache: SemanticCache[Intent] | None = (
+            SemanticCache(
+                threshold=settings.intent_semantic_cache_threshold,
+                max_entries=settings.intent_semantic_cache_max_entries,
+                name="intent_semantic_cache",
+            )
+            if settings.intent_semantic_cache_enabled
+            else None
+        )
+        self._rule_matcher: IntentRuleMatcher | None = (
+            IntentRuleMatcher() if settings.intent_rule_fast_path_enabled else None
+        )
+        self._batcher: IntentBatchClassifier | None = (
+            get_intent_batcher(batch_max_size) if batch_max_size > 1 else None
+        )
+        if settings.intent_output_mode not in ("text", "constrained"):
+            raise ValueError(f"지원하지 않는 intent_output_mode: {settings.intent_output_mode}")
+        self._constrained = settings.intent_output_mode == "constrained"
+        if self._constrained and self._batcher is not None:
+            # batch 프롬프트는 번호별 여러 줄을 생성하므로 단일 intent enum schema를 적용할 수 없다.
+            raise ValueError(
+                "intent_output_mode=constrained는 intent LLM batch(batch 크기 > 1)와 함께 사용할 수 없습니다"
+            )
+        self._min_confidence = settings.intent_min_confidence
+        self._sessions: SessionIntentStore | None = (
+            SessionIntentStore.from_settings() if settings.intent_sticky_enabled else None
+        )
+        # semantic 캐시나 세션 유지의 유사도 판정에 쓸 때만 입력을 임베딩한다.
+        self._needs_embedding = self._semantic_cache is not None or (
+            self._sessions is not None and self._sessions.uses_embedding
         )
 
     def run(self, state: GraphState) -> GraphState:
+        user_input = extract_user_input(state)
+        ruled = self._match_rules(user_input)
+        if ruled is not None:
+            return self._remember(state, self._classified(state, ruled, state.get("context", [])))
+
+        vector = self._embed(user_input)
+        sticky = self._sticky(state, user_input, vector)
+        if sticky is not None:
+            # 재사용한 턴은 세션 기록(TTL)을 갱신하지 않는다.
+            return self._classified(
+                state, sticky.intent, state.get("context", []), sticky.confidence
+            )
+
+        cached = self._lookup(vector)
+        if cached is not None:
+            result = self._classified(state, cached, state.get("context", []))
+            return self._remember(state, result, vector)
+
         try:
-            result = self._executor.execute(state)
-            raw_intent = result["agent_output"].strip()
-
-            try:
-                intent = Intent(raw_intent)
-            except ValueError:
-                logger.warning(
-                    "unknown_intent_fallback",
-                    raw_intent=raw_intent,
-                )
-                intent = Intent.UNKNOWN
-
-            return {
-                "intent": intent.value,
-                "error": None,
-                "messages": [],
-                "agent_output": state.get("agent_output", ""),
-                "context": result.get("context", []),
-                "metadata": state.get("metadata", {}),
-            }
+            if self._batcher is not None:
+                prediction = self._parse(self._batcher.classify(user_input))
+                context = state.get("context", [])
+            elif self._constrained:
+                prediction, context = classify_constrained(user_input), state.get("context", [])
+            else:
+                result = self._executor.execute(state)
+                prediction = self._parse(result["agent_output"])
+                context = result.get("context", [])
+        except (AgentExecutionError, Exception) as exc:
+            return self._failed(state, exc)
+        prediction = self._accept(prediction, vector)
+        result = self._classified(state, prediction.intent, context, prediction.confidence)
+        return self._remember(state, result, vector)
+
+    async def arun(self, state: GraphState) -> GraphState:
+        user_input = extract_user_input(state)
+        ruled = self._match_rules(user_input)
+        if ruled is not None:
+            return self._remember(state, self._classified(state, ruled, state.get("context", [])))
+
+        vector = await self._aembed(user_input)
+        sticky = self._sticky(state, user_input, vector)
+        if sticky is not None:
+            # 재사용한 턴은 세션 기록(TTL)을 갱신하지 않는다.
+            return self._classified(
+                state, sticky.intent, state.get("context", []), sticky.confidence
+            )
 
+        cached = self._lookup(vector)
+        if cached is not None:
+            result = self._classified(state, cached, state.get("context", []))
+            return self._remember(state, result, vector)
+
+        try:
+            if self._batcher is not None:
+                prediction = self._parse(await self._batcher.aclassify(user_input))
+                context = state.get("context", [])
+            elif self._constrained:
+                prediction = await aclassify_constrained(user_input)
+                context = state.get("context", [])
+            else:
+                result = await self._executor.aexecute(state)
+                prediction = self._parse(result["agent_output"])
+                context = result.get("context", [])
         except (AgentExecutionError, Exception) as exc:
-            logger.error("intent_classification_failed", error=str(exc))
-            return {
-                "intent": Intent.UNKNOWN.value,
-                "error": str(exc),
-                "messages": [],
-                "agent_output": state.get("agent_output", ""),
-                "context": state.get("context", []),
-                "metadata": state.get("metadata", {}),
-            }
+            return self._failed(state, exc)
+        prediction = self._accept(prediction, vector)
+        result = self._classified(state, prediction.intent, context, prediction.confidence)
+        return self._remember(state, result, vector)
+
+    def _match_rules(self, user_input: str) -> Intent | None:
+        if self._rule_matcher is None:
+            return None
+        intent = self._rule_matcher.match(user_input)
+        if intent is not None:
+            logger.info(
+                "intent_rule_fast_path_hit",
+                intent=intent.value,
+                hit_rate=round(self._rule_matcher.stats.hit_rate, 4),
+            )
+        return intent
+
+    def _sticky(
+        self, state: GraphState, user_input: str, vector: list[float] | None
+    ) -> StickyIntent | None:
+        session_id = state.get("metadata", {}).get("session_id")
+        if self._sessions is None or not session_id:
+            return None
+        sticky = self._sessions.reuse(session_id, user_input, vector)
+        if sticky is not None:
+            logger.info(
+                "intent_session_sticky_hit",
+                intent=sticky.intent.value,
+                reason=sticky.reason,
+                hit_rate=round(self._sessions.stats.hit_rate, 4),
+            )
+        return sticky
+
+    def _remember(
+        self, state: GraphState, result: GraphState, vector: list[float] | None = None
+    ) -> GraphState:
+        """분류 결과를 세션 기록에 남기고 result를 그대로 반환한다."""
+        session_id = state.get("metadata", {}).get("session_id")
+        if self._sessions is not None and session_id:
+            self._sessions.remember(
+                session_id, Intent(result["intent"]), result.get("intent_confidence"), vector
+            )
+        return result
+
+    def _embed(self, user_input: str) -> list[float] | None:
+        if not self._needs_embedding or not user_input:
+            return None
+        try:
+            return get_embedding_service().embed(user_input)
+        except Exception as exc:
+            # 캐시/세션 유지는 best-effort — 임베딩 실패 시 LLM 분류로 진행한다.
+            logger.warning("intent_embed_failed", error=str(exc))
+            return None
+
+    async def _aembed(self, user_input: str) -> list[float] | None:
+        if not self._needs_embedding or not user_input:
+            return None
+        try:
+            return await get_embedding_service().aembed(user_input)
+        except Exception as exc:
+            logger.warning("intent_embed_failed", error=str(exc))
+            return None
+
+    def _lookup(self, vector: list[float] | None) -> Intent | None:
+        if vector is None or self._semantic_cache is None:
+            return None
+        hit = self._semantic_cache.lookup(vector)
+        if hit is None:
+            return None
+        intent, similarity = hit
+        logger.info("intent_semantic_cache_hit", intent=intent.value, similarity=round(similarity, 4))
+        return intent
+
+    @staticmethod
+    def _parse(raw_intent: str) -> IntentPrediction | None:
+        """text 모드 응답을 Intent로 파싱한다. Intent 값이 아니면 None (UNKNOWN fallback)."""
+        raw_intent = raw_intent.strip()
+
+        try:
+            return IntentPrediction(Intent(raw_intent))
+        except ValueError:
+            logger.warning(
+                "unknown_intent_fallback",
+                raw_intent=raw_intent,
+            )
+            return None
+
+    def _accept(
+        self, prediction: IntentPrediction | None, vector: list[float] | None
+    ) -> IntentPrediction:
+        """LLM 분류 결과에 confidence 임계값을 적용하고, 채택된 결과만 semantic 캐시에 추가한다."""
+        if prediction is None:
+            # 파싱 실패 fallback UNKNOWN은 캐시하지 않는다.
+            return IntentPrediction(Intent.UNKNOWN)
+        confidence = prediction.confidence
+        threshold = self._min_confidence
+        if threshold is not None and confidence is not None and confidence < threshold:
+            logger.info(
+                "intent_low_confidence",
+                intent=prediction.intent.value,
+                confidence=round(confidence, 4),
+            )
+            return IntentPrediction(Intent.UNKNOWN, confidence)
+
+        if vector is not None and self._semantic_cache is not None:
+            self._semantic_cache.insert(vector, prediction.intent)
+        return prediction
+
+    @staticmethod
+    def _classified(
+        state: GraphState,
+        intent: Intent,
+        context: list[str],
+        confidence: float | None = None,
+    ) -> GraphState:
+        return {
+            "intent": intent.value,
+            "intent_confidence": confidence,
+            "error": None,
+            "messages": [],
+            "agent_output": state.get("agent_output", ""),
+            "context": context,
+            "metadata": state.get("metadata", {}),
+        }
+
+    @staticmethod
+    def _failed(state: GraphState, exc: Exception) -> GraphState:
+        logger.error("intent_classification_failed", error=str(exc))
+        return {
+            "intent": Intent.UNKNOWN.value,
+            "intent_confidence": None,
+            "error": str(exc),
+            "messages": [],
+            "agent_output": state.get("agent_output", ""),
+            "context": state.get("context", []),
+            "metadata": state.get("metadata", {}),
+        }
 
 
 _node: IntentClassifierNode | None = None
@@ -66,7 +288,19 @@ def _get_node() -> IntentClassifierNode:
     return _node
 
 
+def configure_intent_batching(max_batch_size: int) -> None:
+    """settings 대신 지정한 batch 크기로 intent 분류 노드를 다시 만든다 (batch_runner 등 오프라인 실행용)."""
+    global _node
+    _node = IntentClassifierNode(batch_max_size=max_batch_size)
+
+
 @log_node_execution
 def classify_intent(state: GraphState) -> GraphState:
     """사용자의 마지막 메시지를 분석하여 intent를 분류한다."""
     return _get_node().run(state)
+
+
+@log_node_execution
+async def aclassify_intent(state: GraphState) -> GraphState:
+    """classify_intent의 async 버전 — graph.ainvoke 경로에서 사용된다."""
+    return await _get_node().arun(state)
@@ -0,0 +1,94 @@
+# intent 분류 출력 제약 (settings.intent_output_mode="constrained")
+# - response_format JSON schema의 enum으로 Intent 값만 생성하게 하고, max_tokens는 가장 긴 label의 출력 길이에 맞춘다.
+# - logprobs로 받은 생성 token 확률의 곱을 confidence로 사용한다. schema가 고정한 token은 확률이 ~1이라
+#   사실상 label token들의 확률이 된다.
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+
+from config.intents import Intent
+from core.context_budget import count_tokens
+from core.exceptions import IntentClassificationError
+from core.llm import acall_llm, call_llm
+from prompt.intent_classifier_prompt import SYSTEM_PROMPT, USER_PROMPT_TEMPLATE
+
+INTENT_RESPONSE_FORMAT: dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "intent",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {"intent": {"type": "string", "enum": [intent.value for intent in Intent]}},
+            "required": ["intent"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
+@dataclass(frozen=True)
+class IntentPrediction:
+    intent: Intent
+    confidence: float | None = None  # logprobs를 받지 못하면 None
+
+
+@lru_cache
+def constrained_options() -> dict[str, Any]:
+    """call_llm options — enum schema, logprobs, 가장 긴 label의 JSON 출력에 맞춘 max_tokens."""
+    longest = max(
+        count_tokens(json.dumps({"intent": intent.value}, separators=(",", ":")))
+        for intent in Intent
+    )
+    return {
+        "response_format": INTENT_RESPONSE_FORMAT,
+        "logprobs": True,
+        # tokenizer 차이와 공백 token을 감안한 여유분
+        "max_tokens": longest + 2,
+    }
+
+
+def _messages(user_input: str) -> list[BaseMessage]:
+    return [
+        SystemMessage(content=SYSTEM_PROMPT),
+        HumanMessage(content=USER_PROMPT_TEMPLATE.format(user_input=user_input)),
+    ]
+
+
+def parse_prediction(message: BaseMessage) -> IntentPrediction:
+    """structured output 응답을 IntentPrediction으로 변환한다.
+
+    schema가 Intent 값만 허용하므로 파싱 실패(잘린 응답, 거절 등)는 시스템 오류로 취급한다.
+    """
+    try:
+        intent = Intent(json.loads(message.content)["intent"])
+    except (TypeError, ValueError, KeyError) as exc:
+        raise IntentClassificationError(
+            "intent structured output 파싱 실패",
+            cause=exc,
+            context={"content": str(message.content)[:200]},
+        ) from exc
+
+    tokens = ((message.response_metadata or {}).get("logprobs") or {}).get("content") or []
+    confidence = math.exp(sum(token["logprob"] for token in tokens)) if tokens else None
+    return IntentPrediction(intent, confidence)
+
+
+def classify_constrained(user_input: str) -> IntentPrediction:
+    return parse_prediction(
+        call_llm(_messages(user_input), profile="intent_classifier", options=constrained_options())
+    )
+
+
+async def aclassify_constrained(user_input: str) -> IntentPrediction:
+    return parse_prediction(
+        await acall_llm(
+            _messages(user_input), profile="intent_classifier", options=constrained_options()
+        )
+    )
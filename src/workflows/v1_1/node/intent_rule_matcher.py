@@ -0,0 +1,67 @@
+# Intent 규칙 매처 — config/intent_rules.py의 규칙 테이블을 하나의 정규식으로 컴파일한다
+from __future__ import annotations
+
+import re
+import threading
+
+from config.intent_rules import INTENT_RULES, IntentRule
+from config.intents import Intent
+from core.stats import HitMissCounter
+
+
+class IntentRuleMatcher:
+    """규칙 테이블 전체를 named group alternation 정규식 하나로 컴파일해 매칭한다.
+
+    입력 문자열은 한 번만 스캔되며, lookahead로 매칭하므로 겹치는 위치의 키워드도 놓치지 않는다.
+    (단, 같은 위치에서 시작하는 규칙이 여러 개면 테이블에서 앞선 규칙만 잡힌다.)
+    """
+
+    def __init__(self, rules: list[IntentRule] | None = None) -> None:
+        rules = INTENT_RULES if rules is None else rules
+        self._group_intents: dict[str, Intent] = {}
+        alternatives: list[str] = []
+        for index, rule in enumerate(rules):
+            parts = [re.escape(keyword) for keyword in rule.keywords] + list(rule.patterns)
+            if not parts:
+                continue
+            group = f"r{index}"
+            self._group_intents[group] = rule.intent
+            alternatives.append(f"(?P<{group}>{'|'.join(parts)})")
+
+        self._regex = (
+            re.compile(f"(?=(?:{'|'.join(alternatives)}))", re.IGNORECASE)
+            if alternatives
+            else None
+        )
+        self.stats = HitMissCounter("intent_rule_fast_path")
+        self.conflicts = 0
+        self._lock = threading.Lock()
+
+    def candidates(self, text: str) -> set[Intent]:
+        """text에서 규칙이 매칭된 intent 집합을 반환한다 (통계는 기록하지 않는다)."""
+        if self._regex is None or not text:
+            return set()
+        matched: set[Intent] = set()
+        for match in self._regex.finditer(text):
+            for group, intent in self._group_intents.items():
+                if match.group(group) is not None:
+                    matched.add(intent)
+                    break
+        return matched
+
+    def match(self, text: str) -> Intent | None:
+        """정확히 하나의 intent만 매칭되면 그 intent를, 아니면 None을 반환한다."""
+        if self._regex is None:
+            return None
+        matched = self.candidates(text)
+        if len(matched) == 1:
+            self.stats.hit()
+            return next(iter(matched))
+        if len(matched) > 1:
+            with self._lock:
+                self.conflicts += 1
+        self.stats.miss()
+        return None
+
+    def snapshot(self) -> dict[str, float]:
+        return {**self.stats.snapshot(), "conflicts": self.conflicts}
@@ -0,0 +1,149 @@
+# 세션 intent 유지(stickiness) — 후속 발화("더 자세히 알려줘", "그건요?")는 같은 세션의 직전 intent를 재사용한다
+# - 세션(metadata.session_id)마다 마지막 intent/confidence/입력 임베딩을 in-memory LRU(최대 세션 수) + TTL로 보관한다.
+# - 후속 발화 판정: 단어 경계의 후속 표지(config/intent_rules.FOLLOW_UP_MARKERS), 직전 입력과의 임베딩 유사도.
+#   하나라도 만족하면 후속 발화로 본다. 규칙 fast path가 먼저 적용되므로 규칙에 걸리는 새 주제는 재사용되지 않는다.
+# - 재사용한 턴은 기록을 갱신하지 않는다. TTL은 실제로 분류된 턴을 기준으로만 흐르므로 후속 발화가 이어져도
+#   오래된 intent가 무기한 유지되지 않는다.
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from config.intent_rules import FOLLOW_UP_MARKERS
+from config.intents import Intent
+from config.settings import get_settings
+from core.stats import HitMissCounter
+
+
+@dataclass(frozen=True)
+class StickyIntent:
+    intent: Intent
+    confidence: float | None
+    reason: str  # marker | similarity
+
+
+@dataclass
+class _SessionEntry:
+    intent: Intent
+    confidence: float | None
+    vector: np.ndarray | None  # L2 정규화된 직전 입력 임베딩 (유사도 판정을 쓸 때만)
+    expires_at: float
+
+
+def _compile_markers(markers: Sequence[str]) -> re.Pattern[str] | None:
+    if not markers:
+        return None
+    # 표지는 발화 시작이나 공백/문장부호 뒤에서 시작해야 한다 ("이거" in "저이거" 제외).
+    # 끝은 영문만 단어 경계를 요구한다 — 한글 표지 뒤에는 조사/어미가 붙는다 ("그거는", "더 알려줘").
+    alternatives = "|".join(re.escape(marker) for marker in markers)
+    return re.compile(rf"(?<!\w)(?:{alternatives})(?![A-Za-z0-9])", re.IGNORECASE)
+
+
+def _normalize(vector: Sequence[float]) -> np.ndarray:
+    row = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(row))
+    return row / norm if norm else row
+
+
+class SessionIntentStore:
+    """세션별 마지막 intent를 보관하고, 후속 발화면 그 intent를 돌려준다.
+
+    max_sessions를 넘으면 가장 오래 사용되지 않은 세션부터 지우고, ttl_seconds가 지난 세션은 재사용하지 않는다.
+    similarity_threshold가 None이면 임베딩을 보관하지 않는다.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 600.0,
+        max_sessions: int = 10_000,
+        similarity_threshold: float | None = None,
+        markers: Sequence[str] = FOLLOW_UP_MARKERS,
+    ) -> None:
+        self._ttl = ttl_seconds
+        self._max_sessions = max_sessions
+        self._similarity_threshold = similarity_threshold
+        self._markers = _compile_markers(markers)
+        self._sessions: OrderedDict[str, _SessionEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = HitMissCounter("intent_session_sticky")
+
+    @classmethod
+    def from_settings(cls) -> SessionIntentStore:
+        settings = get_settings()
+        return cls(
+            ttl_seconds=settings.intent_sticky_ttl_seconds,
+            max_sessions=settings.intent_sticky_max_sessions,
+            similarity_threshold=settings.intent_sticky_similarity_threshold,
+        )
+
+    @property
+    def uses_embedding(self) -> bool:
+        return self._similarity_threshold is not None
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def reuse(
+        self, session_id: str, text: str, vector: Sequence[float] | None = None
+    ) -> StickyIntent | None:
+        """text가 session_id의 후속 발화이면 직전 intent를 반환한다."""
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                del self._sessions[session_id]
+                entry = None
+        if entry is None:
+            self.stats.miss()
+            return None
+        reason = self._follow_up_reason(text, vector, entry.vector)
+        if reason is None:
+            self.stats.miss()
+            return None
+        self.stats.hit()
+        return StickyIntent(entry.intent, entry.confidence, reason)
+
+    def remember(
+        self,
+        session_id: str,
+        intent: Intent,
+        confidence: float | None = None,
+        vector: Sequence[float] | None = None,
+    ) -> None:
+        """이번 턴의 intent를 기록한다. UNKNOWN이면 이어갈 주제가 없으므로 세션 기록을 지운다."""
+        if intent is Intent.UNKNOWN:
+            self.forget(session_id)
+            return
+        stored = _normalize(vector) if vector is not None and self.uses_embedding else None
+        entry = _SessionEntry(intent, confidence, stored, time.monotonic() + self._ttl)
+        with self._lock:
+            self._sessions[session_id] = entry
+            self._sessions.move_to_end(session_id)
+            while len(self._sessions) > self._max_sessions:
+                self._sessions.popitem(last=False)
+
+    def forget(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def _follow_up_reason(
+        self, text: str, vector: Sequence[float] | None, last_vector: np.ndarray | None
+    ) -> str | None:
+        stripped = text.strip()
+        if not stripped:
+            return None
+        if self._markers is not None and self._markers.search(stripped):
+            return "marker"
+        if (
+            self._similarity_threshold is not None
+            and vector is not None
+            and last_vector is not None
+            and float(_normalize(vector) @ last_vector) >= self._similarity_threshold
+        ):
+            return "similarity"
+        return None
@@ -0,0 +1,259 @@
+# Speculative 실행 — intent 분류와 병렬로 유력한 Agent의 RAG/tool 단계를 미리 시작한다
+# - 규칙 매칭 / 직전 세션 intent로 만든 저비용 prior가 threshold 이상일 때만 시작한다 (비용 상한).
+# - 분류가 끝나면 router가 선택할 intent의 결과만 남기고 나머지는 취소한다.
+#   sync 경로의 prefetch는 thread에서 실행되어 강제로 멈출 수 없으므로, 취소 신호(threading.Event)로
+#   아직 시작하지 않은 단계만 건너뛴다. 진행 중인 retriever/tool 호출은 끝까지 실행된다.
+# - 선택된 Agent는 claim_prefetch로 결과를 가져가 RAG/tool 단계를 건너뛴다.
+# 대상 Agent 매핑은 workflow.py에서 주입한다 (domain 모듈과의 순환 import 방지).
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Protocol
+
+from config.intents import Intent
+from config.settings import get_settings
+from core.logging import get_logger
+from node._executor import PrefetchedInputs, extract_user_input
+from node.intent_rule_matcher import IntentRuleMatcher
+from state import GraphState
+
+logger = get_logger(__name__)
+
+_METADATA_KEY = "speculation_id"
+# 분류 노드와 Agent 노드 사이에서 유실된 항목(그래프 중단 등)을 정리하는 기준 시간.
+_STALE_SECONDS = 120.0
+
+
+class SupportsPrefetch(Protocol):
+    def prefetch(
+        self, state: GraphState, cancelled: threading.Event | None = None
+    ) -> PrefetchedInputs: ...
+
+    async def aprefetch(self, state: GraphState) -> PrefetchedInputs: ...
+
+
+AgentGetters = dict[str, Callable[[], SupportsPrefetch]]
+
+
+# (Future, 취소 신호) 또는 (asyncio.Task, None)
+_Pending = dict[str, tuple[Any, threading.Event | None]]
+
+
+class _Registry:
+    """speculation_id별로 진행 중인 prefetch(Future 또는 asyncio.Task)를 보관한다."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[float, _Pending]] = {}
+        self._lock = threading.Lock()
+
+    def put(self, speculation_id: str, pending: _Pending) -> None:
+        now = time.monotonic()
+        with self._lock:
+            for key in [k for k, (t, _) in self._entries.items() if now - t > _STALE_SECONDS]:
+                _cancel_all(key, self._entries.pop(key)[1])
+            self._entries[speculation_id] = (now, pending)
+
+    def keep_only(self, speculation_id: str, intent: str) -> bool:
+        """intent 이외의 prefetch를 취소한다. 남길 prefetch가 있으면 True."""
+        with self._lock:
+            entry = self._entries.get(speculation_id)
+            if entry is None:
+                return False
+            pending = entry[1]
+            losers = {k: v for k, v in pending.items() if k != intent}
+            for key in losers:
+                del pending[key]
+            if not pending:
+                del self._entries[speculation_id]
+        _cancel_all(speculation_id, losers)
+        return bool(pending)
+
+    def pop(self, speculation_id: str, intent: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.pop(speculation_id, None)
+        if entry is None:
+            return None
+        pending = entry[1]
+        handle, _ = pending.pop(intent, (None, None))
+        _cancel_all(speculation_id, pending)
+        return handle
+
+
+def _cancel_all(speculation_id: str, pending: _Pending) -> None:
+    for intent, (handle, cancelled) in pending.items():
+        if cancelled is not None:
+            cancelled.set()
+        if not handle.cancel() and not handle.done():
+            # 이미 실행 중인 thread는 멈출 수 없다. 진행 중인 호출 비용이 버려지므로 기록해 둔다.
+            logger.info("speculation_cancel_failed", speculation_id=speculation_id, intent=intent)
+
+
+_registry = _Registry()
+_pool: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(thread_name_prefix="speculation")
+        return _pool
+
+
+_rule_matcher: IntentRuleMatcher | None = None
+
+
+def _get_rule_matcher() -> IntentRuleMatcher:
+    global _rule_matcher
+    if _rule_matcher is None:
+        _rule_matcher = IntentRuleMatcher()
+    return _rule_matcher
+
+
+def estimate_intent_prior(state: GraphState) -> dict[str, float]:
+    """LLM 없이 계산할 수 있는 intent별 사전 확률을 추정한다.
+
+    - 규칙 테이블에 매칭된 intent: speculative_rule_prior를 매칭된 intent 수로 나눈 값
+    - 직전 턴의 intent(checkpointer로 유지된 state["intent"]): speculative_session_prior
+    두 신호가 겹치면 큰 값을 사용한다.
+    """
+    settings = get_settings()
+    prior: dict[str, float] = {}
+
+    candidates = _get_rule_matcher().candidates(extract_user_input(state))
+    for intent in candidates:
+        prior[intent.value] = settings.speculative_rule_prior / len(candidates)
+
+    previous = state.get("intent")
+    if previous and previous != Intent.UNKNOWN.value:
+        prior[previous] = max(prior.get(previous, 0.0), settings.speculative_session_prior)
+    return prior
+
+
+def _select_targets(state: GraphState, agents: AgentGetters) -> list[str]:
+    settings = get_settings()
+    prior = estimate_intent_prior(state)
+    ranked = sorted(
+        (
+            (p, intent)
+            for intent, p in prior.items()
+            if p >= settings.speculative_threshold and intent in agents
+        ),
+        reverse=True,
+    )
+    return [intent for _, intent in ranked[: settings.speculative_max_agents]]
+
+
+def start_speculation(state: GraphState, agents: AgentGetters) -> str | None:
+    """조건을 만족하면 대상 Agent의 prefetch를 worker thread에서 시작하고 speculation_id를 반환한다."""
+    targets = _select_targets(state, agents)
+    if not targets:
+        return None
+
+    speculation_id = uuid.uuid4().hex
+    pool = _get_pool()
+    pending: _Pending = {}
+    for intent in targets:
+        cancelled = threading.Event()
+        future = pool.submit(
+            contextvars.copy_context().run, agents[intent]().prefetch, state, cancelled
+        )
+        pending[intent] = (future, cancelled)
+    _registry.put(speculation_id, pending)
+    logger.info("speculation_start", speculation_id=speculation_id, targets=targets)
+    return speculation_id
+
+
+async def astart_speculation(state: GraphState, agents: AgentGetters) -> str | None:
+    """start_speculation의 async 버전. prefetch는 같은 이벤트 루프의 task로 실행된다."""
+    targets = _select_targets(state, agents)
+    if not targets:
+        return None
+
+    speculation_id = uuid.uuid4().hex
+    _registry.put(
+        speculation_id,
+        {
+            intent: (asyncio.ensure_future(agents[intent]().aprefetch(state)), None)
+            for intent in targets
+        },
+    )
+    logger.info("speculation_start", speculation_id=speculation_id, targets=targets)
+    return speculation_id
+
+
+def commit_speculation(result: GraphState, speculation_id: str | None) -> GraphState:
+    """분류 결과 intent의 prefetch만 남기고 나머지는 취소한 뒤 metadata에 speculation_id를 기록한다."""
+    metadata = {k: v for k, v in result.get("metadata", {}).items() if k != _METADATA_KEY}
+    if speculation_id is not None:
+        intent = result.get("intent", "")
+        if _registry.keep_only(speculation_id, intent):
+            metadata[_METADATA_KEY] = speculation_id
+            logger.info("speculation_commit", speculation_id=speculation_id, intent=intent)
+        else:
+            logger.info("speculation_miss", speculation_id=speculation_id, intent=intent)
+    return {**result, "metadata": metadata}
+
+
+def claim_prefetch(state: GraphState) -> PrefetchedInputs | None:
+    """현재 intent에 대해 미리 수행된 prefetch 결과를 가져온다. 없거나 실패했으면 None."""
+    handle = _pop(state)
+    if handle is None:
+        return None
+    if not isinstance(handle, Future):
+        # async 경로에서 시작된 prefetch는 sync 노드에서 기다릴 수 없다.
+        handle.cancel()
+        return None
+    try:
+        return handle.result()
+    except Exception as exc:
+        logger.warning("speculation_prefetch_failed", error=str(exc))
+        return None
+
+
+async def aclaim_prefetch(state: GraphState) -> PrefetchedInputs | None:
+    """claim_prefetch의 async 버전."""
+    handle = _pop(state)
+    if handle is None:
+        return None
+    try:
+        if isinstance(handle, Future):
+            return await asyncio.wrap_future(handle)
+        return await handle
+    except Exception as exc:
+        logger.warning("speculation_prefetch_failed", error=str(exc))
+        return None
+
+
+def _pop(state: GraphState) -> Any | None:
+    speculation_id = state.get("metadata", {}).get(_METADATA_KEY)
+    if not speculation_id:
+        return None
+    return _registry.pop(speculation_id, state.get("intent", ""))
+
+
+def speculative(
+    func: Callable[[GraphState], GraphState],
+    afunc: Callable[[GraphState], Awaitable[GraphState]],
+    agents: AgentGetters,
+) -> tuple[Callable[[GraphState], GraphState], Callable[[GraphState], Awaitable[GraphState]]]:
+    """intent 분류 노드(sync/async)를 speculative 실행으로 감싼다."""
+
+    @functools.wraps(func)
+    def wrapper(state: GraphState) -> GraphState:
+        speculation_id = start_speculation(state, agents)
+        return commit_speculation(func(state), speculation_id)
+
+    @functools.wraps(afunc)
+    async def async_wrapper(state: GraphState) -> GraphState:
+        speculation_id = await astart_speculation(state, agents)
+        return commit_speculation(await afunc(state), speculation_id)
+
+    return wrapper, async_wrapper
@@ -18,3 +18,19 @@ USER_PROMPT_TEMPLATE = """\
 사용자 입력: {user_input}
 
 위 입력에 해당하는 intent를 하나만 반환하세요 (다른 텍스트 없이 intent 값만)."""
+
+# 여러 세션의 분류 요청을 LLM 호출 한 번으로 묶을 때 사용 (node/intent_batcher.py)
+BATCH_SYSTEM_PROMPT = f"""\
+당신은 사용자 입력의 의도(intent)를 분류하는 분류기입니다.
+번호가 붙은 여러 사용자 입력을 각각 독립적으로 분류하세요. 반드시 목록에 있는 값만 사용하세요.
+
+가능한 intent 목록: {INTENT_LIST}
+
+분류할 수 없는 입력은 UNKNOWN으로 분류하세요.
+"""
+
+BATCH_USER_PROMPT_TEMPLATE = """\
+사용자 입력 목록:
+{questions}
+
+각 입력마다 한 줄씩 "번호: intent" 형식으로 {count}줄을 반환하세요 (다른 텍스트 없이)."""
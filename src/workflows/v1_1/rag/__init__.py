@@ -1,4 +1,14 @@
 # rag 패키지: RAG retriever 추상 클래스 및 구현체
 from rag.base_retriever import BaseRetriever
+from rag.embedding import EmbeddingService, get_embedding_service
+from rag.local_hybrid_retriever import LocalHybridRetriever
+from rag.milvus_pool import MilvusConnectionPool, get_milvus_pool
 
-__all__ = ["BaseRetriever"]
+__all__ = [
+    "BaseRetriever",
+    "EmbeddingService",
+    "LocalHybridRetriever",
+    "MilvusConnectionPool",
+    "get_embedding_service",
+    "get_milvus_pool",
+]
@@ -1,6 +1,7 @@
 # RAG retriever 추상 베이스 클래스 — 새 retriever 추가 시 이 클래스를 상속
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 
@@ -19,3 +20,11 @@ class BaseRetriever(ABC):
     @abstractmethod
     def retrieve(self, query: str) -> list[Document]:
         """쿼리 문자열로 관련 문서를 검색하여 반환한다."""
+
+    async def aretrieve(self, query: str) -> list[Document]:
+        """retrieve의 async 버전.
+
+        기본 구현은 동기 retrieve를 worker thread에서 실행해 이벤트 루프를 막지 않는다.
+        native async 클라이언트가 있는 retriever는 이 메서드를 override한다.
+        """
+        return await asyncio.to_thread(self.retrieve, query)
@@ -0,0 +1,211 @@
+# 임베딩 계산 서비스 — retriever / intent semantic 캐시가 공유한다
+# - 동시에 들어온 임베딩 요청을 MicroBatcher로 묶어 embed_documents 한 번으로 처리한다.
+# - 요청 안의 중복 텍스트는 한 번만 계산한다.
+# - (model, 텍스트 해시) 키로 프로세스 LRU + 선택적 SQLite 캐시에 벡터를 보관한다.
+# 같은 턴에서 여러 retriever가 같은 query를 임베딩해도 API 호출은 최대 한 번이다.
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from config.settings import get_settings
+from core.batching import MicroBatcher
+from core.llm import get_embeddings
+from core.logging import get_logger
+from core.stats import HitMissCounter
+
+logger = get_logger(__name__)
+
+
+def embedding_cache_key(model: str, text: str) -> str:
+    return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).hexdigest()
+
+
+class SQLiteEmbeddingStore:
+    """임베딩 벡터를 float32 BLOB으로 저장하는 SQLite 저장소. 프로세스 재시작 후에도 재사용된다."""
+
+    def __init__(self, path: str) -> None:
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embedding_cache ("
+                " key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        if not keys:
+            return {}
+        placeholders = ",".join("?" * len(keys))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT key, vector FROM embedding_cache WHERE key IN ({placeholders})", keys
+            ).fetchall()
+        return {key: np.frombuffer(blob, dtype=np.float32).tolist() for key, blob in rows}
+
+    def put_many(self, items: dict[str, list[float]]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embedding_cache (key, vector) VALUES (?, ?)",
+                [
+                    (key, np.asarray(vector, dtype=np.float32).tobytes())
+                    for key, vector in items.items()
+                ],
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM embedding_cache")
+
+
+class EmbeddingService:
+    """캐시 → micro-batch 순으로 텍스트 임베딩을 계산한다.
+
+    캐시에 없는 텍스트만 batcher에 제출하며, 계산된 벡터는 LRU와 저장소에 모두 기록한다.
+    stats는 텍스트 단위 캐시 hit/miss, api_calls는 실제 embed_documents 호출 수다.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        model: str,
+        max_entries: int = 4096,
+        store: SQLiteEmbeddingStore | None = None,
+        max_batch_size: int = 64,
+        max_wait_seconds: float = 0.005,
+        max_inflight_batches: int = 4,
+    ) -> None:
+        self._embeddings = embeddings
+        self._model = model
+        self._max_entries = max_entries
+        self._store = store
+        self._lru: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._batcher: MicroBatcher[str, list[float]] = MicroBatcher(
+            self._embed_batch,
+            max_batch_size=max_batch_size,
+            max_wait_seconds=max_wait_seconds,
+            name="embedding_batcher",
+            max_inflight_batches=max_inflight_batches,
+        )
+        self.stats = HitMissCounter("embedding_cache")
+        self.api_calls = 0
+
+    def embed(self, text: str) -> list[float]:
+        return self.embed_many([text])[0]
+
+    def embed_many(self, texts: list[str]) -> list[list[float]]:
+        """texts의 임베딩을 입력 순서대로 반환한다."""
+        vectors, futures = self._resolve(texts)
+        for text, future in futures.items():
+            vectors[text] = future.result()
+        return [vectors[text] for text in texts]
+
+    async def aembed(self, text: str) -> list[float]:
+        return (await self.aembed_many([text]))[0]
+
+    async def aembed_many(self, texts: list[str]) -> list[list[float]]:
+        """embed_many의 async 버전. batch 완료를 이벤트 루프를 막지 않고 기다린다."""
+        vectors, futures = self._resolve(texts)
+        if futures:
+            results = await asyncio.gather(*(asyncio.wrap_future(f) for f in futures.values()))
+            vectors.update(zip(futures, results))
+        return [vectors[text] for text in texts]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._lru.clear()
+        if self._store is not None:
+            self._store.clear()
+
+    def _resolve(
+        self, texts: list[str]
+    ) -> tuple[dict[str, list[float]], dict[str, Future[list[float]]]]:
+        """캐시에서 찾은 벡터와, 나머지 텍스트에 대한 batcher Future를 반환한다."""
+        unique = list(dict.fromkeys(texts))
+        keys = {text: embedding_cache_key(self._model, text) for text in unique}
+        vectors: dict[str, list[float]] = {}
+
+        with self._lock:
+            for text in unique:
+                vector = self._lru.get(keys[text])
+                if vector is not None:
+                    self._lru.move_to_end(keys[text])
+                    vectors[text] = vector
+
+        missing = [text for text in unique if text not in vectors]
+        if missing and self._store is not None:
+            stored = self._store.get_many([keys[text] for text in missing])
+            for text in missing:
+                vector = stored.get(keys[text])
+                if vector is not None:
+                    vectors[text] = vector
+                    self._remember({keys[text]: vector})
+
+        for text in unique:
+            if text in vectors:
+                self.stats.hit()
+            else:
+                self.stats.miss()
+        futures = {
+            text: self._batcher.submit(text) for text in unique if text not in vectors
+        }
+        return vectors, futures
+
+    def _embed_batch(self, texts: list[str]) -> list[list[float]]:
+        vectors = self._embeddings.embed_documents(texts)
+        with self._lock:
+            self.api_calls += 1
+        logger.info("embedding_batch", model=self._model, size=len(texts))
+
+        computed = {embedding_cache_key(self._model, t): v for t, v in zip(texts, vectors)}
+        self._remember(computed)
+        if self._store is not None:
+            try:
+                self._store.put_many(computed)
+            except Exception as exc:
+                # 영속 캐시는 best-effort — 저장 실패가 검색을 막지 않는다.
+                logger.warning("embedding_cache_store_failed", error=str(exc))
+        return vectors
+
+    def _remember(self, items: dict[str, list[float]]) -> None:
+        with self._lock:
+            for key, vector in items.items():
+                self._lru[key] = vector
+                self._lru.move_to_end(key)
+            while len(self._lru) > self._max_entries:
+                self._lru.popitem(last=False)
+
+
+@lru_cache
+def get_embedding_service() -> EmbeddingService:
+    """settings 기반 EmbeddingService 싱글턴을 반환한다."""
+    settings = get_settings()
+    backend = settings.embedding_cache_backend
+    if backend not in ("memory", "sqlite"):
+        raise ValueError(f"지원하지 않는 embedding_cache_backend: {backend}")
+    return EmbeddingService(
+        get_embeddings(),
+        model=settings.openai_embedding_model,
+        max_entries=settings.embedding_cache_max_entries,
+        store=(
+            SQLiteEmbeddingStore(settings.embedding_cache_sqlite_path)
+            if backend == "sqlite"
+            else None
+        ),
+        max_batch_size=settings.embedding_batch_max_size,
+        max_wait_seconds=settings.embedding_batch_max_wait_seconds,
+        max_inflight_batches=settings.embedding_batch_max_inflight,
+    )
@@ -1,12 +1,11 @@
 # 사내 iflow 블로그 소스 retriever 구현체 (pymilvus 기반)
 from __future__ import annotations
 
-from pymilvus import MilvusClient
-
 from config.settings import get_settings
 from core.exceptions import RAGRetrievalError
 from core.logging import get_logger
 from rag.base_retriever import BaseRetriever, Document
+from rag.milvus_pool import get_milvus_pool
 
 logger = get_logger(__name__)
 
@@ -27,56 +26,38 @@ class IflowRetriever(BaseRetriever):
         # TODO: Agent별로 다른 collection을 사용할 경우 collection_name 인자로 전달한다.
         #       예) IflowRetriever(collection_name="iflow_blog_v2")
         self._collection = collection_name or settings.milvus_collection_name
-        self._client: MilvusClient | None = None
-
-    def _get_client(self) -> MilvusClient:
-        if self._client is None:
-            try:
-                self._client = MilvusClient(uri=self._uri)
-            except Exception as exc:
-                raise RAGRetrievalError(
-                    f"Milvus 연결 실패: {self._uri}",
-                    cause=exc,
-                    context={"uri": self._uri},
-                ) from exc
-        return self._client
 
     def retrieve(self, query: str) -> list[Document]:
         """query 문자열을 임베딩하여 Milvus에서 유사 문서를 검색한다."""
         logger.info("iflow_retrieve_start", query=query, collection=self._collection)
         try:
-            client = self._get_client()
-
-            # TODO: Step 1 — query를 벡터로 변환한다.
-            #   임베딩 모델은 팀 표준에 맞게 선택한다.
-            #   예) OpenAI:
-            #       from openai import OpenAI
-            #       vector = OpenAI().embeddings.create(
-            #           model="text-embedding-3-small", input=query
-            #       ).data[0].embedding
-            #   예) HuggingFace:
-            #       from sentence_transformers import SentenceTransformer
-            #       vector = SentenceTransformer("...").encode(query).tolist()
-
-            # TODO: Step 2 — Milvus 벡터 검색을 수행한다.
-            #   search_params와 output_fields는 collection 스키마에 맞게 조정한다.
-            #   예)
-            #       results = client.search(
-            #           collection_name=self._collection,
-            #           data=[vector],
-            #           limit=5,
-            #           search_params={"metric_type": "IP", "params": {}},
-            #           output_fields=["content", "source"],
-            #       )
-            #       return [
-            #           Document(
-            #               page_content=hit["entity"]["content"],
-            #               metadata={"source": hit["entity"]["source"], "score": hit["distance"]},
-            #           )
-            #           for hit in results[0]
-            #       ]
+            # 연결은 URI별 공유 풀에서 빌리고 검색이 끝나면 반납한다 (rag/milvus_pool.py).
+            with get_milvus_pool(self._uri).connection() as client:
+                # TODO: Step 2 — query를 벡터로 변환해 Milvus 벡터 검색을 수행한다.
+                #   검색 결과를 쓰지 않는 임베딩 호출은 비용만 들므로 검색과 함께 구현한다.
+                #   공유 EmbeddingService를 사용하면 같은 턴의 다른 retriever / intent 분류와
+                #   같은 query는 캐시 또는 같은 batch에서 처리되어 API 호출이 중복되지 않는다
+                #   (rag/local_hybrid_retriever.py 참고). 임베딩 모델은 settings.openai_embedding_model이다.
+                #   search_params와 output_fields는 collection 스키마에 맞게 조정한다.
+                #   예)
+                #       from rag.embedding import get_embedding_service
+                #       vector = get_embedding_service().embed(query)
+                #       results = client.search(
+                #           collection_name=self._collection,
+                #           data=[vector],
+                #           limit=5,
+                #           search_params={"metric_type": "IP", "params": {}},
+                #           output_fields=["content", "source"],
+                #       )
+                #       return [
+                #           Document(
+                #               page_content=hit["entity"]["content"],
+                #               metadata={"source": hit["entity"]["source"], "score": hit["distance"]},
+                #           )
+                #           for hit in results[0]
+                #       ]
 
-            _ = client  # placeholder — Step 1·2 구현 후 제거
+                _ = client  # placeholder — Step 2 구현 후 제거
             logger.info("iflow_retrieve_end", query=query, results_count=0)
             return []
         except RAGRetrievalError:
@@ -0,0 +1,336 @@
+# 소규모 collection용 in-process hybrid retriever — BM25 + 벡터 검색을 RRF로 결합한다
+# - collection snapshot(documents.jsonl + embeddings.npy)을 메모리에 올려 Milvus 왕복 없이 검색한다.
+# - 임베딩 행렬은 np.load(mmap_mode="r")로 memory-map하며 float32/float16을 모두 지원한다.
+# - snapshot이 바뀌면 reload한다. documents.jsonl이 뒤에 추가만 된 경우 새 문서만 색인한다.
+# IflowRetriever와 같은 BaseRetriever 인터페이스이므로 Agent에서 그대로 교체해 사용할 수 있다.
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+
+from config.settings import get_settings
+from core.exceptions import RAGRetrievalError
+from core.logging import get_logger
+from rag.base_retriever import BaseRetriever, Document
+from rag.embedding import get_embedding_service
+
+logger = get_logger(__name__)
+
+DOCUMENTS_FILE = "documents.jsonl"
+EMBEDDINGS_FILE = "embeddings.npy"
+
+_TOKEN_RE = re.compile(r"\w+")
+_HANGUL_RE = re.compile(r"[가-힣]")
+# 벡터 점수 계산 시 한 번에 float32로 올리는 행 수 (float16 행렬의 전체 복사를 피한다).
+_BLOCK_ROWS = 4096
+
+
+def tokenize(text: str) -> list[str]:
+    """BM25용 토큰화. 한글 토큰은 조사 변화에 덜 민감하도록 글자 bigram을 함께 넣는다."""
+    tokens: list[str] = []
+    for token in _TOKEN_RE.findall(text.lower()):
+        tokens.append(token)
+        if len(token) > 2 and _HANGUL_RE.search(token):
+            tokens.extend(token[i : i + 2] for i in range(len(token) - 1))
+    return tokens
+
+
+def write_snapshot(
+    path: str | Path,
+    documents: list[Document],
+    embeddings: np.ndarray | list[list[float]],
+    *,
+    dtype: str = "float32",
+    append: bool = False,
+) -> None:
+    """retriever가 읽는 snapshot 디렉터리를 만든다. append=True면 기존 snapshot 뒤에 추가한다."""
+    directory = Path(path)
+    directory.mkdir(parents=True, exist_ok=True)
+    matrix = np.asarray(embeddings, dtype=dtype)
+    if matrix.ndim != 2 or len(matrix) != len(documents):
+        raise ValueError("documents와 embeddings의 행 수가 일치해야 합니다.")
+
+    embeddings_path = directory / EMBEDDINGS_FILE
+    if append and embeddings_path.exists():
+        matrix = np.concatenate([np.load(embeddings_path), matrix]).astype(dtype)
+    tmp_path = directory / f".{EMBEDDINGS_FILE}.tmp"
+    with open(tmp_path, "wb") as f:
+        np.save(f, matrix)
+    tmp_path.replace(embeddings_path)
+
+    with open(directory / DOCUMENTS_FILE, "a" if append else "w", encoding="utf-8") as f:
+        for doc in documents:
+            f.write(
+                json.dumps(
+                    {"page_content": doc.page_content, "metadata": doc.metadata},
+                    ensure_ascii=False,
+                )
+                + "\n"
+            )
+
+
+@dataclass(frozen=True)
+class _Index:
+    """한 시점의 snapshot 색인. reload 시 새 객체로 통째로 교체한다."""
+
+    documents: list[Document]
+    matrix: np.ndarray
+    norms: np.ndarray
+    postings: dict[str, tuple[np.ndarray, np.ndarray]]
+    doc_lengths: np.ndarray
+    # 증분 reload 판단용 — 색인에 반영된 documents.jsonl 바이트 수와 그 해시
+    consumed_bytes: int = 0
+    consumed_digest: str = ""
+    stamp: tuple[int, ...] = ()
+
+
+class LocalHybridRetriever(BaseRetriever):
+    """snapshot을 메모리에 올려 BM25 + 벡터 top-k를 reciprocal-rank fusion으로 결합하는 retriever.
+
+    Agent 생성자 예시:
+        AgentExecutor(retrievers=[LocalHybridRetriever("data/iflow_blog_snapshot")])
+    """
+
+    def __init__(
+        self,
+        snapshot_path: str | None = None,
+        top_k: int | None = None,
+        candidate_k: int = 50,
+        rrf_k: int = 60,
+        bm25_k1: float = 1.5,
+        bm25_b: float = 0.75,
+        reload_interval_seconds: float | None = None,
+    ) -> None:
+        settings = get_settings()
+        self._path = Path(snapshot_path or settings.local_retriever_snapshot_path)
+        self._top_k = top_k or settings.local_retriever_top_k
+        self._candidate_k = max(candidate_k, self._top_k)
+        self._rrf_k = rrf_k
+        self._k1 = bm25_k1
+        self._b = bm25_b
+        self._reload_interval = (
+            reload_interval_seconds
+            if reload_interval_seconds is not None
+            else settings.local_retriever_reload_interval_seconds
+        )
+        self._index: _Index | None = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def retrieve(self, query: str) -> list[Document]:
+        """query를 BM25와 벡터 검색으로 각각 조회하고 RRF 점수 순으로 top_k를 반환한다."""
+        logger.info("local_hybrid_retrieve_start", query=query, snapshot=str(self._path))
+        try:
+            index = self._current_index()
+            if not index.documents:
+                return []
+            vector = get_embedding_service().embed(query)
+            vector_ranked = self._vector_top_k(index, vector)
+            bm25_ranked = self._bm25_top_k(index, query)
+            results = self._fuse(index, vector_ranked, bm25_ranked)
+            logger.info("local_hybrid_retrieve_end", query=query, results_count=len(results))
+            return results
+        except RAGRetrievalError:
+            raise
+        except Exception as exc:
+            raise RAGRetrievalError(
+                "local hybrid 검색 중 오류 발생",
+                cause=exc,
+                context={"query": query, "snapshot": str(self._path)},
+            ) from exc
+
+    def reload(self) -> bool:
+        """snapshot이 바뀌었으면 색인을 교체한다. 교체했으면 True."""
+        with self._lock:
+            current = self._index
+            try:
+                stamp = self._stamp()
+            except OSError as exc:
+                raise RAGRetrievalError(
+                    f"snapshot을 찾을 수 없습니다: {self._path}",
+                    cause=exc,
+                    context={"snapshot": str(self._path)},
+                ) from exc
+            if current is not None and current.stamp == stamp:
+                return False
+            self._index = self._load(current, stamp)
+            return True
+
+    # ── 색인 로딩 ──────────────────────────────────────────────
+
+    def _current_index(self) -> _Index:
+        now = time.monotonic()
+        due = self._reload_interval is not None and now - self._checked_at >= self._reload_interval
+        if self._index is None:
+            self._checked_at = now
+            self.reload()
+        elif due:
+            self._checked_at = now
+            try:
+                self.reload()
+            except Exception as exc:
+                # snapshot이 쓰이는 도중일 수 있다 — 기존 색인으로 계속 응답하고 다음 주기에 재시도한다.
+                logger.warning("local_hybrid_reload_failed", snapshot=str(self._path), error=str(exc))
+        return self._index
+
+    def _stamp(self) -> tuple[int, ...]:
+        """snapshot 파일들의 (mtime_ns, size). 값이 바뀌면 reload 대상이다."""
+        stamp: list[int] = []
+        for name in (DOCUMENTS_FILE, EMBEDDINGS_FILE):
+            stat = (self._path / name).stat()
+            stamp.extend((stat.st_mtime_ns, stat.st_size))
+        return tuple(stamp)
+
+    def _load(self, previous: _Index | None, stamp: tuple[int, ...]) -> _Index:
+        raw = (self._path / DOCUMENTS_FILE).read_bytes()
+        matrix = np.load(self._path / EMBEDDINGS_FILE, mmap_mode="r")
+        if matrix.ndim != 2 or matrix.dtype not in (np.float32, np.float16):
+            raise RAGRetrievalError(
+                "embeddings.npy는 float32/float16 2차원 행렬이어야 합니다.",
+                context={"snapshot": str(self._path), "dtype": str(matrix.dtype)},
+            )
+
+        incremental = (
+            previous is not None
+            and len(raw) >= previous.consumed_bytes
+            and hashlib.sha256(raw[: previous.consumed_bytes]).hexdigest()
+            == previous.consumed_digest
+        )
+        start = previous.consumed_bytes if incremental else 0
+        new_docs = [
+            Document(page_content=row.get("page_content", ""), metadata=row.get("metadata", {}))
+            for row in (json.loads(line) for line in raw[start:].decode("utf-8").splitlines() if line)
+        ]
+        documents = (previous.documents if incremental else []) + new_docs
+        if len(documents) != len(matrix):
+            raise RAGRetrievalError(
+                "snapshot의 문서 수와 임베딩 행 수가 다릅니다.",
+                context={"documents": len(documents), "embeddings": len(matrix)},
+            )
+
+        base = len(documents) - len(new_docs)
+        postings, new_lengths = self._index_documents(
+            new_docs, base, previous.postings if incremental else {}
+        )
+        new_norms = self._row_norms(matrix[base:])
+        index = _Index(
+            documents=documents,
+            matrix=matrix,
+            norms=np.concatenate([previous.norms, new_norms]) if incremental else new_norms,
+            postings=postings,
+            doc_lengths=(
+                np.concatenate([previous.doc_lengths, new_lengths]) if incremental else new_lengths
+            ),
+            consumed_bytes=len(raw),
+            consumed_digest=hashlib.sha256(raw).hexdigest(),
+            stamp=stamp,
+        )
+        logger.info(
+            "local_hybrid_index_loaded",
+            snapshot=str(self._path),
+            documents=len(documents),
+            added=len(new_docs),
+            incremental=incremental,
+            dtype=str(matrix.dtype),
+        )
+        return index
+
+    @staticmethod
+    def _index_documents(
+        documents: list[Document],
+        base: int,
+        postings: dict[str, tuple[np.ndarray, np.ndarray]],
+    ) -> tuple[dict[str, tuple[np.ndarray, np.ndarray]], np.ndarray]:
+        """새 문서의 역색인을 기존 postings에 합친 새 dict를 반환한다 (기존 색인은 변경하지 않는다)."""
+        added: dict[str, tuple[list[int], list[int]]] = {}
+        lengths = np.zeros(len(documents), dtype=np.float32)
+        for offset, doc in enumerate(documents):
+            tokens = tokenize(doc.page_content)
+            lengths[offset] = len(tokens)
+            for term, tf in Counter(tokens).items():
+                ids, tfs = added.setdefault(term, ([], []))
+                ids.append(base + offset)
+                tfs.append(tf)
+
+        merged = dict(postings)
+        for term, (ids, tfs) in added.items():
+            new_ids = np.asarray(ids, dtype=np.int32)
+            new_tfs = np.asarray(tfs, dtype=np.float32)
+            if term in merged:
+                old_ids, old_tfs = merged[term]
+                new_ids = np.concatenate([old_ids, new_ids])
+                new_tfs = np.concatenate([old_tfs, new_tfs])
+            merged[term] = (new_ids, new_tfs)
+        return merged, lengths
+
+    @staticmethod
+    def _row_norms(rows: np.ndarray) -> np.ndarray:
+        norms = np.empty(len(rows), dtype=np.float32)
+        for start in range(0, len(rows), _BLOCK_ROWS):
+            block = np.asarray(rows[start : start + _BLOCK_ROWS], dtype=np.float32)
+            norms[start : start + len(block)] = np.linalg.norm(block, axis=1)
+        norms[norms == 0] = 1.0
+        return norms
+
+    # ── 검색 ──────────────────────────────────────────────────
+
+    def _vector_top_k(self, index: _Index, vector: list[float]) -> np.ndarray:
+        query = np.asarray(vector, dtype=np.float32)
+        if query.shape[0] != index.matrix.shape[1]:
+            raise RAGRetrievalError(
+                "query 임베딩 차원이 snapshot과 다릅니다.",
+                context={"query_dim": query.shape[0], "snapshot_dim": index.matrix.shape[1]},
+            )
+        scores = np.empty(len(index.documents), dtype=np.float32)
+        for start in range(0, len(scores), _BLOCK_ROWS):
+            block = np.asarray(index.matrix[start : start + _BLOCK_ROWS], dtype=np.float32)
+            scores[start : start + len(block)] = block @ query
+        scores /= index.norms
+        return _top_k(scores, self._candidate_k)
+
+    def _bm25_top_k(self, index: _Index, query: str) -> np.ndarray:
+        n_docs = len(index.documents)
+        avg_len = float(index.doc_lengths.mean()) or 1.0
+        scores = np.zeros(n_docs, dtype=np.float32)
+        for term in set(tokenize(query)):
+            posting = index.postings.get(term)
+            if posting is None:
+                continue
+            ids, tfs = posting
+            idf = math.log(1.0 + (n_docs - len(ids) + 0.5) / (len(ids) + 0.5))
+            norm = self._k1 * (1.0 - self._b + self._b * index.doc_lengths[ids] / avg_len)
+            scores[ids] += idf * tfs * (self._k1 + 1.0) / (tfs + norm)
+        matched = np.flatnonzero(scores)
+        return matched[_top_k(scores[matched], self._candidate_k)]
+
+    def _fuse(self, index: _Index, *rankings: Iterable[int]) -> list[Document]:
+        fused: dict[int, float] = {}
+        for ranking in rankings:
+            for rank, doc_id in enumerate(ranking):
+                fused[int(doc_id)] = fused.get(int(doc_id), 0.0) + 1.0 / (self._rrf_k + rank + 1)
+        ranked = sorted(fused.items(), key=lambda item: item[1], reverse=True)[: self._top_k]
+        return [
+            Document(
+                page_content=index.documents[doc_id].page_content,
+                metadata={**index.documents[doc_id].metadata, "score": score},
+            )
+            for doc_id, score in ranked
+        ]
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """점수 내림차순 상위 k개 인덱스. argpartition으로 전체 정렬을 피한다."""
+    if len(scores) <= k:
+        return np.argsort(-scores, kind="stable")
+    candidates = np.argpartition(-scores, k)[:k]
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
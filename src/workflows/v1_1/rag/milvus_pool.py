@@ -0,0 +1,225 @@
+# Milvus 연결 풀 — 같은 URI를 쓰는 모든 retriever가 프로세스 단위로 연결을 공유한다
+# - pymilvus는 같은 설정의 MilvusClient들이 gRPC 채널 하나를 공유하므로 dedicated=True로 연결마다 별도 채널을 연다.
+# - URI별 최대 연결 수(max_size)를 넘으면 acquire_timeout 동안 반납을 기다린다.
+# - 오래 쉬고 있던 연결은 재사용 전에 health check하고, idle_timeout을 넘기면 닫는다.
+# - warm_up으로 그래프 빌드 시점에 미리 연결해 첫 요청이 handshake 비용을 내지 않게 한다.
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Iterator
+
+from pymilvus import MilvusClient
+
+from config.settings import get_settings
+from core.exceptions import RAGRetrievalError
+from core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def _dedicated_client(uri: str) -> MilvusClient:
+    """공유 handler가 아닌 전용 gRPC 채널을 가진 client. close() 시 채널도 함께 닫힌다."""
+    return MilvusClient(uri=uri, dedicated=True)
+
+
+@dataclass
+class _PooledClient:
+    client: MilvusClient
+    last_used: float
+    last_checked: float
+
+
+class MilvusConnectionPool:
+    """단일 URI에 대한 MilvusClient 풀."""
+
+    def __init__(
+        self,
+        uri: str,
+        max_size: int = 4,
+        idle_timeout_seconds: float | None = 300.0,
+        health_check_interval_seconds: float = 30.0,
+        acquire_timeout_seconds: float | None = 10.0,
+        client_factory: Callable[[str], MilvusClient] | None = None,
+    ) -> None:
+        self._uri = uri
+        self._max_size = max(1, max_size)
+        self._idle_timeout = idle_timeout_seconds
+        self._health_check_interval = health_check_interval_seconds
+        self._acquire_timeout = acquire_timeout_seconds
+        self._factory = client_factory or _dedicated_client
+        self._idle: list[_PooledClient] = []
+        self._size = 0
+        self._cond = threading.Condition()
+        self.created = 0
+        self.reused = 0
+        self.evicted = 0
+
+    @contextmanager
+    def connection(self) -> Iterator[MilvusClient]:
+        """풀에서 연결을 빌려 with 블록 동안 사용하고 반납한다."""
+        entry = self._acquire()
+        try:
+            yield entry.client
+        finally:
+            self._release(entry)
+
+    def warm_up(self, size: int = 1) -> int:
+        """idle 연결이 size개가 되도록 미리 연결한다. 새로 만든 연결 수를 반환한다."""
+        created = 0
+        while True:
+            with self._cond:
+                if len(self._idle) >= size or self._size >= self._max_size:
+                    break
+                self._size += 1
+            try:
+                entry = self._connect()
+            except RAGRetrievalError:
+                with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+                raise
+            with self._cond:
+                self._idle.append(entry)
+                self._cond.notify()
+            created += 1
+        logger.info("milvus_pool_warm_up", uri=self._uri, created=created)
+        return created
+
+    def close(self) -> None:
+        """idle 연결을 모두 닫는다. 사용 중인 연결은 반납 시 다시 풀에 들어간다."""
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for entry in idle:
+            self._close(entry)
+
+    def snapshot(self) -> dict[str, int]:
+        with self._cond:
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "created": self.created,
+                "reused": self.reused,
+                "evicted": self.evicted,
+            }
+
+    def _acquire(self) -> _PooledClient:
+        deadline = None if self._acquire_timeout is None else time.monotonic() + self._acquire_timeout
+        while True:
+            with self._cond:
+                self._evict_idle()
+                while not self._idle and self._size >= self._max_size:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise RAGRetrievalError(
+                            f"Milvus 연결 풀 대기 시간 초과: {self._uri}",
+                            context={"uri": self._uri, "max_size": self._max_size},
+                        )
+                    self._cond.wait(remaining)
+                    self._evict_idle()
+                if self._idle:
+                    # 가장 최근에 반납된 연결부터 재사용한다 (오래된 연결은 idle eviction 대상).
+                    entry = self._idle.pop()
+                else:
+                    entry = None
+                    self._size += 1
+
+            if entry is None:
+                try:
+                    return self._connect()
+                except RAGRetrievalError:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+
+            if self._is_healthy(entry):
+                self.reused += 1
+                return entry
+            self._discard(entry)
+
+    def _release(self, entry: _PooledClient) -> None:
+        entry.last_used = time.monotonic()
+        with self._cond:
+            self._idle.append(entry)
+            self._cond.notify()
+
+    def _connect(self) -> _PooledClient:
+        try:
+            client = self._factory(self._uri)
+        except Exception as exc:
+            raise RAGRetrievalError(
+                f"Milvus 연결 실패: {self._uri}",
+                cause=exc,
+                context={"uri": self._uri},
+            ) from exc
+        now = time.monotonic()
+        self.created += 1
+        logger.info("milvus_pool_connect", uri=self._uri)
+        return _PooledClient(client=client, last_used=now, last_checked=now)
+
+    def _is_healthy(self, entry: _PooledClient) -> bool:
+        now = time.monotonic()
+        if now - entry.last_checked < self._health_check_interval:
+            return True
+        try:
+            entry.client.get_server_version()
+        except Exception as exc:
+            logger.warning("milvus_pool_health_check_failed", uri=self._uri, error=str(exc))
+            return False
+        entry.last_checked = now
+        return True
+
+    def _evict_idle(self) -> None:
+        """idle_timeout을 넘긴 연결을 닫는다. self._cond를 잡은 상태에서 호출한다."""
+        if self._idle_timeout is None:
+            return
+        now = time.monotonic()
+        expired = [e for e in self._idle if now - e.last_used > self._idle_timeout]
+        if not expired:
+            return
+        self._idle = [e for e in self._idle if e not in expired]
+        self._size -= len(expired)
+        self.evicted += len(expired)
+        for entry in expired:
+            self._close(entry)
+
+    def _discard(self, entry: _PooledClient) -> None:
+        self._close(entry)
+        with self._cond:
+            self._size -= 1
+            self.evicted += 1
+            self._cond.notify()
+
+    def _close(self, entry: _PooledClient) -> None:
+        try:
+            entry.client.close()
+        except Exception as exc:
+            logger.warning("milvus_pool_close_failed", uri=self._uri, error=str(exc))
+
+
+@lru_cache(maxsize=None)
+def get_milvus_pool(uri: str) -> MilvusConnectionPool:
+    """URI별 프로세스 공유 연결 풀을 반환한다."""
+    settings = get_settings()
+    return MilvusConnectionPool(
+        uri,
+        max_size=settings.milvus_pool_max_size,
+        idle_timeout_seconds=settings.milvus_pool_idle_timeout_seconds,
+        health_check_interval_seconds=settings.milvus_pool_health_check_interval_seconds,
+        acquire_timeout_seconds=settings.milvus_pool_acquire_timeout_seconds,
+    )
+
+
+def warm_up_milvus_pools(uris: list[str], size: int) -> None:
+    """그래프 빌드 시점에 호출한다. 연결 실패는 경고만 남기고 첫 요청에서 다시 시도한다."""
+    for uri in dict.fromkeys(uris):
+        try:
+            get_milvus_pool(uri).warm_up(size)
+        except RAGRetrievalError as exc:
+            logger.warning("milvus_pool_warm_up_failed", uri=uri, error=str(exc))
@@ -2,14 +2,18 @@
 # 추후 GAIA SDK 도입 시: class GraphState(GaiaGraphState)로 교체
 from __future__ import annotations
 
-import operator
 from typing import Annotated, Any, TypedDict
 
+from core.history import bounded_messages
+
 
 class GraphState(TypedDict):
-    messages: Annotated[list, operator.add]
+    # 최근 history_max_turns 턴만 원문으로 유지하고 이전 턴은 맨 앞 요약 메시지로 접는다 (core/history.py)
+    messages: Annotated[list, bounded_messages]
     intent: str
+    intent_confidence: float | None  # LLM 분류 confidence (constrained 모드에서만 설정, 규칙/캐시 적중 시 None)
     agent_output: str
     context: list[str]
     metadata: dict[str, Any]
     error: str | None  # 시스템 오류 발생 시 설정; unknown_handler에서 오류/미매칭 구분에 사용
+    output_is_final: bool  # True이면 final_response가 LLM 재작성 없이 agent_output을 그대로 응답한다
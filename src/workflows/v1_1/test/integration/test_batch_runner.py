@@ -0,0 +1,70 @@
+"""batch_runner 통합 테스트 — JSONL 입력을 동시 세션으로 처리하고 결과를 JSONL로 기록하는지 검증."""
+from __future__ import annotations
+
+import io
+import json
+import re
+from unittest.mock import patch
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import AIMessage
+
+from batch_runner import run_batch
+from node.intent_batcher import IntentBatchClassifier
+
+
+_batch_prompts: list[str] = []
+
+
+class _PromptAwareChatModel(FakeListChatModel):
+    """batch 분류 프롬프트에는 번호별 intent를, 그 외 프롬프트에는 고정 응답을 돌려준다."""
+
+    def _call(self, messages, stop=None, run_manager=None, **kwargs) -> str:
+        prompt = messages[-1].content
+        if "사용자 입력 목록" in prompt:
+            _batch_prompts.append(prompt)
+            numbers = re.findall(r"^(\d+):", prompt, flags=re.MULTILINE)
+            return "\n".join(f"{n}: UNKNOWN" for n in numbers)
+        return "응답"
+
+
+def test_batch_runner_streams_results_and_coalesces_intent_calls():
+    lines = [json.dumps({"id": f"q{i}", "question": f"질문 {i}"}) for i in range(8)]
+    lines.insert(3, "not json")
+    output = io.StringIO()
+    batcher = IntentBatchClassifier(max_batch_size=8, max_wait_seconds=0.2)
+
+    with (
+        patch("core.llm.get_llm", return_value=_PromptAwareChatModel(responses=["응답"])),
+        patch("node.intent_classifier.get_intent_batcher", return_value=batcher),
+        patch("node.intent_classifier._node", None),
+    ):
+        from workflow import build_graph
+
+        summary = run_batch(
+            lines, output, graph=build_graph(), workers=8, intent_batch_size=8
+        )
+
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert summary.total == 9
+    assert summary.failed == 1
+    assert sorted(r["index"] for r in records) == list(range(9))
+    ok = [r for r in records if r["error"] is None]
+    assert {r["id"] for r in ok} == {f"q{i}" for i in range(8)}
+    assert all(r["intent"] == "UNKNOWN" and r["answer"] == "응답" for r in ok)
+    assert 0 < len(_batch_prompts) < 8
+
+
+class _FallbackGraph:
+    """final_response가 FALLBACK_MESSAGE를 내보낸 것과 같은 최종 state를 돌려준다."""
+
+    async def ainvoke(self, state, config=None):
+        return {**state, "messages": [*state["messages"], AIMessage(content="대체 응답")], "agent_output": ""}
+
+
+def test_batch_runner_records_final_message_as_answer():
+    output = io.StringIO()
+
+    run_batch([json.dumps({"id": "q0", "question": "질문"})], output, graph=_FallbackGraph(), workers=1)
+
+    assert json.loads(output.getvalue())["answer"] == "대체 응답"
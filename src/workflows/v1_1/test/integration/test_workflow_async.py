@@ -0,0 +1,55 @@
+"""workflow async 경로 통합 테스트 — graph.ainvoke가 async 노드 구현을 사용하는지 검증."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import HumanMessage
+
+from node._executor import AgentExecutor
+
+
+def _make_initial_state(user_input: str = "테스트 질문") -> dict:
+    return {
+        "messages": [HumanMessage(content=user_input)],
+        "intent": "",
+        "agent_output": "",
+        "context": [],
+        "metadata": {"session_id": "integration-async-test"},
+        "error": None,
+    }
+
+
+def test_ainvoke_runs_async_path_end_to_end():
+    """ainvoke 시 동기 execute를 거치지 않고 최종 응답까지 생성된다."""
+    fake_llm = FakeListChatModel(responses=["UNKNOWN", "기본 응답", "최종 응답"])
+
+    with (
+        patch("core.llm.get_llm", return_value=fake_llm),
+        patch.object(AgentExecutor, "execute", side_effect=AssertionError("sync path")),
+    ):
+        from workflow import build_graph
+        g = build_graph()
+        result = asyncio.run(g.ainvoke(_make_initial_state()))
+
+    assert result["intent"] == "UNKNOWN"
+    assert result["agent_output"] == "최종 응답"
+    assert result["messages"][-1].content == "최종 응답"
+
+
+def test_ainvoke_serves_concurrent_sessions_on_one_loop():
+    """여러 세션을 하나의 이벤트 루프에서 동시에 처리할 수 있다."""
+    fake_llm = FakeListChatModel(responses=["UNKNOWN", "기본 응답", "최종 응답"] * 20)
+
+    async def _run_all(g):
+        return await asyncio.gather(
+            *(g.ainvoke(_make_initial_state(f"질문 {i}")) for i in range(20))
+        )
+
+    with patch("core.llm.get_llm", return_value=fake_llm):
+        from workflow import build_graph
+        results = asyncio.run(_run_all(build_graph()))
+
+    assert len(results) == 20
+    assert all(r["messages"] for r in results)
@@ -0,0 +1,65 @@
+"""workflow 스트리밍 통합 테스트 — final_response 토큰이 stream_mode="messages"로 흘러나오는지 검증."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import AIMessageChunk, HumanMessage
+
+
+def _make_initial_state(user_input: str = "테스트 질문") -> dict:
+    return {
+        "messages": [HumanMessage(content=user_input)],
+        "intent": "",
+        "agent_output": "",
+        "context": [],
+        "metadata": {"session_id": "integration-stream-test"},
+        "error": None,
+    }
+
+
+def _final_tokens(events) -> tuple[list[str], dict]:
+    tokens: list[str] = []
+    state: dict = {}
+    for mode, payload in events:
+        if mode == "values":
+            state = payload
+            continue
+        chunk, metadata = payload
+        if metadata.get("langgraph_node") == "final_response" and isinstance(chunk, AIMessageChunk):
+            tokens.append(chunk.content)
+    return tokens, state
+
+
+def test_final_response_streams_tokens_and_assembles_message():
+    fake_llm = FakeListChatModel(responses=["UNKNOWN", "기본 응답", "스트리밍 최종 응답"])
+
+    with patch("core.llm.get_llm", return_value=fake_llm):
+        from workflow import build_graph
+        events = list(
+            build_graph().stream(_make_initial_state(), stream_mode=["messages", "values"])
+        )
+
+    tokens, state = _final_tokens(events)
+    assert len(tokens) > 1
+    assert "".join(tokens) == "스트리밍 최종 응답"
+    assert state["messages"][-1].content == "스트리밍 최종 응답"
+
+
+def test_final_response_streams_on_async_path():
+    fake_llm = FakeListChatModel(responses=["UNKNOWN", "기본 응답", "비동기 응답"])
+
+    async def _collect(g):
+        return [
+            event
+            async for event in g.astream(_make_initial_state(), stream_mode=["messages", "values"])
+        ]
+
+    with patch("core.llm.get_llm", return_value=fake_llm):
+        from workflow import build_graph
+        events = asyncio.run(_collect(build_graph()))
+
+    tokens, state = _final_tokens(events)
+    assert "".join(tokens) == "비동기 응답"
+    assert state["agent_output"] == "비동기 응답"
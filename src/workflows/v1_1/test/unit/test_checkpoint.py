@@ -0,0 +1,80 @@
+"""core/checkpoint.py 유닛 테스트 — zstd 직렬화, SQLite 세션 재개, delta blob 저장 검증."""
+from __future__ import annotations
+
+import sqlite3
+from unittest.mock import patch
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+
+from core.checkpoint import SQLiteCheckpointSaver, ZstdMsgpackSerializer, session_config
+
+
+def _turn(user_input: str) -> dict:
+    return {
+        "messages": [HumanMessage(content=user_input)],
+        "intent": "",
+        "agent_output": "",
+        "context": [],
+        "metadata": {"session_id": "checkpoint-test"},
+        "error": None,
+    }
+
+
+def test_serializer_compresses_large_values_only():
+    serde = ZstdMsgpackSerializer(min_size=128)
+    large = {"messages": [AIMessage(content="같은 응답 " * 200)]}
+
+    type_, data = serde.dumps_typed(large)
+    small_type, _ = serde.dumps_typed({"intent": "A"})
+
+    assert type_ == "msgpack+zstd"
+    assert len(data) < len(ZstdMsgpackSerializer(min_size=10**9).dumps_typed(large)[1])
+    assert serde.loads_typed((type_, data)) == large
+    assert small_type == "msgpack"
+
+
+def test_sqlite_checkpointer_resumes_session_across_instances(tmp_path):
+    """프로세스 재시작(새 saver 인스턴스) 후에도 같은 thread_id의 대화가 이어진다."""
+    path = str(tmp_path / "checkpoints.sqlite3")
+    config = session_config("checkpoint-test")
+    fake_llm = FakeListChatModel(
+        responses=["UNKNOWN", "기본 응답", "첫 응답", "UNKNOWN", "기본 응답", "둘째 응답"]
+    )
+
+    with patch("core.llm.get_llm", return_value=fake_llm):
+        from workflow import build_graph
+
+        build_graph(SQLiteCheckpointSaver(path)).invoke(_turn("첫 질문"), config)
+        restarted = build_graph(SQLiteCheckpointSaver(path, serde=ZstdMsgpackSerializer()))
+        result = restarted.invoke(_turn("두번째 질문"), config)
+
+    assert [m.content for m in result["messages"]] == [
+        "첫 질문",
+        "첫 응답",
+        "두번째 질문",
+        "둘째 응답",
+    ]
+    history = list(restarted.get_state_history(config))
+    assert history[-1].parent_config is None
+    assert history[0].values["agent_output"] == "둘째 응답"
+
+
+def test_sqlite_checkpointer_stores_only_changed_channels(tmp_path):
+    """checkpoint마다 모든 채널을 다시 쓰지 않고, version이 바뀐 채널 값만 blob으로 저장한다."""
+    path = str(tmp_path / "checkpoints.sqlite3")
+    fake_llm = FakeListChatModel(responses=["UNKNOWN", "기본 응답", "최종 응답"] * 3)
+
+    with patch("core.llm.get_llm", return_value=fake_llm):
+        from workflow import build_graph
+
+        g = build_graph(SQLiteCheckpointSaver(path))
+        for i in range(3):
+            g.invoke(_turn(f"질문 {i}"), session_config("checkpoint-test"))
+
+    with sqlite3.connect(path) as conn:
+        checkpoints = conn.execute("SELECT COUNT(*) FROM checkpoints").fetchone()[0]
+        blobs = conn.execute("SELECT COUNT(*) FROM blobs").fetchone()[0]
+    channels = len(g.get_state(session_config("checkpoint-test")).values)
+
+    assert blobs < checkpoints * channels
@@ -0,0 +1,113 @@
+"""core/context_budget.py 유닛 테스트 — near-duplicate 제거, token 예산 packing, 우선순위 검증."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from core.context_budget import ContextAssembler, count_tokens
+from node._executor import AgentExecutor
+from rag.base_retriever import BaseRetriever, Document
+
+
+@pytest.fixture(autouse=True)
+def offline_tokenizer():
+    """tiktoken encoding 다운로드 없이 추정 token 수를 사용한다."""
+    with patch("core.context_budget._get_encoder", return_value=None):
+        yield
+
+
+_REFUND = (
+    "환불은 구매일로부터 7일 이내에 고객센터를 통해 신청할 수 있습니다. "
+    "단순 변심도 포함되며, 사용하지 않은 상품에 한해 전액 환불됩니다. 배송비는 고객 부담입니다."
+)
+
+
+def test_near_duplicate_chunks_are_removed():
+    """다른 retriever가 출처 표기만 덧붙여 돌려준 같은 chunk는 한 번만 남긴다."""
+    assembler = ContextAssembler(dedup_threshold=0.8)
+    near_duplicate = _REFUND + " (출처: FAQ)"
+
+    pack = assembler.assemble([_REFUND, near_duplicate, "배송은 영업일 기준 2일이 걸립니다."])
+
+    assert pack.items == [_REFUND, "배송은 영업일 기준 2일이 걸립니다."]
+    assert pack.duplicates_removed == 1
+    assert pack.tokens_saved == count_tokens(near_duplicate)
+
+
+def test_exact_duplicates_removed_even_with_minhash_disabled():
+    pack = ContextAssembler(dedup_threshold=1.0).assemble(["a  b", "A b", "c"])
+
+    assert pack.items == ["a  b", "c"]
+
+
+def test_budget_keeps_highest_priority_chunks_and_reports_savings():
+    chunks = ["첫번째 문서 " * 10, "두번째 문서 " * 10, "짧은 문서"]
+    budget = count_tokens(chunks[0]) + count_tokens(chunks[2])
+
+    pack = ContextAssembler(budget_tokens=budget).assemble(chunks)
+
+    assert pack.items == [chunks[0], chunks[2]]
+    assert pack.dropped == 1
+    assert pack.tokens_after <= budget
+    assert pack.tokens_saved == count_tokens(chunks[1])
+
+
+def test_tool_results_then_new_retrieval_then_carried_context():
+    carried = "이전 턴 컨텍스트 " * 5
+    retrieved = "이번 턴 검색 결과 " * 5
+    tool_result = {"result": "tool 결과"}
+    budget = count_tokens(str(tool_result)) + count_tokens(retrieved)
+
+    pack = ContextAssembler(budget_tokens=budget).assemble(
+        [carried, retrieved], [tool_result], carried=1
+    )
+
+    assert pack.tool_results == [tool_result]
+    assert pack.items == [retrieved]
+
+
+class _ScoredRetriever(BaseRetriever):
+    def __init__(self, docs: list[Document]) -> None:
+        self._docs = docs
+
+    def retrieve(self, query: str) -> list[Document]:
+        return self._docs
+
+
+def test_executor_merges_retrieval_in_registration_order_and_bounds_returned_context(base_state):
+    executor = AgentExecutor(
+        system_prompt="{context}",
+        user_prompt_template="{user_input}",
+        retrievers=[
+            _ScoredRetriever([Document("낮은 점수 문서", {"score": 0.1})]),
+            _ScoredRetriever([Document("높은 점수 문서", {"score": 0.9}), Document("점수 없음")]),
+        ],
+        context_assembler=ContextAssembler(budget_tokens=count_tokens("낮은 점수 문서") + 1),
+    )
+
+    assert executor._run_retrieval("q", []) == ["낮은 점수 문서", "높은 점수 문서", "점수 없음"]
+
+    with patch("core.llm.get_llm") as mock_get_llm:
+        mock_get_llm.return_value.invoke.return_value.content = "답변"
+        result = executor.execute({**base_state, "context": ["이전 컨텍스트 " * 20]})
+
+    assert result["context"] == ["낮은 점수 문서"]
+    prompt = mock_get_llm.return_value.invoke.call_args[0][0][0].content
+    assert "이전 컨텍스트" not in prompt
+
+
+def test_second_retrievers_top_hit_survives_budget():
+    first = [Document(text) for text in ("환불 규정 안내", "배송 지연 보상 기준", "회원 등급별 혜택 정리")]
+    executor = AgentExecutor(
+        system_prompt="{context}",
+        user_prompt_template="{user_input}",
+        retrievers=[_ScoredRetriever(first), _ScoredRetriever([Document("둘째 retriever 1위")])],
+    )
+    items = executor._run_retrieval("q", [])
+    budget = count_tokens(items[0]) + count_tokens(items[1])
+
+    pack = ContextAssembler(budget_tokens=budget).assemble(items, [])
+
+    assert items == ["환불 규정 안내", "둘째 retriever 1위", "배송 지연 보상 기준", "회원 등급별 혜택 정리"]
+    assert pack.items == ["환불 규정 안내", "둘째 retriever 1위"]
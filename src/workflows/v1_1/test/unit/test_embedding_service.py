@@ -0,0 +1,148 @@
+"""rag/embedding.py 유닛 테스트 — micro-batching, 중복 제거, LRU/SQLite 캐시 검증."""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+from core.batching import MicroBatcher
+from rag.embedding import EmbeddingService, SQLiteEmbeddingStore
+
+
+class _CountingEmbeddings:
+    """embed_documents 호출마다 입력을 기록하는 가짜 임베딩 모델."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.calls: list[list[str]] = []
+        self._delay = delay
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        time.sleep(self._delay)
+        return [[float(len(text)), 1.0] for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.embed_documents([text])[0]
+
+
+def _service(embeddings, **kwargs) -> EmbeddingService:
+    return EmbeddingService(embeddings, model="fake", max_wait_seconds=0.05, **kwargs)
+
+
+def test_concurrent_requests_share_one_api_call():
+    """동시에 들어온 여러 retriever의 임베딩 요청이 한 번의 API 호출로 처리된다."""
+    embeddings = _CountingEmbeddings()
+    service = _service(embeddings)
+    queries = ["같은 질문", "같은 질문", "다른 질문", "같은 질문"]
+    results: dict[int, list[float]] = {}
+
+    def worker(i: int) -> None:
+        results[i] = service.embed(queries[i])
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(queries))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(embeddings.calls) == 1
+    assert sorted(embeddings.calls[0]) == ["같은 질문", "다른 질문"]
+    assert results[0] == results[1] == results[3]
+    assert service.api_calls == 1
+
+
+def test_embed_many_dedupes_and_keeps_order():
+    embeddings = _CountingEmbeddings()
+    service = _service(embeddings)
+
+    vectors = service.embed_many(["a", "bb", "a"])
+
+    assert embeddings.calls == [["a", "bb"]]
+    assert vectors == [[1.0, 1.0], [2.0, 1.0], [1.0, 1.0]]
+
+
+def test_repeated_query_hits_lru_without_api_call():
+    embeddings = _CountingEmbeddings()
+    service = _service(embeddings)
+
+    service.embed("질문")
+    service.embed("질문")
+
+    assert len(embeddings.calls) == 1
+    assert service.stats.snapshot()["hits"] == 1
+
+
+def test_in_flight_request_is_shared():
+    """batch가 처리 중일 때 같은 텍스트가 다시 요청되면 같은 결과를 기다린다."""
+    embeddings = _CountingEmbeddings(delay=0.2)
+    service = EmbeddingService(embeddings, model="fake", max_wait_seconds=0.0)
+    first = threading.Thread(target=service.embed, args=("느린 질문",))
+    first.start()
+    time.sleep(0.05)
+
+    service.embed("느린 질문")
+    first.join()
+
+    assert len(embeddings.calls) == 1
+
+
+def test_sqlite_store_survives_new_service(tmp_path):
+    path = str(tmp_path / "embeddings.sqlite3")
+    first = _CountingEmbeddings()
+    _service(first, store=SQLiteEmbeddingStore(path)).embed("영속 질문")
+
+    second = _CountingEmbeddings()
+    vector = _service(second, store=SQLiteEmbeddingStore(path)).embed("영속 질문")
+
+    assert second.calls == []
+    assert vector == [5.0, 1.0]
+
+
+def test_async_requests_are_batched():
+    embeddings = _CountingEmbeddings()
+    service = _service(embeddings)
+
+    async def _run():
+        return await asyncio.gather(service.aembed("x"), service.aembed("yy"), service.aembed("x"))
+
+    vectors = asyncio.run(_run())
+
+    assert len(embeddings.calls) == 1
+    assert vectors[0] == vectors[2] == [1.0, 1.0]
+
+
+def test_micro_batcher_propagates_batch_failure():
+    def fail(keys):
+        raise RuntimeError("embedding API down")
+
+    batcher: MicroBatcher[str, int] = MicroBatcher(fail, max_wait_seconds=0.0)
+    future = batcher.submit("q")
+
+    assert isinstance(future.exception(timeout=1), RuntimeError)
+
+
+def test_micro_batcher_runs_batches_concurrently():
+    running = 0
+    overlapped = threading.Event()
+    lock = threading.Lock()
+
+    def slow(keys: list[int]) -> list[int]:
+        nonlocal running
+        with lock:
+            running += 1
+            if running > 1:
+                overlapped.set()
+        time.sleep(0.2)
+        with lock:
+            running -= 1
+        return keys
+
+    batcher: MicroBatcher[int, int] = MicroBatcher(
+        slow, max_batch_size=16, max_wait_seconds=0.05, max_inflight_batches=4
+    )
+    started = time.perf_counter()
+    futures = batcher.submit_many(list(range(64)))
+
+    assert [f.result(timeout=2) for f in futures] == list(range(64))
+    assert overlapped.is_set()
+    assert time.perf_counter() - started < 0.6
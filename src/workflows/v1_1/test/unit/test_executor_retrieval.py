@@ -0,0 +1,115 @@
+"""AgentExecutor._run_retrieval 유닛 테스트 — retriever fan-out 동작 검증."""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import CancelledError
+
+import pytest
+from langchain_core.messages import HumanMessage
+
+from core.concurrency import FailurePolicy
+from core.exceptions import AgentExecutionError, RAGRetrievalError
+from node._executor import AgentExecutor
+from rag.base_retriever import BaseRetriever, Document
+
+
+class _SleepyRetriever(BaseRetriever):
+    def __init__(self, name: str, delay: float, fail: bool = False) -> None:
+        self._name = name
+        self._delay = delay
+        self._fail = fail
+
+    def retrieve(self, query: str) -> list[Document]:
+        time.sleep(self._delay)
+        if self._fail:
+            raise RAGRetrievalError(f"{self._name} failed")
+        return [Document(page_content=f"{self._name}:{query}")]
+
+
+def _make_executor(retrievers, **kwargs) -> AgentExecutor:
+    return AgentExecutor(
+        system_prompt="{context}",
+        user_prompt_template="{user_input}",
+        retrievers=retrievers,
+        **kwargs,
+    )
+
+
+def test_concurrent_retrieval_keeps_registration_order():
+    """완료 순서와 무관하게 retriever 등록 순서대로 context가 병합된다."""
+    executor = _make_executor(
+        [_SleepyRetriever("slow", 0.2), _SleepyRetriever("fast", 0.0)],
+        retrieval_concurrency=2,
+    )
+    result = executor._run_retrieval("q", ["기존"])
+
+    assert result == ["기존", "slow:q", "fast:q"]
+
+
+def test_concurrent_retrieval_pays_max_latency_not_sum():
+    """동시 실행 시 총 소요시간은 retriever 지연의 합이 아니라 최댓값에 가깝다."""
+    executor = _make_executor(
+        [_SleepyRetriever(f"r{i}", 0.2) for i in range(3)],
+        retrieval_concurrency=3,
+    )
+    start = time.perf_counter()
+    executor._run_retrieval("q", [])
+    assert time.perf_counter() - start < 0.5
+
+
+def test_fail_fast_raises_agent_execution_error():
+    executor = _make_executor(
+        [_SleepyRetriever("ok", 0.0), _SleepyRetriever("bad", 0.0, fail=True)],
+        retrieval_concurrency=2,
+        retrieval_failure_policy=FailurePolicy.FAIL_FAST,
+    )
+    with pytest.raises(AgentExecutionError, match="_SleepyRetriever"):
+        executor._run_retrieval("q", [])
+
+
+def test_degrade_drops_failing_and_timed_out_sources():
+    """DEGRADE 정책에서는 실패/timeout 소스만 제외하고 나머지 결과를 반환한다."""
+    executor = _make_executor(
+        [
+            _SleepyRetriever("ok", 0.0),
+            _SleepyRetriever("bad", 0.0, fail=True),
+            _SleepyRetriever("stuck", 1.0),
+        ],
+        retrieval_concurrency=3,
+        retrieval_timeout=0.1,
+        retrieval_failure_policy="degrade",
+    )
+    start = time.perf_counter()
+    result = executor._run_retrieval("q", [])
+
+    assert result == ["ok:q"]
+    assert time.perf_counter() - start < 0.5
+
+
+def test_async_retrieval_matches_sync_merge_order():
+    """_arun_retrieval도 등록 순서 병합과 DEGRADE 정책을 동일하게 따른다."""
+    executor = _make_executor(
+        [
+            _SleepyRetriever("slow", 0.2),
+            _SleepyRetriever("bad", 0.0, fail=True),
+            _SleepyRetriever("fast", 0.0),
+        ],
+        retrieval_concurrency=3,
+        retrieval_failure_policy="degrade",
+    )
+    result = asyncio.run(executor._arun_retrieval("q", []))
+
+    assert result == ["slow:q", "fast:q"]
+
+
+def test_cancelled_prefetch_skips_retrieval():
+    """speculation에서 진 prefetch는 아직 시작하지 않은 retriever를 호출하지 않는다."""
+    retriever = _SleepyRetriever("r", 0.0)
+    retriever.retrieve = lambda query: pytest.fail("취소된 prefetch가 retriever를 호출했다")
+    cancelled = threading.Event()
+    cancelled.set()
+
+    with pytest.raises(CancelledError):
+        _make_executor([retriever]).prefetch({"messages": [HumanMessage(content="q")]}, cancelled)
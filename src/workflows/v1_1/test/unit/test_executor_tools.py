@@ -0,0 +1,104 @@
+"""AgentExecutor._run_tools 유닛 테스트 — 병렬 tool 호출과 retrieval/tool 단계 중첩 검증."""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from core.exceptions import AgentExecutionError
+from mcp.client import MCPClient
+from mcp.tool.base_tool import BaseTool
+from node._executor import AgentExecutor
+from rag.base_retriever import BaseRetriever, Document
+
+
+class _SleepyTool(BaseTool):
+    def __init__(self, name: str, delay: float, fail: bool = False) -> None:
+        self._name = name
+        self._delay = delay
+        self._fail = fail
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def description(self) -> str:
+        return self._name
+
+    @property
+    def args_schema(self) -> dict[str, Any]:
+        return {"type": "object", "properties": {"query": {"type": "string"}}}
+
+    def call(self, args: dict[str, Any]) -> dict[str, Any]:
+        time.sleep(self._delay)
+        if self._fail:
+            raise RuntimeError(f"{self._name} failed")
+        return {"tool": self._name, "query": args["query"]}
+
+
+class _SleepyRetriever(BaseRetriever):
+    def retrieve(self, query: str) -> list[Document]:
+        time.sleep(0.2)
+        return [Document(page_content=f"doc:{query}")]
+
+
+def _make_executor(tools: list[_SleepyTool], **kwargs) -> AgentExecutor:
+    client = MCPClient()
+    for tool in tools:
+        client.register_tool(tool)
+    return AgentExecutor(
+        system_prompt="{context}",
+        user_prompt_template="{user_input}",
+        mcp_client=client,
+        tools=[tool.name for tool in tools],
+        **kwargs,
+    )
+
+
+def test_parallel_tools_collect_in_registration_order():
+    executor = _make_executor(
+        [_SleepyTool("slow", 0.2), _SleepyTool("fast", 0.0)],
+        tool_concurrency=2,
+    )
+    start = time.perf_counter()
+    results = executor._run_tools("q")
+
+    assert [r["tool"] for r in results] == ["slow", "fast"]
+    assert time.perf_counter() - start < 0.35
+
+
+def test_tool_deadline_fails_fast():
+    executor = _make_executor(
+        [_SleepyTool("ok", 0.0), _SleepyTool("stuck", 1.0)],
+        tool_concurrency=2,
+        tool_timeout=0.1,
+    )
+    with pytest.raises(AgentExecutionError, match="stuck"):
+        executor._run_tools("q")
+
+
+def test_async_tools_degrade_drops_failed_tool():
+    executor = _make_executor(
+        [_SleepyTool("bad", 0.0, fail=True), _SleepyTool("ok", 0.0)],
+        tool_concurrency=2,
+        tool_failure_policy="degrade",
+    )
+    results = asyncio.run(executor._arun_tools("q"))
+
+    assert [r["tool"] for r in results] == ["ok"]
+
+
+def test_overlap_runs_retrieval_and_tools_together():
+    """overlap_phases가 켜지면 retrieval 완료를 기다리지 않고 tool이 함께 실행된다."""
+    executor = _make_executor([_SleepyTool("search", 0.2)], overlap_phases=True)
+    executor._retrievers = [_SleepyRetriever()]
+
+    start = time.perf_counter()
+    context_items, tool_results = executor._gather_inputs("q", [])
+
+    assert time.perf_counter() - start < 0.35
+    assert context_items == ["doc:q"]
+    assert tool_results == [{"tool": "search", "query": "q"}]
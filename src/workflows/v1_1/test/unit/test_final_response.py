@@ -0,0 +1,62 @@
+"""final_response.py 유닛 테스트 — passthrough 경로 검증."""
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+from config.intents import Intent
+from config.settings import Settings
+from node.default_response import DefaultResponseNode
+from node.final_response import FinalResponseNode
+from prompt.default_response_prompt import ERROR_MESSAGE
+
+
+def test_output_marked_final_skips_llm(base_state):
+    state = {**base_state, "agent_output": "완성된 답변", "output_is_final": True}
+    with patch("core.llm.get_llm") as mock_get_llm:
+        result = FinalResponseNode().run(state)
+
+    mock_get_llm.assert_not_called()
+    assert result["messages"][-1].content == "완성된 답변"
+    assert result["output_is_final"] is False
+
+
+def test_passthrough_intent_policy_skips_llm(base_state):
+    state = {**base_state, "intent": Intent.INTENT_B.value, "agent_output": "B 답변"}
+    with (
+        patch(
+            "node.final_response.get_settings",
+            return_value=Settings(final_response_passthrough_intents=[Intent.INTENT_B.value]),
+        ),
+        patch("core.llm.get_llm") as mock_get_llm,
+    ):
+        result = FinalResponseNode().run(state)
+
+    mock_get_llm.assert_not_called()
+    assert result["messages"][-1].content == "B 답변"
+
+
+def test_non_final_output_is_rewritten_by_llm(base_state):
+    state = {**base_state, "intent": Intent.INTENT_A.value, "agent_output": "초안"}
+    with (
+        patch(
+            "node.final_response.get_settings",
+            return_value=Settings(final_response_streaming=False),
+        ),
+        patch("core.llm.get_llm") as mock_get_llm,
+    ):
+        mock_get_llm.return_value.invoke.return_value = MagicMock(content="다듬은 답변")
+        result = FinalResponseNode().run(state)
+
+    assert result["messages"][-1].content == "다듬은 답변"
+
+
+def test_default_response_error_branch_passes_through_final_response(base_state):
+    """분류 오류 시 고정 ERROR_MESSAGE가 LLM 재작성 없이 그대로 최종 응답이 된다."""
+    state = {**base_state, "intent": Intent.UNKNOWN.value, "error": "LLM connection error"}
+    with patch("core.llm.get_llm") as mock_get_llm:
+        default_result = DefaultResponseNode().run(state)
+        final_result = FinalResponseNode().run({**state, **default_result})
+
+    mock_get_llm.assert_not_called()
+    assert default_result["output_is_final"] is True
+    assert final_result["messages"][-1].content == ERROR_MESSAGE
@@ -0,0 +1,78 @@
+"""core/history.py 유닛 테스트 — bounded history reducer의 턴 제한과 결정적 발췌 요약 검증."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from config.settings import Settings
+from core.history import bounded_messages, is_summary
+
+
+def _turn(i: int, answer: str | None = None) -> list:
+    return [HumanMessage(content=f"질문 {i}"), AIMessage(content=answer or f"답변 {i}")]
+
+
+@pytest.fixture
+def history_settings():
+    with patch(
+        "core.history.get_settings",
+        return_value=Settings(history_max_turns=2, history_summary_max_chars=200),
+    ):
+        yield
+
+
+def test_keeps_last_turns_and_folds_older_into_summary(history_settings):
+    messages: list = []
+    for i in range(4):
+        messages = bounded_messages(messages, _turn(i))
+
+    assert is_summary(messages[0])
+    assert [m.content for m in messages[1:]] == ["질문 2", "답변 2", "질문 3", "답변 3"]
+    assert messages[0].content == (
+        "[이전 대화 4개 메시지 생략 — 최근 내용 발췌]\n"
+        "사용자: 질문 0\n어시스턴트: 답변 0\n사용자: 질문 1\n어시스턴트: 답변 1"
+    )
+
+
+def test_reducer_is_deterministic(history_settings):
+    updates = [_turn(i) for i in range(6)]
+
+    def _run() -> list:
+        messages: list = []
+        for update in updates:
+            messages = bounded_messages(messages, update)
+        return messages
+
+    assert _run() == _run()
+
+
+def test_excerpt_keeps_whole_lines_and_cuts_long_line_at_sentence_boundary(history_settings):
+    long_answer = "첫 문장입니다. " + "가" * 300 + ". 마지막 문장입니다."
+    messages = bounded_messages([], _turn(0, long_answer) + _turn(1) + _turn(2))
+
+    summary = messages[0].content
+    assert len(summary) <= 200
+    # 예산을 넘는 "사용자: 질문 0" 이전 줄은 통째로 빠지고, 긴 답변은 문장 경계부터 남는다.
+    assert summary.split("\n")[1] == "…마지막 문장입니다."
+
+
+def test_state_size_stays_bounded_over_long_session(history_settings):
+    messages: list = []
+    for i in range(50):
+        messages = bounded_messages(messages, _turn(i))
+
+    assert len(messages) == 1 + 2 * 2
+    assert len(messages[0].content) <= 200
+    assert messages[0].content.startswith("[이전 대화 96개 메시지 생략")
+    assert messages[0].content.endswith("어시스턴트: 답변 47")
+
+
+def test_unbounded_when_max_turns_is_none():
+    with patch("core.history.get_settings", return_value=Settings(history_max_turns=None)):
+        messages: list = []
+        for i in range(5):
+            messages = bounded_messages(messages, _turn(i))
+
+    assert len(messages) == 10
@@ -0,0 +1,38 @@
+"""node/intent_batcher.py 유닛 테스트 — 세션 간 intent 분류 LLM 호출 coalescing 검증."""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from node.intent_batcher import IntentBatchClassifier, parse_batch_output
+
+
+def test_parse_batch_output_tolerates_noise_and_missing_lines():
+    text = "결과:\n1: INTENT_A\n3) `INTENT_B`\n9: INTENT_A\n1: UNKNOWN"
+
+    assert parse_batch_output(text, 3) == ["INTENT_A", None, "INTENT_B"]
+
+
+def test_concurrent_requests_share_one_llm_call():
+    fake_llm = FakeListChatModel(responses=["1: INTENT_A\n2: INTENT_B\n3: UNKNOWN"])
+    classifier = IntentBatchClassifier(max_batch_size=3, max_wait_seconds=1.0)
+
+    with patch("core.llm.get_llm", return_value=fake_llm) as mock_get_llm:
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            results = list(pool.map(classifier.classify, ["질문 A", "질문 B", "질문 C"]))
+
+    assert mock_get_llm.call_count == 1
+    assert sorted(results) == ["INTENT_A", "INTENT_B", "UNKNOWN"]
+
+
+def test_missing_batch_entries_fall_back_to_single_prompt():
+    fake_llm = FakeListChatModel(responses=["1: INTENT_A", "INTENT_B"])
+    classifier = IntentBatchClassifier(max_batch_size=2, max_wait_seconds=1.0)
+
+    with patch("core.llm.get_llm", return_value=fake_llm):
+        futures = classifier._batcher.submit_many(["첫 질문", "둘째 질문"])
+        results = [f.result() for f in futures]
+
+    assert results == ["INTENT_A", "INTENT_B"]
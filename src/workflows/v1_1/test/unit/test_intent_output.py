@@ -0,0 +1,86 @@
+"""node/intent_output.py 유닛 테스트 — enum schema 호출 옵션, logprob confidence, confidence 임계값 라우팅 검증."""
+from __future__ import annotations
+
+import json
+import math
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from config.intents import Intent
+from config.settings import Settings
+from core.context_budget import count_tokens
+from core.exceptions import IntentClassificationError
+from node.intent_classifier import IntentClassifierNode
+from node.intent_output import constrained_options, parse_prediction
+
+
+def _response(intent: str, *probabilities: float) -> AIMessage:
+    return AIMessage(
+        content=json.dumps({"intent": intent}, separators=(",", ":")),
+        response_metadata={
+            "logprobs": {"content": [{"token": "t", "logprob": math.log(p)} for p in probabilities]}
+        },
+    )
+
+
+class _RecordingFakeChatModel(GenericFakeChatModel):
+    """bind로 넘어온 호출 옵션을 기록한다."""
+
+    calls: list[dict[str, Any]] = []
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        self.calls.append(kwargs)
+        return super()._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+
+def test_options_restrict_output_to_intent_enum_and_size_max_tokens():
+    options = constrained_options()
+    schema = options["response_format"]["json_schema"]["schema"]
+
+    assert schema["properties"]["intent"]["enum"] == [intent.value for intent in Intent]
+    assert options["logprobs"] is True
+    longest = max(count_tokens(f'{{"intent":"{intent.value}"}}') for intent in Intent)
+    assert longest <= options["max_tokens"] <= longest + 2
+
+
+def test_parse_prediction_uses_token_probabilities_as_confidence():
+    prediction = parse_prediction(_response("INTENT_B", 1.0, 0.9, 0.8))
+
+    assert prediction.intent is Intent.INTENT_B
+    assert prediction.confidence == pytest.approx(0.72)
+    assert parse_prediction(AIMessage(content='{"intent":"UNKNOWN"}')).confidence is None
+    with pytest.raises(IntentClassificationError):
+        parse_prediction(AIMessage(content='{"intent":"INTE'))
+
+
+@pytest.mark.parametrize(
+    ("probability", "expected"),
+    [(0.95, Intent.INTENT_A), (0.4, Intent.UNKNOWN)],
+)
+def test_constrained_classifier_applies_confidence_threshold(base_state, probability, expected):
+    model = _RecordingFakeChatModel(messages=iter([_response("INTENT_A", probability)]))
+    model.calls.clear()
+    settings = Settings(intent_output_mode="constrained", intent_min_confidence=0.6)
+
+    with (
+        patch("node.intent_classifier.get_settings", return_value=settings),
+        patch("core.llm.get_llm", return_value=model),
+    ):
+        result = IntentClassifierNode().run(base_state)
+
+    assert result["intent"] == expected.value
+    assert result["intent_confidence"] == pytest.approx(probability)
+    assert result["error"] is None
+    assert model.calls[0]["response_format"]["type"] == "json_schema"
+
+
+def test_constrained_mode_rejects_llm_batching():
+    settings = Settings(intent_output_mode="constrained")
+
+    with patch("node.intent_classifier.get_settings", return_value=settings):
+        with pytest.raises(ValueError):
+            IntentClassifierNode(batch_max_size=8)
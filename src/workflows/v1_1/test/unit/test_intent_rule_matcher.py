@@ -0,0 +1,55 @@
+"""intent_rule_matcher.py 유닛 테스트 — 규칙 fast path와 충돌 처리 검증."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from langchain_core.messages import HumanMessage
+
+from config.intent_rules import IntentRule
+from config.intents import Intent
+from config.settings import Settings
+from node.intent_classifier import IntentClassifierNode
+from node.intent_rule_matcher import IntentRuleMatcher
+
+_RULES = [
+    IntentRule(Intent.INTENT_A, keywords=("iflow", "블로그")),
+    IntentRule(Intent.INTENT_B, keywords=("요약",), patterns=(r"정리\s*해",)),
+]
+
+
+def test_single_intent_match_is_case_insensitive():
+    matcher = IntentRuleMatcher(_RULES)
+
+    assert matcher.match("IFLOW 최신 글 알려줘") == Intent.INTENT_A
+    assert matcher.match("회의록 정리 해줘") == Intent.INTENT_B
+
+
+def test_conflicting_rules_fall_back_to_llm():
+    matcher = IntentRuleMatcher(_RULES)
+
+    assert matcher.match("iflow 블로그 글 요약해줘") is None
+    assert matcher.snapshot() == {"hits": 0, "misses": 1, "hit_rate": 0.0, "conflicts": 1}
+
+
+def test_empty_rule_table_never_matches():
+    matcher = IntentRuleMatcher([])
+
+    assert matcher.match("아무 질문") is None
+    assert matcher.candidates("아무 질문") == set()
+
+
+def test_classifier_skips_llm_on_rule_hit(base_state):
+    state = {**base_state, "messages": [HumanMessage(content="iflow 글 추천해줘")]}
+    with (
+        patch("node.intent_rule_matcher.INTENT_RULES", _RULES),
+        patch(
+            "node.intent_classifier.get_settings",
+            return_value=Settings(intent_rule_fast_path_enabled=True),
+        ),
+        patch("core.llm.get_llm") as mock_get_llm,
+    ):
+        result = IntentClassifierNode().run(state)
+
+    assert result["intent"] == Intent.INTENT_A.value
+    assert result["error"] is None
+    mock_get_llm.assert_not_called()
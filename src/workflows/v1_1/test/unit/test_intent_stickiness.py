@@ -0,0 +1,77 @@
+"""node/intent_stickiness.py 유닛 테스트 — 후속 발화 판정, TTL/LRU 한도, 노드의 세션 intent 재사용 검증."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import HumanMessage
+
+from config.intents import Intent
+from config.settings import Settings
+from node.intent_classifier import IntentClassifierNode
+from node.intent_stickiness import SessionIntentStore
+
+_NEW_TOPIC = "지난달 주문한 상품의 배송 현황을 조회하고 싶습니다"
+
+
+def test_follow_up_detection_by_marker_and_similarity():
+    store = SessionIntentStore(similarity_threshold=0.9)
+    store.remember("s1", Intent.INTENT_A, 0.8, vector=[1.0, 0.0])
+
+    assert store.reuse("s1", "더 알려줘").reason == "marker"
+    assert store.reuse("s1", "그거 자세히 설명해 주실 수 있나요").reason == "marker"
+    assert store.reuse("s1", "Can you tell me more about the fee").reason == "marker"
+    # 짧다는 이유만으로, 또는 단어 일부/넓은 접속사로는 재사용하지 않는다.
+    assert store.reuse("s1", "환불") is None
+    assert store.reuse("s1", "그리고 배송지 변경") is None
+    assert store.reuse("s1", "Please edit it again") is None
+    assert store.reuse("s1", _NEW_TOPIC, vector=[0.99, 0.1]).reason == "similarity"
+    assert store.reuse("s1", _NEW_TOPIC, vector=[0.0, 1.0]) is None
+
+    sticky = store.reuse("s1", "더 알려줘")
+    assert (sticky.intent, sticky.confidence) == (Intent.INTENT_A, 0.8)
+    assert store.reuse("other-session", "더 알려줘") is None
+
+
+def test_sessions_are_bounded_by_ttl_lru_and_unknown_resets():
+    store = SessionIntentStore(ttl_seconds=60.0, max_sessions=2)
+    store.remember("s1", Intent.INTENT_A)
+    store.remember("s2", Intent.INTENT_B)
+    store.remember("s3", Intent.INTENT_A)
+
+    assert len(store) == 2
+    assert store.reuse("s1", "자세히") is None
+
+    store.remember("s2", Intent.UNKNOWN)
+    assert store.reuse("s2", "자세히") is None
+
+    with patch("node.intent_stickiness.time.monotonic", return_value=10**9):
+        assert store.reuse("s3", "자세히") is None
+    assert len(store) == 0
+
+
+def test_classifier_reuses_session_intent_for_follow_up(base_state):
+    llm = FakeListChatModel(responses=["INTENT_B", "INTENT_A"])
+    settings = Settings(intent_sticky_enabled=True)
+
+    def _turn(session_id: str, text: str) -> dict:
+        state = {
+            **base_state,
+            "messages": [HumanMessage(content=text)],
+            "metadata": {"session_id": session_id},
+        }
+        return node.run(state)
+
+    with (
+        patch("node.intent_classifier.get_settings", return_value=settings),
+        patch("node.intent_stickiness.get_settings", return_value=settings),
+        patch("core.llm.get_llm", return_value=llm),
+    ):
+        node = IntentClassifierNode()
+        assert _turn("s1", _NEW_TOPIC)["intent"] == Intent.INTENT_B.value
+        expires_at = node._sessions._sessions["s1"].expires_at
+        assert _turn("s1", "좀 더 자세히 설명해 주세요")["intent"] == Intent.INTENT_B.value
+        # 재사용한 턴은 TTL을 연장하지 않는다.
+        assert node._sessions._sessions["s1"].expires_at == expires_at
+        # 다른 세션의 후속 발화는 재사용할 기록이 없으므로 LLM으로 분류한다 (두 번째 응답 사용).
+        assert _turn("s2", "좀 더 자세히 설명해 주세요")["intent"] == Intent.INTENT_A.value
@@ -0,0 +1,78 @@
+"""core/llm_cache.py 및 call_llm 캐시 경로 유닛 테스트."""
+from __future__ import annotations
+
+import time
+from unittest.mock import patch
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from config.settings import Settings
+from core.llm import call_llm
+from core.llm_cache import InMemoryLLMCache, SQLiteLLMCache, make_cache_key
+
+_MESSAGES = [SystemMessage(content="system"), HumanMessage(content="질문")]
+
+
+def test_cache_key_ignores_message_ids_but_not_content():
+    a = make_cache_key("m", 0.0, "", [HumanMessage(content="x", id="1")])
+    b = make_cache_key("m", 0.0, "", [HumanMessage(content="x", id="2")])
+    c = make_cache_key("m", 0.0, "", [HumanMessage(content="y")])
+    d = make_cache_key("other", 0.0, "", [HumanMessage(content="x")])
+
+    assert a == b
+    assert a != c
+    assert a != d
+
+
+def test_in_memory_cache_evicts_lru_and_expires_ttl():
+    cache = InMemoryLLMCache(max_entries=2, ttl_seconds=0.05)
+    cache.update("a", AIMessage(content="A"))
+    cache.update("b", AIMessage(content="B"))
+    cache.lookup("a")
+    cache.update("c", AIMessage(content="C"))
+
+    assert cache.lookup("b") is None
+    assert cache.lookup("a").content == "A"
+    time.sleep(0.06)
+    assert cache.lookup("c") is None
+    assert cache.stats.snapshot()["hits"] == 2
+
+
+def test_sqlite_cache_persists_across_instances(tmp_path):
+    path = str(tmp_path / "llm_cache.sqlite3")
+    SQLiteLLMCache(path).update("k", AIMessage(content="저장된 응답"))
+
+    cached = SQLiteLLMCache(path).lookup("k")
+
+    assert isinstance(cached, AIMessage)
+    assert cached.content == "저장된 응답"
+
+
+def test_call_llm_serves_repeated_prompt_from_cache():
+    cache = InMemoryLLMCache()
+    with (
+        patch("core.llm.get_llm_cache", return_value=cache),
+        patch("core.llm.get_llm") as mock_get_llm,
+    ):
+        mock_get_llm.return_value.invoke.return_value = AIMessage(content="INTENT_A")
+        first = call_llm(_MESSAGES)
+        second = call_llm(_MESSAGES)
+
+    assert first.content == second.content == "INTENT_A"
+    assert mock_get_llm.return_value.invoke.call_count == 1
+    assert cache.stats.snapshot() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_call_llm_bypasses_cache_when_temperature_is_not_zero():
+    cache = InMemoryLLMCache()
+    with (
+        patch("core.llm.get_settings", return_value=Settings(openai_temperature=0.7)),
+        patch("core.llm.get_llm_cache", return_value=cache),
+        patch("core.llm.get_llm") as mock_get_llm,
+    ):
+        mock_get_llm.return_value.invoke.return_value = AIMessage(content="응답")
+        call_llm(_MESSAGES)
+        call_llm(_MESSAGES)
+
+    assert mock_get_llm.return_value.invoke.call_count == 2
+    assert cache.stats.snapshot()["misses"] == 0
@@ -0,0 +1,103 @@
+"""core/llm.py HTTP client/bind_tools/프로필 유닛 테스트 — settings 기반 연결 풀·timeout 구성, bound runnable 재사용, 프로필별 client 검증."""
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import patch
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.tools import tool
+
+from config.settings import Settings
+from core.llm import _client_options, call_llm, get_llm, request_timeout
+from node._executor import AgentExecutor
+
+_bind_calls: list[int] = []
+
+
+class _ToolFakeChatModel(GenericFakeChatModel):
+    def bind_tools(self, tools: list[Any], **kwargs: Any):
+        _bind_calls.append(len(tools))
+        return self
+
+
+@tool
+def lookup_order(order_id: str) -> str:
+    """주문을 조회한다."""
+    return order_id
+
+
+@tool
+def cancel_order(order_id: str) -> str:
+    """주문을 취소한다."""
+    return order_id
+
+
+def test_http_client_options_follow_settings():
+    settings = Settings(
+        openai_http_max_connections=300,
+        openai_http_max_keepalive_connections=200,
+        openai_http_keepalive_expiry_seconds=90.0,
+        openai_connect_timeout_seconds=2.0,
+        openai_read_timeout_seconds=30.0,
+    )
+    with (
+        patch("core.llm.get_settings", return_value=settings),
+        patch("core.llm._http2_enabled", return_value=True),
+    ):
+        options = _client_options()
+
+    assert options["http2"] is True
+    assert options["limits"].max_connections == 300
+    assert options["limits"].max_keepalive_connections == 200
+    assert options["limits"].keepalive_expiry == 90.0
+    assert options["timeout"].connect == 2.0
+    assert options["timeout"].read == 30.0
+
+    # sync 호출은 남은 deadline을 넘지 않도록 요청 timeout을 줄인다.
+    with patch("core.llm.get_settings", return_value=settings):
+        capped = request_timeout(5.0)
+    assert (capped.connect, capped.read) == (2.0, 5.0)
+
+
+def test_bind_tools_is_reused_per_tool_set():
+    _bind_calls.clear()
+    model = _ToolFakeChatModel(messages=iter([AIMessage(content=str(i)) for i in range(3)]))
+
+    with patch("core.llm.get_llm", return_value=model):
+        call_llm([HumanMessage(content="주문 조회 1")], tools=[lookup_order])
+        call_llm([HumanMessage(content="주문 조회 2")], tools=[lookup_order])
+        call_llm([HumanMessage(content="주문 취소")], tools=[lookup_order, cancel_order])
+
+    assert _bind_calls == [1, 2]
+
+
+def test_llm_registry_caches_one_client_per_profile():
+    settings = Settings(
+        openai_api_key="test",
+        openai_model_name="large-model",
+        llm_profiles={
+            "intent_classifier": {"model": "small-model", "max_tokens": 8},
+            "final_response": {"temperature": 0.0},
+        },
+    )
+    with patch("core.llm.get_settings", return_value=settings):
+        classifier = get_llm("intent_classifier")
+        assert get_llm("intent_classifier") is classifier
+        # 설정이 기본값과 같은 프로필은 기본 client를 공유한다.
+        assert get_llm("final_response") is get_llm()
+
+    assert (classifier.model_name, classifier.max_tokens) == ("small-model", 8)
+
+
+def test_agent_executor_calls_llm_with_its_profile(base_state):
+    executor = AgentExecutor(
+        system_prompt="{context}",
+        user_prompt_template="{user_input}",
+        llm_profile="agent_a",
+    )
+    with patch("core.llm.get_llm") as mock_get_llm:
+        mock_get_llm.return_value.invoke.return_value.content = "답변"
+        executor.execute(base_state)
+
+    mock_get_llm.assert_called_once_with("agent_a")
@@ -0,0 +1,96 @@
+"""rag/local_hybrid_retriever.py 유닛 테스트 — BM25/벡터 RRF 결합, float16 snapshot, 증분 reload 검증."""
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from core.exceptions import RAGRetrievalError
+from rag.base_retriever import Document
+from rag.local_hybrid_retriever import LocalHybridRetriever, tokenize, write_snapshot
+
+_DOCS = [
+    Document("환불 규정은 구매 후 7일 이내 신청할 수 있습니다", {"source": "refund"}),
+    Document("배송은 영업일 기준 2일이 소요됩니다", {"source": "shipping"}),
+    Document("회원 등급은 누적 구매 금액으로 결정됩니다", {"source": "membership"}),
+]
+_VECTORS = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+
+
+@pytest.fixture
+def embed_as():
+    """query 임베딩을 고정 벡터로 대체한다."""
+    service = MagicMock()
+    with patch("rag.local_hybrid_retriever.get_embedding_service", return_value=service):
+        yield lambda vector: setattr(service.embed, "return_value", vector)
+
+
+def _retriever(path, **kwargs) -> LocalHybridRetriever:
+    return LocalHybridRetriever(str(path), top_k=2, reload_interval_seconds=0.0, **kwargs)
+
+
+def test_hybrid_ranks_document_matching_both_signals_first(tmp_path, embed_as):
+    write_snapshot(tmp_path, _DOCS, _VECTORS)
+    embed_as([0.9, 0.1, 0.0])
+
+    results = _retriever(tmp_path).retrieve("환불 규정")
+
+    assert results[0].metadata["source"] == "refund"
+    assert len(results) == 2
+    assert results[0].metadata["score"] > results[1].metadata["score"]
+
+
+def test_bm25_recovers_lexical_match_missed_by_vector(tmp_path, embed_as):
+    write_snapshot(tmp_path, _DOCS, _VECTORS)
+    embed_as([0.0, 1.0, 0.0])
+
+    sources = [doc.metadata["source"] for doc in _retriever(tmp_path).retrieve("회원 등급")]
+
+    assert sources == ["membership", "shipping"]
+
+
+def test_float16_snapshot_is_memory_mapped(tmp_path, embed_as):
+    write_snapshot(tmp_path, _DOCS, _VECTORS, dtype="float16")
+    embed_as([0.0, 0.0, 1.0])
+    retriever = _retriever(tmp_path)
+
+    assert retriever.retrieve("등급")[0].metadata["source"] == "membership"
+    assert isinstance(retriever._index.matrix, np.memmap)
+    assert retriever._index.matrix.dtype == np.float16
+
+
+def test_appended_snapshot_is_indexed_incrementally(tmp_path, embed_as):
+    write_snapshot(tmp_path, _DOCS, _VECTORS)
+    embed_as([0.0, 0.0, 1.0])
+    retriever = _retriever(tmp_path)
+    retriever.retrieve("등급")
+    first_index = retriever._index
+
+    write_snapshot(
+        tmp_path, [Document("포인트 적립 안내", {"source": "points"})], [[0.0, 0.0, 1.0]], append=True
+    )
+    results = retriever.retrieve("포인트 적립")
+
+    assert results[0].metadata["source"] == "points"
+    # 증분 reload는 기존 문서 객체를 그대로 재사용한다 (전체 재색인 없음).
+    assert retriever._index.documents[0] is first_index.documents[0]
+    assert "포인트" in retriever._index.postings
+    assert "포인트" not in first_index.postings
+
+
+def test_missing_snapshot_raises_rag_error(tmp_path, embed_as):
+    with pytest.raises(RAGRetrievalError, match="snapshot"):
+        _retriever(tmp_path / "missing").retrieve("질문")
+
+
+def test_dimension_mismatch_raises_rag_error(tmp_path, embed_as):
+    write_snapshot(tmp_path, _DOCS, _VECTORS)
+    embed_as([1.0, 0.0])
+
+    with pytest.raises(RAGRetrievalError, match="차원"):
+        _retriever(tmp_path).retrieve("환불")
+
+
+def test_tokenize_adds_hangul_bigrams():
+    assert {"환불", "규정은", "규정", "정은"} <= set(tokenize("환불 규정은"))
@@ -0,0 +1,63 @@
+"""core/log_pipeline.py 유닛 테스트 — 샘플링·rate limit, 필드 해시/자르기, background writer batch 기록 검증."""
+from __future__ import annotations
+
+import io
+import json
+import random
+
+import pytest
+import structlog
+
+from core.log_pipeline import BackgroundLogWriter, EventSampler, FieldLimiter, QueueLogger
+
+
+def test_sampler_drops_by_rate_but_keeps_warnings():
+    sampler = EventSampler(sample_rates={"node_enter": 0.0}, rng=random.Random(0))
+
+    with pytest.raises(structlog.DropEvent):
+        sampler(None, "info", {"event": "node_enter"})
+
+    assert sampler(None, "warning", {"event": "node_enter"}) == {"event": "node_enter"}
+    assert sampler(None, "info", {"event": "other"}) == {"event": "other"}
+
+
+def test_sampler_rate_limit_reports_suppressed_count(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("core.log_pipeline.time.monotonic", lambda: now[0])
+    sampler = EventSampler(rate_limits={"retrieval_start": 2})
+
+    kept = 0
+    for _ in range(5):
+        try:
+            sampler(None, "info", {"event": "retrieval_start"})
+            kept += 1
+        except structlog.DropEvent:
+            pass
+    now[0] += 1.0
+    event = sampler(None, "info", {"event": "retrieval_start"})
+
+    assert kept == 2
+    assert event["suppressed"] == 3
+
+
+def test_field_limiter_hashes_and_truncates():
+    limiter = FieldLimiter(max_chars=10, hash_fields=("args",))
+
+    event = limiter(None, "info", {"event": "e", "args": {"query": "비밀"}, "answer": "가" * 15})
+
+    assert event["args"].startswith("sha256:") and "비밀" not in event["args"]
+    assert event["answer"] == "가" * 10 + "…(+5)"
+
+
+def test_background_writer_renders_json_lines():
+    stream = io.StringIO()
+    writer = BackgroundLogWriter(stream, batch_size=4)
+    logger = QueueLogger(writer)
+
+    for i in range(10):
+        logger.info(event="tick", i=i)
+    writer.flush()
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line["i"] for line in lines] == list(range(10))
+    assert writer.dropped == 0
@@ -0,0 +1,105 @@
+"""core/metrics.py 유닛 테스트 — histogram/counter 렌더링, 노드·LLM·캐시 계측, HTTP/textfile 노출 검증."""
+from __future__ import annotations
+
+import urllib.request
+from unittest.mock import patch
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+
+from config.settings import Settings
+from core.llm import call_llm
+from core.logging import log_node_execution
+from core.metrics import (
+    LLM_TOKENS,
+    NODE_SECONDS,
+    MetricsRegistry,
+    get_registry,
+    start_http_server,
+    write_textfile,
+)
+from core.stats import HitMissCounter
+
+
+def test_histogram_renders_cumulative_buckets_in_prometheus_format():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("demo_seconds", "demo", ("node",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 3.0):
+        histogram.observe(value, node="a")
+
+    text = registry.render()
+
+    assert "# TYPE demo_seconds histogram" in text
+    assert 'demo_seconds_bucket{node="a",le="0.1"} 1' in text
+    assert 'demo_seconds_bucket{node="a",le="1"} 3' in text
+    assert 'demo_seconds_bucket{node="a",le="+Inf"} 4' in text
+    assert 'demo_seconds_count{node="a"} 4' in text
+    assert 'demo_seconds_sum{node="a"} 4.05' in text
+
+
+def test_counter_rejects_mismatched_labels():
+    counter = MetricsRegistry().counter("demo_total", "demo", ("kind",))
+
+    counter.inc(kind='a"b')
+
+    with pytest.raises(ValueError):
+        counter.inc(other="x")
+    assert 'demo_total{kind="a\\"b"} 1' in "\n".join(counter.render())
+
+
+def test_node_decorator_records_duration_per_node_and_intent(base_state):
+    @log_node_execution
+    def metrics_probe_node(state):
+        return state
+
+    before = NODE_SECONDS.count(node="metrics_probe_node", intent="INTENT_A", status="ok")
+    metrics_probe_node({**base_state, "intent": "INTENT_A"})
+
+    assert NODE_SECONDS.count(node="metrics_probe_node", intent="INTENT_A", status="ok") == before + 1
+
+
+def test_llm_call_records_token_usage():
+    response = AIMessage(
+        content="답변",
+        usage_metadata={"input_tokens": 12, "output_tokens": 5, "total_tokens": 17},
+    )
+    settings = Settings(openai_model_name="metrics-test-model")
+    with (
+        patch("core.llm.get_llm", return_value=GenericFakeChatModel(messages=iter([response]))),
+        patch("core.llm.get_settings", return_value=settings),
+    ):
+        call_llm([HumanMessage(content="질문")])
+
+    assert LLM_TOKENS.value(model="metrics-test-model", type="prompt") == 12
+    assert LLM_TOKENS.value(model="metrics-test-model", type="completion") == 5
+
+
+def test_cache_hit_ratio_aggregates_live_counters():
+    counter = HitMissCounter("metrics_test_cache")
+    counter.hit()
+    counter.hit()
+    counter.miss()
+
+    text = get_registry().render()
+
+    assert 'cache_requests_total{cache="metrics_test_cache",result="hit"} 2' in text
+    assert 'cache_hit_ratio{cache="metrics_test_cache"} 0.6666666666666666' in text
+
+
+def test_http_endpoint_and_textfile_dump(tmp_path):
+    registry = MetricsRegistry()
+    registry.counter("demo_total", "demo").inc()
+    server = start_http_server(0, registry=registry)
+    try:
+        port = server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            body = response.read().decode("utf-8")
+    finally:
+        server.shutdown()
+
+    path = tmp_path / "metrics" / "workflow.prom"
+    write_textfile(str(path), registry)
+
+    assert "demo_total 1" in body
+    assert path.read_text(encoding="utf-8") == registry.render()
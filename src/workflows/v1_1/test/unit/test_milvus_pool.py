@@ -0,0 +1,141 @@
+"""rag/milvus_pool.py 유닛 테스트 — 연결 재사용, 최대 크기, health check, idle eviction, warm-up 검증."""
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pymilvus import MilvusClient
+from pymilvus.client.connection_manager import RegularStrategy
+
+from core.exceptions import RAGRetrievalError
+from rag.milvus_pool import MilvusConnectionPool
+
+
+class _Factory:
+    def __init__(self) -> None:
+        self.clients: list[MagicMock] = []
+
+    def __call__(self, uri: str) -> MagicMock:
+        client = MagicMock(name=f"client{len(self.clients)}")
+        self.clients.append(client)
+        return client
+
+
+def test_connections_are_reused_across_requests():
+    factory = _Factory()
+    pool = MilvusConnectionPool("http://milvus", client_factory=factory)
+
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+
+    assert first is second
+    assert len(factory.clients) == 1
+    assert pool.snapshot()["reused"] == 1
+
+
+def test_max_size_blocks_then_times_out():
+    pool = MilvusConnectionPool(
+        "http://milvus", max_size=1, acquire_timeout_seconds=0.05, client_factory=_Factory()
+    )
+
+    with pool.connection():
+        with pytest.raises(RAGRetrievalError):
+            with pool.connection():
+                pass
+
+
+def test_waiter_receives_released_connection():
+    factory = _Factory()
+    pool = MilvusConnectionPool("http://milvus", max_size=1, client_factory=factory)
+    acquired = threading.Event()
+
+    def hold():
+        with pool.connection():
+            acquired.set()
+            time.sleep(0.1)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    acquired.wait()
+    with pool.connection():
+        pass
+    holder.join()
+
+    assert len(factory.clients) == 1
+
+
+def test_unhealthy_connection_is_replaced():
+    factory = _Factory()
+    pool = MilvusConnectionPool(
+        "http://milvus", health_check_interval_seconds=0.0, client_factory=factory
+    )
+    with pool.connection() as first:
+        first.get_server_version.side_effect = ConnectionError("gone")
+
+    with pool.connection() as second:
+        pass
+
+    assert second is not first
+    first.close.assert_called_once()
+    assert pool.snapshot()["evicted"] == 1
+
+
+def test_idle_connections_are_evicted():
+    factory = _Factory()
+    pool = MilvusConnectionPool("http://milvus", idle_timeout_seconds=0.01, client_factory=factory)
+    with pool.connection() as first:
+        pass
+    time.sleep(0.05)
+
+    with pool.connection() as second:
+        pass
+
+    assert second is not first
+    first.close.assert_called_once()
+
+
+def test_warm_up_connects_eagerly():
+    factory = _Factory()
+    pool = MilvusConnectionPool("http://milvus", max_size=2, client_factory=factory)
+
+    assert pool.warm_up(3) == 2
+    with pool.connection():
+        pass
+    assert len(factory.clients) == 2
+
+
+def test_connect_failure_raises_rag_error_and_frees_slot():
+    def broken(uri):
+        raise ConnectionError("refused")
+
+    pool = MilvusConnectionPool("http://milvus", max_size=1, client_factory=broken)
+    for _ in range(2):
+        with pytest.raises(RAGRetrievalError, match="Milvus 연결 실패"):
+            with pool.connection():
+                pass
+    assert pool.snapshot()["size"] == 0
+
+
+def test_default_factory_opens_a_dedicated_channel_per_connection():
+    handlers: list[MagicMock] = []
+
+    def _handler(self, config):
+        handlers.append(MagicMock(name=f"handler{len(handlers)}"))
+        return handlers[-1]
+
+    pool = MilvusConnectionPool("http://milvus:19530", max_size=2)
+    with (
+        patch.object(RegularStrategy, "create_handler", _handler),
+        patch.object(MilvusClient, "get_server_type", return_value="milvus"),
+    ):
+        with pool.connection() as first, pool.connection() as second:
+            assert first._handler is not second._handler
+        pool.close()
+
+    assert len(handlers) == 2
+    for handler in handlers:
+        handler.close.assert_called_once()
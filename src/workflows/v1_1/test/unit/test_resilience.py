@@ -0,0 +1,141 @@
+"""core/resilience.py 유닛 테스트 — 재시도 대상 판별, deadline, hedge 승자 선택과 패자 취소 검증."""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from core.exceptions import LLMDeadlineExceeded
+from core.resilience import (
+    ResiliencePolicy,
+    aopen_stream,
+    arun_resilient,
+    latency_tracker,
+    run_resilient,
+)
+
+_FAST_RETRY = ResiliencePolicy(max_attempts=3, backoff_base_seconds=0.001, backoff_max_seconds=0.001)
+
+
+class _Status(Exception):
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+
+
+def test_retries_retryable_errors_but_not_others():
+    calls: list[int] = []
+
+    def _flaky(timeout: float | None) -> str:
+        calls.append(1)
+        if len(calls) < 3:
+            raise _Status(503)
+        return "ok"
+
+    assert run_resilient(_flaky, "test/retry", _FAST_RETRY) == "ok"
+    assert len(calls) == 3
+
+    calls.clear()
+
+    def _bad_request(timeout: float | None) -> str:
+        calls.append(1)
+        raise _Status(400)
+
+    with pytest.raises(_Status):
+        run_resilient(_bad_request, "test/no-retry", _FAST_RETRY)
+    assert len(calls) == 1
+
+
+def test_deadline_bounds_sync_and_async_calls():
+    policy = ResiliencePolicy(deadline_seconds=0.05)
+
+    seen: list[tuple[float | None, int]] = []
+
+    def _slow(timeout: float | None) -> None:
+        # 요청이 남은 deadline으로 잡힌 HTTP timeout에 걸린 상황
+        seen.append((timeout, threading.get_ident()))
+        time.sleep(timeout)
+        raise TimeoutError("read timeout")
+
+    with pytest.raises(LLMDeadlineExceeded):
+        run_resilient(_slow, "test/deadline", policy)
+    # hedging이 꺼져 있으면 작업 스레드 없이 호출 스레드에서 실행한다.
+    assert seen[0][0] <= 0.05
+    assert seen[0][1] == threading.get_ident()
+
+    async def _slow() -> None:
+        await asyncio.sleep(1)
+
+    started = time.perf_counter()
+    with pytest.raises(LLMDeadlineExceeded):
+        asyncio.run(arun_resilient(_slow, "test/deadline", policy))
+    assert time.perf_counter() - started < 0.5
+
+
+def test_hedge_returns_faster_duplicate_and_cancels_slow_request():
+    label = "test/hedge"
+    tracker = latency_tracker(label)
+    for _ in range(10):
+        tracker.observe(0.01)
+    policy = ResiliencePolicy(hedge=True, hedge_min_samples=10, hedge_budget_ratio=1.0)
+    delays = iter([1.0, 0.0])
+    cancelled: list[bool] = []
+
+    async def _call() -> float:
+        delay = next(delays)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return delay
+
+    started = time.perf_counter()
+    assert asyncio.run(arun_resilient(_call, label, policy)) == 0.0
+    assert time.perf_counter() - started < 0.5
+    assert cancelled == [True]
+    assert tracker.hedged == 1
+
+
+def test_sync_hedge_returns_faster_duplicate():
+    label = "test/hedge-sync"
+    tracker = latency_tracker(label)
+    for _ in range(10):
+        tracker.observe(0.01)
+    policy = ResiliencePolicy(
+        deadline_seconds=1.0, hedge=True, hedge_min_samples=10, hedge_budget_ratio=1.0
+    )
+    delays = iter([0.5, 0.0])
+    timeouts: list[float | None] = []
+
+    def _call(timeout: float | None) -> float:
+        timeouts.append(timeout)
+        delay = next(delays)
+        time.sleep(delay)
+        return delay
+
+    started = time.perf_counter()
+    assert run_resilient(_call, label, policy) == 0.0
+    assert time.perf_counter() - started < 0.3
+    assert tracker.hedged == 1
+    assert all(timeout is not None and timeout <= 1.0 for timeout in timeouts)
+
+
+def test_stream_retries_only_before_first_chunk():
+    attempts: list[int] = []
+
+    async def _stream():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ConnectionError("reset")
+        for token in ("a", "b"):
+            yield token
+
+    async def _collect() -> list[str]:
+        first, rest = await aopen_stream(_stream, "test/stream", _FAST_RETRY)
+        return [first] + [token async for token in rest]
+
+    assert asyncio.run(_collect()) == ["a", "b"]
+    assert len(attempts) == 2
@@ -0,0 +1,75 @@
+"""core/semantic_cache.py 및 intent semantic 캐시 경로 유닛 테스트."""
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+from langchain_core.messages import HumanMessage
+
+from config.intents import Intent
+from config.settings import Settings
+from core.semantic_cache import SemanticCache
+from node.intent_classifier import IntentClassifierNode
+
+
+def test_lookup_respects_threshold():
+    cache: SemanticCache[str] = SemanticCache(threshold=0.9)
+    cache.insert([1.0, 0.0, 0.0], "x")
+
+    assert cache.lookup([0.99, 0.05, 0.0])[0] == "x"
+    assert cache.lookup([0.0, 1.0, 0.0]) is None
+    assert cache.stats.snapshot()["hits"] == 1
+
+
+def test_ring_buffer_overwrites_oldest_entry():
+    cache: SemanticCache[str] = SemanticCache(threshold=0.99, max_entries=2)
+    cache.insert([1.0, 0.0], "a")
+    cache.insert([0.0, 1.0], "b")
+    cache.insert([-1.0, 0.0], "c")
+
+    assert len(cache) == 2
+    assert cache.lookup([1.0, 0.0]) is None
+    assert cache.lookup([-1.0, 0.0])[0] == "c"
+
+
+def test_classifier_reuses_cached_intent_for_paraphrase(base_state):
+    """유사한 발화가 다시 들어오면 LLM 호출 없이 캐시된 intent를 반환한다."""
+    vectors = {"환불 규정 알려줘": [1.0, 0.0], "환불 규정이 궁금해요": [0.98, 0.1]}
+    embeddings = MagicMock()
+    embeddings.embed.side_effect = lambda text: vectors[text]
+
+    with (
+        patch(
+            "node.intent_classifier.get_settings",
+            return_value=Settings(intent_semantic_cache_enabled=True),
+        ),
+        patch("node.intent_classifier.get_embedding_service", return_value=embeddings),
+        patch("core.llm.get_llm") as mock_get_llm,
+    ):
+        mock_get_llm.return_value.invoke.return_value = MagicMock(content="INTENT_B")
+        node = IntentClassifierNode()
+        first = node.run({**base_state, "messages": [HumanMessage(content="환불 규정 알려줘")]})
+        second = node.run({**base_state, "messages": [HumanMessage(content="환불 규정이 궁금해요")]})
+
+    assert first["intent"] == second["intent"] == Intent.INTENT_B.value
+    assert second["error"] is None
+    assert mock_get_llm.return_value.invoke.call_count == 1
+
+
+def test_classifier_does_not_cache_fallback_unknown(base_state):
+    embeddings = MagicMock()
+    embeddings.embed.return_value = [1.0, 0.0]
+
+    with (
+        patch(
+            "node.intent_classifier.get_settings",
+            return_value=Settings(intent_semantic_cache_enabled=True),
+        ),
+        patch("node.intent_classifier.get_embedding_service", return_value=embeddings),
+        patch("core.llm.get_llm") as mock_get_llm,
+    ):
+        mock_get_llm.return_value.invoke.return_value = MagicMock(content="잘 모르겠습니다")
+        node = IntentClassifierNode()
+        node.run(base_state)
+        node.run(base_state)
+
+    assert mock_get_llm.return_value.invoke.call_count == 2
@@ -0,0 +1,143 @@
+"""speculation.py 유닛 테스트 — 분류와 prefetch의 병렬 실행, commit/cancel 동작 검증."""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from structlog.testing import capture_logs
+
+from config.intents import Intent
+from config.settings import Settings
+from node._executor import PrefetchedInputs, extract_user_input
+from node.speculation import aclaim_prefetch, claim_prefetch, speculative
+
+
+class _FakeAgent:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def prefetch(self, state, cancelled=None) -> PrefetchedInputs:
+        self.calls += 1
+        time.sleep(0.2)
+        return PrefetchedInputs(extract_user_input(state), ["prefetched"], [])
+
+    async def aprefetch(self, state) -> PrefetchedInputs:
+        self.calls += 1
+        await asyncio.sleep(0.2)
+        return PrefetchedInputs(extract_user_input(state), ["prefetched"], [])
+
+
+class _TwoPhaseAgent:
+    """분류보다 오래 걸리는 첫 단계 뒤에 취소 신호를 확인하는 prefetch."""
+
+    def __init__(self) -> None:
+        self.cancelled: threading.Event | None = None
+        self.second_phase_ran = False
+        self.finished = threading.Event()
+
+    def prefetch(self, state, cancelled=None) -> PrefetchedInputs:
+        self.cancelled = cancelled
+        try:
+            time.sleep(0.3)
+            if not cancelled.is_set():
+                self.second_phase_ran = True
+            return PrefetchedInputs(extract_user_input(state), [], [])
+        finally:
+            self.finished.set()
+
+
+def _classifier(intent: Intent):
+    def classify(state):
+        time.sleep(0.2)
+        return {**state, "intent": intent.value}
+
+    async def aclassify(state):
+        await asyncio.sleep(0.2)
+        return {**state, "intent": intent.value}
+
+    return classify, aclassify
+
+
+@pytest.fixture
+def speculation_settings():
+    with patch(
+        "node.speculation.get_settings",
+        return_value=Settings(speculative_execution_enabled=True),
+    ):
+        yield
+
+
+def test_prefetch_overlaps_classification_and_is_claimed(base_state, speculation_settings):
+    """직전 intent가 prior를 넘으면 분류와 prefetch가 동시에 진행되고 승자가 결과를 가져간다."""
+    agent = _FakeAgent()
+    classify, aclassify = speculative(
+        *_classifier(Intent.INTENT_A), {Intent.INTENT_A.value: lambda: agent}
+    )
+    state = {**base_state, "intent": Intent.INTENT_A.value}
+
+    start = time.perf_counter()
+    result = classify(state)
+    prefetched = claim_prefetch(result)
+
+    assert time.perf_counter() - start < 0.35
+    assert prefetched.context_items == ["prefetched"]
+    assert "speculation_id" in result["metadata"]
+
+
+def test_losing_speculation_is_discarded(base_state, speculation_settings):
+    agent = _FakeAgent()
+    classify, _ = speculative(
+        *_classifier(Intent.INTENT_B), {Intent.INTENT_A.value: lambda: agent}
+    )
+    result = classify({**base_state, "intent": Intent.INTENT_A.value})
+
+    assert "speculation_id" not in result["metadata"]
+    assert claim_prefetch(result) is None
+
+
+def test_losing_sync_prefetch_is_signalled_and_skips_remaining_phases(
+    base_state, speculation_settings
+):
+    """실행 중인 thread는 Future.cancel()로 멈출 수 없으므로 취소 신호로 남은 단계를 건너뛴다."""
+    agent = _TwoPhaseAgent()
+    classify, _ = speculative(
+        *_classifier(Intent.INTENT_B), {Intent.INTENT_A.value: lambda: agent}
+    )
+    with capture_logs() as logs:
+        classify({**base_state, "intent": Intent.INTENT_A.value})
+
+    assert agent.finished.wait(1.0)
+    assert agent.cancelled.is_set()
+    assert not agent.second_phase_ran
+    assert any(log["event"] == "speculation_cancel_failed" for log in logs)
+
+
+def test_no_speculation_below_prior_threshold(base_state, speculation_settings):
+    """prior 신호가 없으면 prefetch를 시작하지 않는다 (비용 상한)."""
+    agent = _FakeAgent()
+    classify, _ = speculative(
+        *_classifier(Intent.INTENT_A), {Intent.INTENT_A.value: lambda: agent}
+    )
+    classify(base_state)
+
+    assert agent.calls == 0
+
+
+def test_async_speculation_claims_prefetch(base_state, speculation_settings):
+    agent = _FakeAgent()
+    _, aclassify = speculative(
+        *_classifier(Intent.INTENT_A), {Intent.INTENT_A.value: lambda: agent}
+    )
+
+    async def _run():
+        result = await aclassify({**base_state, "intent": Intent.INTENT_A.value})
+        return await aclaim_prefetch(result)
+
+    start = time.perf_counter()
+    prefetched = asyncio.run(_run())
+
+    assert time.perf_counter() - start < 0.35
+    assert prefetched.context_items == ["prefetched"]
@@ -0,0 +1,125 @@
+"""core/tracing.py 유닛 테스트 — span 계층, 그래프 root span, OTLP 파일/HTTP export, tracing 꺼짐 검증."""
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+from unittest.mock import patch
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from core.tracing import (
+    NOOP_SPAN,
+    InMemorySpanExporter,
+    OTLPFileExporter,
+    OTLPHTTPExporter,
+    Tracer,
+    start_collector,
+    start_span,
+)
+from rag.base_retriever import Document
+from rag.iflow_retriever import IflowRetriever
+from rag.xxx_retriever import XxxRetriever
+
+
+def _tracer() -> tuple[Tracer, InMemorySpanExporter]:
+    exporter = InMemorySpanExporter()
+    return Tracer(exporter), exporter
+
+
+def test_disabled_tracing_returns_shared_noop_span():
+    with start_span("anything", {"k": 1}) as span:
+        span.set_attribute("ignored", True)
+
+    assert span is NOOP_SPAN
+
+
+def test_child_spans_export_with_root_and_record_errors():
+    tracer, exporter = _tracer()
+    with patch("core.tracing.get_tracer", return_value=tracer):
+        with start_span("root"):
+            with start_span("child", {"n": 1}) as child:
+                child.set_attribute("docs", 3)
+            assert exporter.spans == []  # root가 끝나기 전에는 내보내지 않는다
+            with pytest.raises(ValueError), start_span("failing"):
+                raise ValueError("boom")
+
+    child, failing, root = exporter.spans
+    assert root.parent_span_id is None
+    assert child.parent_span_id == failing.parent_span_id == root.span_id
+    assert {child.trace_id, failing.trace_id} == {root.trace_id}
+    assert child.attributes == {"n": 1, "docs": 3}
+    assert failing.status_code == 2 and failing.events[0][1] == "exception"
+
+
+def test_unsampled_trace_records_nothing():
+    exporter = InMemorySpanExporter()
+    tracer = Tracer(exporter, sample_ratio=0.0, rng=random.Random(0))
+    with patch("core.tracing.get_tracer", return_value=tracer):
+        with start_span("root"), start_span("child") as child:
+            pass
+
+    assert child is NOOP_SPAN
+    assert exporter.spans == []
+
+
+def test_graph_ainvoke_produces_one_trace_with_node_retriever_tool_and_llm_spans(base_state):
+    tracer, exporter = _tracer()
+    fake_llm = FakeListChatModel(responses=["INTENT_A", "에이전트 답변", "최종 응답"])
+    docs = [Document(page_content="문서", metadata={"score": 0.9})]
+
+    async def _aretrieve(self, query):
+        return docs
+
+    with (
+        patch("core.tracing.get_tracer", return_value=tracer),
+        patch("core.llm.get_llm", return_value=fake_llm),
+        patch.object(IflowRetriever, "aretrieve", _aretrieve),
+        patch.object(XxxRetriever, "aretrieve", _aretrieve),
+    ):
+        from workflow import build_graph
+
+        asyncio.run(build_graph().ainvoke(base_state))
+
+    spans = {span.name: span for span in exporter.spans}
+    root = spans["workflow.invoke"]
+    assert {span.trace_id for span in exporter.spans} == {root.trace_id}
+    assert root.attributes["session.id"] == "test-session"
+    assert spans["node aagent_a_node"].parent_span_id == root.span_id
+    agent_span_id = spans["node aagent_a_node"].span_id
+    assert spans["retriever IflowRetriever"].parent_span_id == agent_span_id
+    assert spans["retriever IflowRetriever"].attributes["retrieval.documents"] == 1
+    assert spans["tool search"].parent_span_id == agent_span_id
+    llm_spans = [span for span in exporter.spans if span.name.startswith("chat ")]
+    assert len(llm_spans) == 3
+    assert all("llm.cache" in span.attributes for span in llm_spans)
+
+
+def test_file_and_http_exporters_write_otlp_json(tmp_path):
+    received: list[dict] = []
+    server = start_collector(0, received.append)
+    try:
+        port = server.server_address[1]
+        exporters = [
+            OTLPFileExporter(str(tmp_path / "traces.jsonl"), "svc"),
+            OTLPHTTPExporter(f"http://127.0.0.1:{port}/v1/traces", "svc"),
+        ]
+        for exporter in exporters:
+            with patch("core.tracing.get_tracer", return_value=Tracer(exporter)):
+                with start_span("root"), start_span("child", {"tokens": 7, "hit": True}):
+                    pass
+            exporter.flush()
+    finally:
+        server.shutdown()
+
+    from_file = json.loads((tmp_path / "traces.jsonl").read_text(encoding="utf-8"))
+    for payload in (from_file, received[0]):
+        resource = payload["resourceSpans"][0]
+        assert resource["resource"]["attributes"][0]["value"] == {"stringValue": "svc"}
+        child, root = resource["scopeSpans"][0]["spans"]
+        assert child["parentSpanId"] == root["spanId"]
+        assert child["attributes"] == [
+            {"key": "tokens", "value": {"intValue": "7"}},
+            {"key": "hit", "value": {"boolValue": True}},
+        ]
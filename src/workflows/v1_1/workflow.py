@@ -1,25 +1,69 @@
 # GAIA 플랫폼 고정 진입점 — StateGraph 정의, 노드/엣지 등록, compile
 from __future__ import annotations
 
+from typing import Any, Awaitable, Callable
+
+from langchain_core.runnables import RunnableLambda
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import END, START, StateGraph
 
-from node.default_response import default_response
-from node.domain.domain_node_a import agent_a_node
-from node.domain.domain_node_b import agent_b_node
-from node.final_response import generate_final_response
-from node.intent_classifier import classify_intent
+from config.intents import Intent
+from config.settings import get_settings
+from core.checkpoint import get_checkpointer
+from core.metrics import start_exporters
+from core.tracing import instrument_graph
+
+from node.default_response import adefault_response, default_response
+from node.domain.domain_node_a import _get_agent as _get_agent_a
+from node.domain.domain_node_a import aagent_a_node, agent_a_node
+from node.domain.domain_node_b import _get_agent as _get_agent_b
+from node.domain.domain_node_b import aagent_b_node, agent_b_node
+from node.final_response import agenerate_final_response, generate_final_response
+from node.intent_classifier import aclassify_intent, classify_intent
 from node.router import route_by_intent
+from node.speculation import speculative
+from rag.milvus_pool import warm_up_milvus_pools
 from state import GraphState
 
 
-def build_graph() -> StateGraph:
+def _node(
+    func: Callable[[GraphState], Any],
+    afunc: Callable[[GraphState], Awaitable[Any]],
+) -> RunnableLambda:
+    """sync/async 구현을 하나의 노드로 묶는다.
+
+    graph.invoke는 func를, graph.ainvoke/astream은 afunc를 호출하므로
+    async 경로에서는 이벤트 루프가 LLM 왕복 동안 막히지 않는다.
+    """
+    return RunnableLambda(func, afunc=afunc, name=func.__name__)
+
+
+# speculative 실행 대상 — intent 값 → Agent getter. 새 domain Agent 추가 시 함께 등록한다.
+SPECULATIVE_AGENTS = {
+    Intent.INTENT_A.value: _get_agent_a,
+    Intent.INTENT_B.value: _get_agent_b,
+}
+
+
+def build_graph(checkpointer: BaseCheckpointSaver | None = None) -> StateGraph:
+    """checkpointer를 지정하지 않으면 settings.checkpointer_backend에 맞는 checkpointer로 compile한다."""
+    settings = get_settings()
+    start_exporters()
+    if settings.milvus_pool_warmup_size > 0:
+        # 첫 사용자 요청이 Milvus 연결 handshake 비용을 내지 않도록 미리 연결한다.
+        warm_up_milvus_pools([settings.milvus_uri], settings.milvus_pool_warmup_size)
+
     sg = StateGraph(GraphState)
 
-    sg.add_node("intent_classifier", classify_intent)
-    sg.add_node("agent_a", agent_a_node)
-    sg.add_node("agent_b", agent_b_node)
-    sg.add_node("default_response", default_response)
-    sg.add_node("final_response", generate_final_response)
+    classifier = (classify_intent, aclassify_intent)
+    if settings.speculative_execution_enabled:
+        classifier = speculative(*classifier, SPECULATIVE_AGENTS)
+
+    sg.add_node("intent_classifier", _node(*classifier))
+    sg.add_node("agent_a", _node(agent_a_node, aagent_a_node))
+    sg.add_node("agent_b", _node(agent_b_node, aagent_b_node))
+    sg.add_node("default_response", _node(default_response, adefault_response))
+    sg.add_node("final_response", _node(generate_final_response, agenerate_final_response))
 
     sg.add_edge(START, "intent_classifier")
     sg.add_conditional_edges(
@@ -36,7 +80,10 @@ def build_graph() -> StateGraph:
     sg.add_edge("default_response", "final_response")
     sg.add_edge("final_response", END)
 
-    return sg.compile()
+    # tracing이 켜져 있으면 invoke/stream 1회마다 root span을 만든다 (꺼져 있으면 그대로 반환).
+    return instrument_graph(
+        sg.compile(checkpointer=checkpointer or get_checkpointer()), name="workflow"
+    )
 
 
 graph = build_graph()
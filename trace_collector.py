@@ -0,0 +1,94 @@
+# 로컬 OTLP/HTTP collector 대용 — 받은 trace를 span 트리로 출력하고 OTLP/JSON lines 파일로 저장한다
+#   python trace_collector.py --port 4318 --output traces.otlp.jsonl
+#   (다른 터미널) TRACING_EXPORTER=otlp_http python app.py --stream  (v1_1 워크플로우)
+# TRACING_EXPORTER=file로 만든 파일은 --replay로 같은 형식의 트리를 볼 수 있다.
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import threading
+from pathlib import Path
+from typing import Any
+
+_root = Path(__file__).parent
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="로컬 OTLP/HTTP trace collector")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4318)
+    parser.add_argument("--output", default=None, help="받은 요청을 OTLP/JSON lines로 저장할 경로")
+    parser.add_argument("--replay", default=None, help="OTLP/JSON lines 파일을 트리로 출력하고 종료")
+    return parser.parse_args()
+
+
+def _value(value: dict[str, Any]) -> Any:
+    return next(iter(value.values()), None)
+
+
+def format_trace(payload: dict[str, Any]) -> str:
+    """ExportTraceServiceRequest 하나를 trace별 span 트리(시작 offset, 소요 시간, 속성) 문자열로 만든다."""
+    spans = [
+        span
+        for resource in payload.get("resourceSpans", [])
+        for scope in resource.get("scopeSpans", [])
+        for span in scope.get("spans", [])
+    ]
+    children: dict[str | None, list[dict[str, Any]]] = {}
+    ids = {span["spanId"] for span in spans}
+    for span in spans:
+        parent = span.get("parentSpanId")
+        children.setdefault(parent if parent in ids else None, []).append(span)
+
+    lines: list[str] = []
+
+    def _walk(span: dict[str, Any], depth: int, origin: int) -> None:
+        start, end = int(span["startTimeUnixNano"]), int(span["endTimeUnixNano"])
+        attrs = " ".join(f"{a['key']}={_value(a['value'])}" for a in span.get("attributes", []))
+        error = " ERROR" if span.get("status", {}).get("code") == 2 else ""
+        lines.append(
+            f"{'  ' * depth}{span['name']:<{40 - 2 * depth}} "
+            f"+{(start - origin) / 1e6:8.2f}ms {(end - start) / 1e6:8.2f}ms{error}  {attrs}"
+        )
+        for child in sorted(children.get(span["spanId"], []), key=lambda s: int(s["startTimeUnixNano"])):
+            _walk(child, depth + 1, origin)
+
+    for root in sorted(children.get(None, []), key=lambda s: int(s["startTimeUnixNano"])):
+        lines.append(f"trace {root['traceId']}")
+        _walk(root, 1, int(root["startTimeUnixNano"]))
+    return "\n".join(lines)
+
+
+def main() -> None:
+    args = _parse_args()
+    if args.replay:
+        with open(args.replay, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    print(format_trace(json.loads(line)))
+        return
+
+    sys.path.insert(0, str(_root / "src" / "workflows" / "v1_1"))
+    from core.tracing import start_collector
+
+    lock = threading.Lock()
+    sink = open(args.output, "a", encoding="utf-8") if args.output else None
+
+    def _on_request(payload: dict[str, Any]) -> None:
+        with lock:
+            print(format_trace(payload), flush=True)
+            if sink is not None:
+                sink.write(json.dumps(payload, ensure_ascii=False) + "\n")
+                sink.flush()
+
+    server = start_collector(args.port, _on_request, host=args.host)
+    print(f"[collector] http://{args.host}:{server.server_address[1]}/v1/traces", file=sys.stderr)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()